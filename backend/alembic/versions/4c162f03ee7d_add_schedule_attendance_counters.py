@@ -0,0 +1,46 @@
+"""Add attendance counters to raid_schedules
+
+Revision ID: 4c162f03ee7d
+Revises: 99b2d340cd77
+Create Date: 2026-10-16 11:02:17.943120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c162f03ee7d'
+down_revision: Union[str, None] = '99b2d340cd77'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = {
+    'confirmed_count': 'confirmed',
+    'declined_count': 'declined',
+    'tentative_count': 'tentative',
+    'pending_count': 'pending',
+}
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('raid_schedules') as batch_op:
+        for column_name in COUNTER_COLUMNS:
+            batch_op.add_column(sa.Column(column_name, sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 참석 레코드로 인원 수 채우기
+    for column_name, attendance_status in COUNTER_COLUMNS.items():
+        op.execute(
+            f"UPDATE raid_schedules SET {column_name} = ("
+            f"SELECT COUNT(*) FROM raid_attendances "
+            f"WHERE raid_attendances.schedule_id = raid_schedules.id "
+            f"AND raid_attendances.status = '{attendance_status}')"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('raid_schedules') as batch_op:
+        for column_name in reversed(list(COUNTER_COLUMNS)):
+            batch_op.drop_column(column_name)
@@ -0,0 +1,53 @@
+"""Add composite indexes for hot filter paths
+
+Revision ID: 99b2d340cd77
+Revises: 44479a729e0c
+Create Date: 2026-10-16 10:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '99b2d340cd77'
+down_revision: Union[str, None] = '44479a729e0c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 고유 인덱스를 만들기 전에 중복 행 정리
+    # 같은 공대의 같은 사용자는 먼저 가입한 행만 유지
+    op.execute(
+        "DELETE FROM raid_members WHERE id NOT IN ("
+        "SELECT MIN(id) FROM raid_members GROUP BY raid_group_id, user_id)"
+    )
+    # 같은 일정의 같은 사용자는 마지막 참석 응답만 유지
+    op.execute(
+        "DELETE FROM raid_attendances WHERE id NOT IN ("
+        "SELECT MAX(id) FROM raid_attendances GROUP BY schedule_id, user_id)"
+    )
+    
+    # 공대원 권한 확인 (raid_group_id, user_id)
+    op.create_index('ix_raid_members_group_user', 'raid_members', ['raid_group_id', 'user_id'], unique=True)
+    # 일정별 참석 집계 / 내 참석 조회
+    op.create_index('ix_raid_attendances_schedule_user', 'raid_attendances', ['schedule_id', 'user_id'], unique=True)
+    op.create_index('ix_raid_attendances_schedule_status', 'raid_attendances', ['schedule_id', 'status'], unique=False)
+    # 공대 일정 목록 (날짜, 시간순 정렬)
+    op.create_index('ix_raid_schedules_group_date_time', 'raid_schedules', ['raid_group_id', 'scheduled_date', 'start_time'], unique=False)
+    # 분배 이력 목록 (최신순 정렬)
+    op.create_index('ix_distribution_histories_group_distributed_at', 'distribution_histories', ['raid_group_id', 'distributed_at'], unique=False)
+    # 출발/BIS 세트 조회
+    op.create_index('ix_equipment_sets_user_group', 'equipment_sets', ['user_id', 'raid_group_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_equipment_sets_user_group', table_name='equipment_sets')
+    op.drop_index('ix_distribution_histories_group_distributed_at', table_name='distribution_histories')
+    op.drop_index('ix_raid_schedules_group_date_time', table_name='raid_schedules')
+    op.drop_index('ix_raid_attendances_schedule_status', table_name='raid_attendances')
+    op.drop_index('ix_raid_attendances_schedule_user', table_name='raid_attendances')
+    op.drop_index('ix_raid_members_group_user', table_name='raid_members')
@@ -0,0 +1,45 @@
+"""Fix lowercase item_type and distribution_method values
+
+Revision ID: a1c4e7f29d53
+Revises: f7d2b8c40e15
+Create Date: 2026-10-17 05:41:18.552907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e7f29d53'
+down_revision: Union[str, None] = 'f7d2b8c40e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ITEM_TYPE_VALUES = (
+    'equipment_coffer', 'weapon_coffer', 'upgrade_item', 'tome_material',
+    'token', 'weapon_token', 'mount', 'other'
+)
+
+
+def upgrade() -> None:
+    # 스키마 Enum 값('token')을 그대로 저장한 행을 이름('TOKEN')으로 수정
+    # (PostgreSQL enum 타입은 값 형식을 받지 않으므로 이런 행은 SQLite에만 있음)
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    item_types = ", ".join(f"'{value}'" for value in ITEM_TYPE_VALUES)
+    for table in ('item_distributions', 'distribution_histories'):
+        op.execute(
+            f"UPDATE {table} SET item_type = UPPER(item_type) "
+            f"WHERE item_type IN ({item_types})"
+        )
+    op.execute(
+        "UPDATE raid_groups SET distribution_method = UPPER(distribution_method) "
+        "WHERE distribution_method IN ('priority', 'first_come')"
+    )
+
+
+def downgrade() -> None:
+    # 잘못 저장된 값을 되돌릴 필요 없음
+    pass
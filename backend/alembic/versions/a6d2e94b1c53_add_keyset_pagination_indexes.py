@@ -0,0 +1,32 @@
+"""Extend list indexes with id for keyset pagination
+
+Revision ID: a6d2e94b1c53
+Revises: f3a8c61d5e07
+Create Date: 2026-10-16 23:41:27.318540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d2e94b1c53'
+down_revision: Union[str, None] = 'f3a8c61d5e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_distribution_histories_group_distributed_at_id', 'distribution_histories', ['raid_group_id', 'distributed_at', 'id'], unique=False)
+    op.drop_index('ix_distribution_histories_group_distributed_at', table_name='distribution_histories')
+    op.create_index('ix_raid_schedules_group_date_time_id', 'raid_schedules', ['raid_group_id', 'scheduled_date', 'start_time', 'id'], unique=False)
+    op.drop_index('ix_raid_schedules_group_date_time', table_name='raid_schedules')
+
+
+def downgrade() -> None:
+    op.create_index('ix_raid_schedules_group_date_time', 'raid_schedules', ['raid_group_id', 'scheduled_date', 'start_time'], unique=False)
+    op.drop_index('ix_raid_schedules_group_date_time_id', table_name='raid_schedules')
+    op.create_index('ix_distribution_histories_group_distributed_at', 'distribution_histories', ['raid_group_id', 'distributed_at'], unique=False)
+    op.drop_index('ix_distribution_histories_group_distributed_at_id', table_name='distribution_histories')
@@ -0,0 +1,27 @@
+"""Add (raid_group_id, week_number, id) index on distribution_events
+
+Revision ID: b5e82d1f6a94
+Revises: a1c4e7f29d53
+Create Date: 2026-10-17 06:08:52.719344
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e82d1f6a94'
+down_revision: Union[str, None] = 'a1c4e7f29d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 주차별 상태 재구성 시 뒤늦게 기록된 이전 주차 이력 이벤트 조회용
+    op.create_index('ix_distribution_events_group_week', 'distribution_events', ['raid_group_id', 'week_number', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_distribution_events_group_week', table_name='distribution_events')
@@ -0,0 +1,50 @@
+"""Add occurrence_date to raid_schedules for lazy recurrence
+
+Revision ID: b7e1f04a92c3
+Revises: 4c162f03ee7d
+Create Date: 2026-10-16 12:20:45.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1f04a92c3'
+down_revision: Union[str, None] = '4c162f03ee7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 44479a729e0c 마이그레이션에 빠져 있던 반복 설정 컬럼
+RECURRENCE_COLUMNS = (
+    sa.Column('recurrence_type', sa.Enum('NONE', 'DAILY', 'WEEKLY', 'BIWEEKLY', 'MONTHLY', name='recurrencetype'), nullable=True),
+    sa.Column('recurrence_end_date', sa.Date(), nullable=True),
+    sa.Column('recurrence_count', sa.Integer(), nullable=True),
+    sa.Column('recurrence_days', sa.String(length=20), nullable=True),
+    sa.Column('parent_schedule_id', sa.Integer(), sa.ForeignKey('raid_schedules.id', name='fk_raid_schedules_parent_schedule_id'), nullable=True),
+)
+
+
+def upgrade() -> None:
+    existing = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('raid_schedules')}
+
+    with op.batch_alter_table('raid_schedules') as batch_op:
+        for column in RECURRENCE_COLUMNS:
+            if column.name not in existing:
+                batch_op.add_column(column.copy())
+        batch_op.add_column(sa.Column('occurrence_date', sa.Date(), nullable=True))
+
+    # 이미 저장된 반복 일정 발생분은 자신의 날짜가 발생일
+    op.execute(
+        "UPDATE raid_schedules SET occurrence_date = scheduled_date "
+        "WHERE parent_schedule_id IS NOT NULL"
+    )
+    op.create_index('ix_raid_schedules_parent_occurrence', 'raid_schedules', ['parent_schedule_id', 'occurrence_date'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_raid_schedules_parent_occurrence', table_name='raid_schedules')
+    with op.batch_alter_table('raid_schedules') as batch_op:
+        batch_op.drop_column('occurrence_date')
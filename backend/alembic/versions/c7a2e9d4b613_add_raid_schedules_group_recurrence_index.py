@@ -0,0 +1,27 @@
+"""Add (raid_group_id, recurrence_type) index on raid_schedules
+
+Revision ID: c7a2e9d4b613
+Revises: b5e82d1f6a94
+Create Date: 2026-10-17 09:41:27.183205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a2e9d4b613'
+down_revision: Union[str, None] = 'b5e82d1f6a94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 일정 목록 조회 시 공대의 반복 일정 원본만 찾는 용도
+    op.create_index('ix_raid_schedules_group_recurrence', 'raid_schedules', ['raid_group_id', 'recurrence_type'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_raid_schedules_group_recurrence', table_name='raid_schedules')
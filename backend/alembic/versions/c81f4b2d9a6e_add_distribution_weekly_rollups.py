@@ -0,0 +1,54 @@
+"""Add per-week loot rollup table
+
+Revision ID: c81f4b2d9a6e
+Revises: a6d2e94b1c53
+Create Date: 2026-10-17 00:26:51.472903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4b2d9a6e'
+down_revision: Union[str, None] = 'a6d2e94b1c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # itemtype 타입은 distribution_histories에서 이미 생성됨
+    item_type = postgresql.ENUM(
+        'EQUIPMENT_COFFER', 'WEAPON_COFFER', 'UPGRADE_ITEM', 'TOME_MATERIAL', 'TOKEN', 'WEAPON_TOKEN', 'MOUNT', 'OTHER',
+        name='itemtype', create_type=False
+    )
+    op.create_table(
+        'distribution_weekly_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('raid_group_id', sa.Integer(), nullable=False),
+        sa.Column('week_number', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('item_type', item_type, nullable=False),
+        sa.Column('item_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['raid_group_id'], ['raid_groups.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_distribution_weekly_rollups_id'), 'distribution_weekly_rollups', ['id'], unique=False)
+    op.create_index('ix_distribution_weekly_rollups_group_week_user_type', 'distribution_weekly_rollups', ['raid_group_id', 'week_number', 'user_id', 'item_type'], unique=True)
+
+    # 기존 분배 이력으로 집계 백필
+    op.execute(
+        "INSERT INTO distribution_weekly_rollups (raid_group_id, week_number, user_id, item_type, item_count) "
+        "SELECT raid_group_id, week_number, user_id, item_type, COUNT(id) FROM distribution_histories "
+        "GROUP BY raid_group_id, week_number, user_id, item_type"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_distribution_weekly_rollups_group_week_user_type', table_name='distribution_weekly_rollups')
+    op.drop_index(op.f('ix_distribution_weekly_rollups_id'), table_name='distribution_weekly_rollups')
+    op.drop_table('distribution_weekly_rollups')
@@ -0,0 +1,62 @@
+"""Add distribution event log and snapshots
+
+Revision ID: d4b7a2e91f38
+Revises: c81f4b2d9a6e
+Create Date: 2026-10-17 01:52:14.086327
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b7a2e91f38'
+down_revision: Union[str, None] = 'c81f4b2d9a6e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'distribution_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('raid_group_id', sa.Integer(), nullable=False),
+        sa.Column('event_type', sa.String(length=50), nullable=False),
+        sa.Column('week_number', sa.Integer(), nullable=True),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('created_by_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['raid_group_id'], ['raid_groups.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_distribution_events_id'), 'distribution_events', ['id'], unique=False)
+    op.create_index('ix_distribution_events_group_id', 'distribution_events', ['raid_group_id', 'id'], unique=False)
+
+    op.create_table(
+        'distribution_snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('raid_group_id', sa.Integer(), nullable=False),
+        sa.Column('last_event_id', sa.Integer(), nullable=False),
+        sa.Column('week_number', sa.Integer(), nullable=False),
+        sa.Column('state', sa.JSON(), nullable=False),
+        sa.Column('is_baseline', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['raid_group_id'], ['raid_groups.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_distribution_snapshots_id'), 'distribution_snapshots', ['id'], unique=False)
+    op.create_index('ix_distribution_snapshots_group_event', 'distribution_snapshots', ['raid_group_id', 'last_event_id'], unique=False)
+    op.create_index('ix_distribution_snapshots_group_week_event', 'distribution_snapshots', ['raid_group_id', 'week_number', 'last_event_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_distribution_snapshots_group_week_event', table_name='distribution_snapshots')
+    op.drop_index('ix_distribution_snapshots_group_event', table_name='distribution_snapshots')
+    op.drop_index(op.f('ix_distribution_snapshots_id'), table_name='distribution_snapshots')
+    op.drop_table('distribution_snapshots')
+    op.drop_index('ix_distribution_events_group_id', table_name='distribution_events')
+    op.drop_index(op.f('ix_distribution_events_id'), table_name='distribution_events')
+    op.drop_table('distribution_events')
@@ -0,0 +1,143 @@
+"""Move priority_order and completed_users into child tables
+
+Revision ID: e5a1c7d93b28
+Revises: b7e1f04a92c3
+Create Date: 2026-10-16 21:35:12.604117
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c7d93b28'
+down_revision: Union[str, None] = 'b7e1f04a92c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _user_ids(value) -> list:
+    # SQLite는 JSON을 문자열로 돌려줌 / 중복과 잘못된 값은 제외
+    if isinstance(value, str):
+        value = json.loads(value)
+    return [user_id for user_id in dict.fromkeys(value or []) if isinstance(user_id, int)]
+
+
+def upgrade() -> None:
+    priorities = op.create_table(
+        'item_distribution_priorities',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('distribution_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['distribution_id'], ['item_distributions.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_item_distribution_priorities_id'), 'item_distribution_priorities', ['id'], unique=False)
+    op.create_index('ix_item_distribution_priorities_rule_user', 'item_distribution_priorities', ['distribution_id', 'user_id'], unique=True)
+    op.create_index('ix_item_distribution_priorities_rule_position', 'item_distribution_priorities', ['distribution_id', 'position'], unique=False)
+
+    completions = op.create_table(
+        'item_distribution_completions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('distribution_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['distribution_id'], ['item_distributions.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_item_distribution_completions_id'), 'item_distribution_completions', ['id'], unique=False)
+    op.create_index('ix_item_distribution_completions_rule_user', 'item_distribution_completions', ['distribution_id', 'user_id'], unique=True)
+
+    # 기존 JSON 목록을 자식 테이블로 옮김 (삭제된 사용자는 제외)
+    bind = op.get_bind()
+    valid_user_ids = {row[0] for row in bind.execute(sa.text("SELECT id FROM users"))}
+    # 획득 시각은 해당 규칙의 첫 분배 이력 시각
+    histories = sa.table(
+        'distribution_histories',
+        sa.column('distribution_id', sa.Integer()),
+        sa.column('user_id', sa.Integer()),
+        sa.column('distributed_at', sa.DateTime())
+    )
+    completed_at = {
+        (row[0], row[1]): row[2]
+        for row in bind.execute(
+            sa.select(
+                histories.c.distribution_id,
+                histories.c.user_id,
+                sa.func.min(histories.c.distributed_at)
+            ).where(
+                histories.c.distribution_id.isnot(None)
+            ).group_by(histories.c.distribution_id, histories.c.user_id)
+        )
+    }
+
+    priority_rows = []
+    completion_rows = []
+    for rule_id, priority_order, completed_users in bind.execute(sa.text(
+        "SELECT id, priority_order, completed_users FROM item_distributions"
+    )):
+        priority_rows.extend(
+            {'distribution_id': rule_id, 'user_id': user_id, 'position': position}
+            for position, user_id in enumerate(
+                user_id for user_id in _user_ids(priority_order) if user_id in valid_user_ids
+            )
+        )
+        completion_rows.extend(
+            {'distribution_id': rule_id, 'user_id': user_id, 'completed_at': completed_at.get((rule_id, user_id))}
+            for user_id in _user_ids(completed_users) if user_id in valid_user_ids
+        )
+
+    if priority_rows:
+        op.bulk_insert(priorities, priority_rows)
+    if completion_rows:
+        op.bulk_insert(completions, completion_rows)
+
+    with op.batch_alter_table('item_distributions') as batch_op:
+        batch_op.drop_column('completed_users')
+        batch_op.drop_column('priority_order')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('item_distributions') as batch_op:
+        batch_op.add_column(sa.Column('priority_order', sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column('completed_users', sa.JSON(), nullable=True))
+
+    bind = op.get_bind()
+    orders = {}
+    for rule_id, user_id in bind.execute(sa.text(
+        "SELECT distribution_id, user_id FROM item_distribution_priorities ORDER BY distribution_id, position"
+    )):
+        orders.setdefault(rule_id, []).append(user_id)
+    completed = {}
+    for rule_id, user_id in bind.execute(sa.text(
+        "SELECT distribution_id, user_id FROM item_distribution_completions ORDER BY id"
+    )):
+        completed.setdefault(rule_id, []).append(user_id)
+
+    rules = sa.table(
+        'item_distributions',
+        sa.column('id', sa.Integer()),
+        sa.column('priority_order', sa.JSON()),
+        sa.column('completed_users', sa.JSON())
+    )
+    for (rule_id,) in bind.execute(sa.text("SELECT id FROM item_distributions")):
+        bind.execute(
+            rules.update().where(rules.c.id == rule_id).values(
+                priority_order=orders.get(rule_id, []),
+                completed_users=completed.get(rule_id, [])
+            )
+        )
+
+    op.drop_index('ix_item_distribution_completions_rule_user', table_name='item_distribution_completions')
+    op.drop_index(op.f('ix_item_distribution_completions_id'), table_name='item_distribution_completions')
+    op.drop_table('item_distribution_completions')
+    op.drop_index('ix_item_distribution_priorities_rule_position', table_name='item_distribution_priorities')
+    op.drop_index('ix_item_distribution_priorities_rule_user', table_name='item_distribution_priorities')
+    op.drop_index(op.f('ix_item_distribution_priorities_id'), table_name='item_distribution_priorities')
+    op.drop_table('item_distribution_priorities')
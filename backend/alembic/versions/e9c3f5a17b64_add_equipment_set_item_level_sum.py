@@ -0,0 +1,38 @@
+"""Add item level sum to equipment_sets
+
+Revision ID: e9c3f5a17b64
+Revises: d4b7a2e91f38
+Create Date: 2026-10-17 02:41:08.517264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9c3f5a17b64'
+down_revision: Union[str, None] = 'd4b7a2e91f38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('equipment_sets') as batch_op:
+        batch_op.add_column(sa.Column('item_level_sum', sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 세트 아이템으로 합계와 평균 아이템 레벨 채우기 (무기는 2개로 계산)
+    op.execute(
+        "UPDATE equipment_sets SET item_level_sum = ("
+        "SELECT COALESCE(SUM(CASE WHEN equipment.slot = 'WEAPON' THEN equipment.item_level * 2 "
+        "ELSE equipment.item_level END), 0) "
+        "FROM equipment_set_items JOIN equipment ON equipment.id = equipment_set_items.equipment_id "
+        "WHERE equipment_set_items.equipment_set_id = equipment_sets.id)"
+    )
+    op.execute("UPDATE equipment_sets SET total_item_level = item_level_sum / 11")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('equipment_sets') as batch_op:
+        batch_op.drop_column('item_level_sum')
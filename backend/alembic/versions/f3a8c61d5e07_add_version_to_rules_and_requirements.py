@@ -0,0 +1,32 @@
+"""Add version columns for optimistic concurrency control
+
+Revision ID: f3a8c61d5e07
+Revises: e5a1c7d93b28
+Create Date: 2026-10-16 22:48:03.915276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c61d5e07'
+down_revision: Union[str, None] = 'e5a1c7d93b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('item_distributions') as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    with op.batch_alter_table('resource_requirements') as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('resource_requirements') as batch_op:
+        batch_op.drop_column('version')
+    with op.batch_alter_table('item_distributions') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,34 @@
+"""Fix lowercase recurrence_type values on raid_schedules
+
+Revision ID: f7d2b8c40e15
+Revises: e9c3f5a17b64
+Create Date: 2026-10-17 03:12:45.208613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7d2b8c40e15'
+down_revision: Union[str, None] = 'e9c3f5a17b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 대량 INSERT 경로가 반복 유형 값('weekly')을 그대로 저장한 행을 이름('WEEKLY')으로 수정
+    # (PostgreSQL enum 타입은 값 형식을 받지 않으므로 이런 행은 SQLite에만 있음)
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.execute(
+        "UPDATE raid_schedules SET recurrence_type = UPPER(recurrence_type) "
+        "WHERE recurrence_type IN ('none', 'daily', 'weekly', 'biweekly', 'monthly')"
+    )
+
+
+def downgrade() -> None:
+    # 잘못 저장된 값을 되돌릴 필요 없음
+    pass
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 
 from app.config import settings
 from app.core import deps, security
+from app.core.principal_cache import principal_cache
+from app.core.password_service import password_service
 from app.schemas.user import User, UserCreate, UserUpdate, Token
 from app.models.user import User as UserModel
 from app.utils import user as user_utils
@@ -146,17 +148,20 @@ def change_password(
     비밀번호 변경
     """
     # 현재 비밀번호 확인
-    if not security.verify_password(password_data.current_password, current_user.hashed_password):
+    if not password_service.verify(password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect password"
         )
     
     # 새 비밀번호 해시화 및 저장
-    current_user.hashed_password = security.get_password_hash(password_data.new_password)
+    current_user.hashed_password = password_service.hash(password_data.new_password)
     db.add(current_user)
     db.commit()
     
+    # 캐시된 인증 정보 무효화
+    principal_cache.invalidate_user(current_user.id)
+    
     return {"message": "Password changed successfully"}
 
 @router.post("/refresh", response_model=Token)
@@ -1,23 +1,54 @@
-from typing import List, Optional, Dict
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+import csv
+import io
+import json
+import time
+from types import SimpleNamespace
+from typing import Iterator, List, Optional, Dict
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy import and_, or_, func, insert, select, tuple_, Select
 from datetime import datetime, timezone
 
+from app.config import settings
+from app.database import SessionLocal
 from app.core import deps
+from app.core.equipment_catalog import equipment_catalog
+from app.core.forecast_service import forecast_service
+from app.utils.priority import PriorityWeights, load_priority_inputs, calculate_priority_orders, apply_priority_orders
+from app.utils.resources import apply_obtained_delta, apply_obtained_deltas, refresh_requirement_progress
+from app.utils.forecast import LootSource
+from app.utils.assignment import suggest_week_assignment
+from app.utils.distribution_rules import load_priority_orders, add_completed_users, remove_completed_user
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from app.utils.rollups import apply_rollup_deltas
+from app.utils.distribution_events import (
+    RULE_CREATED, RULE_UPDATED, RULE_DELETED, HISTORY_RECORDED, HISTORY_DELETED, OBTAINED_UPDATED,
+    append_distribution_events, load_state, rule_payload, history_payload
+)
 from app.models.user import User
-from app.models.raid import RaidGroup, RaidMember
+from app.models.raid import RaidGroup, RaidMember, DistributionMethod
 from app.models.equipment import Equipment, EquipmentSet, EquipmentSetItem, EquipmentSlot as ModelEquipmentSlot, EquipmentType as ModelEquipmentType
-from app.models.item_distribution import ItemDistribution, DistributionHistory, ResourceRequirement
+from app.models.item_distribution import ItemDistribution, DistributionHistory, DistributionWeeklyRollup, ResourceRequirement, ItemType as ModelItemType
 from app.schemas.item_distribution import (
     ItemDistribution as ItemDistributionSchema,
     ItemDistributionCreate,
     ItemDistributionUpdate,
     DistributionHistory as DistributionHistorySchema,
     DistributionHistoryCreate,
+    DistributionHistoryBatchCreate,
     ResourceRequirement as ResourceRequirementSchema,
     ResourceRequirementUpdate,
     ResourceCalculationResult,
+    GroupResourceCalculationResult,
+    BisForecastResult,
+    WeekAssignmentRequest,
+    WeekAssignmentSuggestion,
+    LootRollup,
+    DistributionSummary,
+    DistributionRuleState,
+    DistributionState,
     ItemType
 )
 
@@ -47,7 +78,7 @@ def get_distribution_rules(
     if floor_number:
         query = query.filter(ItemDistribution.floor_number == floor_number)
     if item_type:
-        query = query.filter(ItemDistribution.item_type == item_type)
+        query = query.filter(ItemDistribution.item_type == ModelItemType(item_type.value))
     if is_active is not None:
         query = query.filter(ItemDistribution.is_active == is_active)
     
@@ -64,28 +95,8 @@ def create_distribution_rule(
     """
     새 분배 규칙 생성 (공대장 또는 분배 권한자)
     """
-    # 권한 확인
-    member = db.query(RaidMember).filter(
-        and_(
-            RaidMember.raid_group_id == group_id,
-            RaidMember.user_id == current_user.id
-        )
-    ).first()
-    
-    if not member or not member.can_manage_distribution:
-        # 공대장인지 확인
-        group = db.query(RaidGroup).filter(
-            and_(
-                RaidGroup.id == group_id,
-                RaidGroup.leader_id == current_user.id
-            )
-        ).first()
-        
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to manage distribution"
-            )
+    # 권한 확인 (공대장 또는 분배 권한자)
+    current_user = deps.get_group_access(group_id, current_user, db).require_distribution_manager()
     
     # 우선순위 순서 검증 (모든 멤버가 포함되어야 함)
     if rule_in.priority_order:
@@ -102,10 +113,15 @@ def create_distribution_rule(
     
     # 분배 규칙 생성
     rule = ItemDistribution(
-        **rule_in.model_dump(),
+        **rule_in.model_dump(exclude={"item_type"}),
+        item_type=ModelItemType(rule_in.item_type.value),
         raid_group_id=group_id
     )
     db.add(rule)
+    db.flush()
+    
+    append_distribution_events(db, group_id, [(RULE_CREATED, None, rule_payload(rule))], current_user.id)
+    
     db.commit()
     db.refresh(rule)
     return rule
@@ -121,16 +137,8 @@ def update_distribution_rule(
     """
     분배 규칙 수정
     """
-    # 권한 확인 (위와 동일)
-    member = db.query(RaidMember).filter(
-        and_(
-            RaidMember.raid_group_id == group_id,
-            RaidMember.user_id == current_user.id
-        )
-    ).first()
-    
-    if not member or not member.can_manage_distribution:
-        current_user = deps.get_raid_group_leader(group_id, current_user, db)
+    # 권한 확인 (공대장 또는 분배 권한자)
+    current_user = deps.get_group_access(group_id, current_user, db).require_distribution_manager()
     
     # 규칙 조회
     rule = db.query(ItemDistribution).filter(
@@ -146,12 +154,20 @@ def update_distribution_rule(
             detail="Distribution rule not found"
         )
     
+    # 클라이언트가 조회한 버전과 다르면 다른 요청이 먼저 수정한 것
     update_data = rule_in.model_dump(exclude_unset=True)
+    _check_version(update_data.pop("version", None), rule.version)
+    
     for field, value in update_data.items():
         setattr(rule, field, value)
     
+    # 우선순위/획득 완료 멤버만 바뀌어도 규칙 행을 갱신하여 버전 증가
+    rule.updated_at = datetime.now(timezone.utc)
+    
+    append_distribution_events(db, group_id, [(RULE_UPDATED, None, rule_payload(rule))], current_user.id)
+    
     db.add(rule)
-    db.commit()
+    _commit_or_conflict(db, ItemDistribution, id=rule_id)
     db.refresh(rule)
     return rule
 
@@ -181,6 +197,8 @@ def delete_distribution_rule(
             detail="Distribution rule not found"
         )
     
+    append_distribution_events(db, group_id, [(RULE_DELETED, None, {"distribution_id": rule.id})], current_user.id)
+    
     db.delete(rule)
     db.commit()
     
@@ -191,16 +209,20 @@ def delete_distribution_rule(
 @router.get("/groups/{group_id}/history", response_model=List[DistributionHistorySchema])
 def get_distribution_history(
     group_id: int,
+    response: Response,
     week_number: Optional[int] = None,
     user_id: Optional[int] = None,
     item_type: Optional[ItemType] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db)
 ):
     """
     아이템 분배 이력 조회
+    cursor를 주면 skip 대신 (분배 일시, ID) 기준으로 이어서 조회
+    페이지가 가득 차면 다음 페이지 커서를 X-Next-Cursor 헤더로 반환
     """
     # 공대 멤버 확인
     current_user = deps.get_raid_group_member(group_id, current_user, db)
@@ -214,14 +236,75 @@ def get_distribution_history(
     if user_id:
         query = query.filter(DistributionHistory.user_id == user_id)
     if item_type:
-        query = query.filter(DistributionHistory.item_type == item_type)
+        query = query.filter(DistributionHistory.item_type == ModelItemType(item_type.value))
     
-    # 최신순 정렬
-    query = query.order_by(DistributionHistory.distributed_at.desc())
+    # 최신순 정렬 (같은 시각이면 나중에 기록된 순)
+    query = query.order_by(DistributionHistory.distributed_at.desc(), DistributionHistory.id.desc())
     
-    histories = query.offset(skip).limit(limit).all()
+    if cursor:
+        # 이전 페이지 마지막 항목 이후부터 인덱스로 바로 조회
+        try:
+            distributed_at, history_id = decode_cursor(cursor, (datetime, int))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        query = query.filter(
+            tuple_(DistributionHistory.distributed_at, DistributionHistory.id) < tuple_(distributed_at, history_id)
+        )
+    else:
+        query = query.offset(skip)
+    
+    histories = query.limit(limit).all()
+    
+    if len(histories) == limit:
+        last = histories[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([last.distributed_at, last.id])
     return histories
 
+@router.get("/groups/{group_id}/history/export")
+def export_distribution_history(
+    group_id: int,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    week_number: Optional[int] = None,
+    user_id: Optional[int] = None,
+    item_type: Optional[ItemType] = None,
+    current_user: User = Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    분배 이력 전체 내보내기 (NDJSON 또는 CSV, 오래된 순)
+    필요한 컬럼만 서버 측 커서로 나누어 읽으면서 바로 전송하므로
+    이력 수와 관계없이 메모리에는 한 묶음만 유지
+    """
+    # 공대 멤버 확인
+    current_user = deps.get_raid_group_member(group_id, current_user, db)
+    
+    query = select(*HISTORY_EXPORT_COLUMNS).join(
+        User, User.id == DistributionHistory.user_id
+    ).where(
+        DistributionHistory.raid_group_id == group_id
+    )
+    
+    if week_number:
+        query = query.where(DistributionHistory.week_number == week_number)
+    if user_id:
+        query = query.where(DistributionHistory.user_id == user_id)
+    if item_type:
+        query = query.where(DistributionHistory.item_type == ModelItemType(item_type.value))
+    
+    query = query.order_by(DistributionHistory.distributed_at.asc(), DistributionHistory.id.asc())
+    
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _stream_history_export(query, export_format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="distribution_history_{group_id}.{export_format}"'
+        }
+    )
+
 @router.post("/groups/{group_id}/history", response_model=DistributionHistorySchema)
 def record_distribution(
     group_id: int,
@@ -232,42 +315,154 @@ def record_distribution(
     """
     아이템 분배 기록
     """
-    # 권한 확인
-    member = db.query(RaidMember).filter(
-        and_(
-            RaidMember.raid_group_id == group_id,
-            RaidMember.user_id == current_user.id
-        )
-    ).first()
-    
-    if not member or not member.can_manage_distribution:
-        current_user = deps.get_raid_group_leader(group_id, current_user, db)
+    # 권한 확인 (공대장 또는 분배 권한자)
+    current_user = deps.get_group_access(group_id, current_user, db).require_distribution_manager()
     
     # 분배 규칙이 있는 경우 업데이트
     if history_in.distribution_id:
-        rule = db.query(ItemDistribution).filter(
+        rule_id = db.query(ItemDistribution.id).filter(
             and_(
                 ItemDistribution.id == history_in.distribution_id,
                 ItemDistribution.raid_group_id == group_id
             )
-        ).first()
+        ).scalar()
         
-        if rule:
-            # completed_users에 추가
-            if history_in.user_id not in rule.completed_users:
-                rule.completed_users = rule.completed_users + [history_in.user_id]
-                db.add(rule)
+        if rule_id:
+            # 획득 완료 멤버에 추가 (멤버별 행이므로 동시 기록에도 유실되지 않음)
+            add_completed_users(db, {rule_id: [history_in.user_id]})
     
     # 이력 생성
     history = DistributionHistory(
-        **history_in.model_dump(),
+        **history_in.model_dump(exclude={"item_type"}),
+        item_type=ModelItemType(history_in.item_type.value),
         raid_group_id=group_id
     )
     db.add(history)
-    db.commit()
+    db.flush()
+    
+    # 획득한 멤버의 재화 요구량과 주차별 집계에 반영 (같은 트랜잭션)
+    requirement = apply_obtained_delta(db, group_id, history_in.user_id, history_in.item_name, 1)
+    apply_rollup_deltas(db, group_id, {(history.week_number, history.user_id, history.item_type): 1})
+    
+    counted = history.item_name in (requirement.required_resources or {})
+    append_distribution_events(
+        db, group_id,
+        [(HISTORY_RECORDED, history.week_number, {"histories": [history_payload(history, counted)]})],
+        current_user.id
+    )
+    
+    _commit_or_conflict(db, ResourceRequirement, raid_group_id=group_id, user_id=history_in.user_id)
     db.refresh(history)
     return history
 
+@router.post("/groups/{group_id}/history/batch", response_model=List[DistributionHistorySchema])
+def record_distribution_batch(
+    group_id: int,
+    batch_in: DistributionHistoryBatchCreate,
+    current_user: User = Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    한 주 분배 일괄 기록 (공대장 또는 분배 권한자)
+    모든 기록을 한 트랜잭션에서 저장하며 하나라도 잘못되면 아무것도 저장하지 않음
+    """
+    # 권한 확인 (공대장 또는 분배 권한자)
+    current_user = deps.get_group_access(group_id, current_user, db).require_distribution_manager()
+    
+    distributions = batch_in.distributions
+    
+    # 참조한 분배 규칙을 한 번에 조회하여 검증
+    rule_ids = {distribution.distribution_id for distribution in distributions if distribution.distribution_id}
+    if rule_ids:
+        found_rule_ids = {
+            rule_id for (rule_id,) in db.query(ItemDistribution.id).filter(
+                ItemDistribution.id.in_(rule_ids),
+                ItemDistribution.raid_group_id == group_id
+            )
+        }
+        missing_rule_ids = sorted(rule_ids - found_rule_ids)
+        if missing_rule_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Distribution rules not found: {missing_rule_ids}"
+            )
+    
+    # 받는 사람이 모두 공대 멤버인지 확인
+    user_ids = {distribution.user_id for distribution in distributions}
+    member_ids = {
+        user_id for (user_id,) in db.query(RaidMember.user_id).filter(
+            RaidMember.raid_group_id == group_id,
+            RaidMember.user_id.in_(user_ids)
+        )
+    }
+    non_member_ids = sorted(user_ids - member_ids)
+    if non_member_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Users are not members of this raid group: {non_member_ids}"
+        )
+    
+    # 이력은 다중 행 INSERT 한 번으로 생성 (ID는 입력 순서대로)
+    rows = [
+        {
+            **distribution.model_dump(),
+            # 모델 Enum 컬럼은 이름으로 저장하므로 스키마 값을 모델 ItemType으로 변환
+            "item_type": ModelItemType(distribution.item_type.value),
+            "raid_group_id": group_id,
+            "week_number": batch_in.week_number
+        }
+        for distribution in distributions
+    ]
+    history_ids = list(db.scalars(
+        insert(DistributionHistory).returning(DistributionHistory.id, sort_by_parameter_order=True),
+        rows
+    ))
+    
+    # 규칙별 획득 완료 멤버는 한 번의 INSERT로 추가
+    completed_users = {}
+    obtained_deltas = {}
+    rollup_deltas = {}
+    for row in rows:
+        if row["distribution_id"]:
+            completed_users.setdefault(row["distribution_id"], []).append(row["user_id"])
+        key = (row["user_id"], row["item_name"])
+        obtained_deltas[key] = obtained_deltas.get(key, 0) + 1
+        rollup_key = (batch_in.week_number, row["user_id"], row["item_type"])
+        rollup_deltas[rollup_key] = rollup_deltas.get(rollup_key, 0) + 1
+    
+    add_completed_users(db, completed_users)
+    
+    # 획득한 멤버들의 재화 요구량과 주차별 집계에 반영 (같은 트랜잭션)
+    requirements = apply_obtained_deltas(db, group_id, obtained_deltas)
+    apply_rollup_deltas(db, group_id, rollup_deltas)
+    
+    # 한 주 기록 전체를 이벤트 하나로 남김
+    append_distribution_events(
+        db, group_id,
+        [(
+            HISTORY_RECORDED,
+            batch_in.week_number,
+            {"histories": [
+                history_payload(
+                    SimpleNamespace(id=history_id, **row),
+                    row["item_name"] in (requirements[row["user_id"]].required_resources or {})
+                )
+                for history_id, row in zip(history_ids, rows)
+            ]}
+        )],
+        current_user.id
+    )
+    
+    _commit_or_conflict(db)
+    
+    histories = db.query(DistributionHistory).options(
+        selectinload(DistributionHistory.user)
+    ).filter(
+        DistributionHistory.id.in_(history_ids)
+    ).order_by(DistributionHistory.id.asc()).all()
+    
+    return histories
+
 @router.delete("/groups/{group_id}/history/{history_id}")
 def delete_distribution_history(
     group_id: int,
@@ -293,21 +488,123 @@ def delete_distribution_history(
             detail="Distribution history not found"
         )
     
-    # 관련 규칙에서 completed_users 업데이트
+    # 관련 규칙의 획득 완료 멤버에서 제거
     if history.distribution_id:
-        rule = db.query(ItemDistribution).filter(
-            ItemDistribution.id == history.distribution_id
-        ).first()
-        
-        if rule and history.user_id in rule.completed_users:
-            rule.completed_users = [uid for uid in rule.completed_users if uid != history.user_id]
-            db.add(rule)
+        remove_completed_user(db, history.distribution_id, history.user_id)
+    
+    # 획득한 멤버의 재화 요구량과 주차별 집계에서 제외 (같은 트랜잭션)
+    user_id = history.user_id
+    requirement = apply_obtained_delta(db, group_id, user_id, history.item_name, -1)
+    apply_rollup_deltas(db, group_id, {(history.week_number, user_id, history.item_type): -1})
+    
+    counted = history.item_name in (requirement.required_resources or {})
+    append_distribution_events(
+        db, group_id,
+        [(HISTORY_DELETED, history.week_number, {"histories": [history_payload(history, counted)]})],
+        current_user.id
+    )
     
     db.delete(history)
-    db.commit()
+    _commit_or_conflict(db, ResourceRequirement, raid_group_id=group_id, user_id=user_id)
     
     return {"message": "Distribution history deleted successfully"}
 
+#SECTION - 분배 집계
+
+@router.get("/groups/{group_id}/summary", response_model=DistributionSummary)
+def get_distribution_summary(
+    group_id: int,
+    from_week: Optional[int] = Query(None, ge=1),
+    to_week: Optional[int] = Query(None, ge=1),
+    user_id: Optional[int] = None,
+    current_user: User = Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    주차/멤버/아이템 타입별 획득 수 조회 (공정성 통계용)
+    분배 이력 대신 주차별 집계 테이블에서 인덱스 조회 한 번으로 계산
+    """
+    # 공대 멤버 확인
+    current_user = deps.get_raid_group_member(group_id, current_user, db)
+    
+    query = db.query(
+        DistributionWeeklyRollup.week_number,
+        DistributionWeeklyRollup.user_id,
+        DistributionWeeklyRollup.item_type,
+        DistributionWeeklyRollup.item_count
+    ).filter(
+        DistributionWeeklyRollup.raid_group_id == group_id
+    )
+    
+    if from_week:
+        query = query.filter(DistributionWeeklyRollup.week_number >= from_week)
+    if to_week:
+        query = query.filter(DistributionWeeklyRollup.week_number <= to_week)
+    if user_id:
+        query = query.filter(DistributionWeeklyRollup.user_id == user_id)
+    
+    weeks = []
+    member_totals: Dict[int, Dict[str, int]] = {}
+    for week_number, member_id, item_type, item_count in query.order_by(
+        DistributionWeeklyRollup.week_number,
+        DistributionWeeklyRollup.user_id,
+        DistributionWeeklyRollup.item_type
+    ):
+        weeks.append(LootRollup(
+            week_number=week_number,
+            user_id=member_id,
+            item_type=item_type.value,
+            count=item_count
+        ))
+        totals = member_totals.setdefault(member_id, {})
+        totals[item_type.value] = totals.get(item_type.value, 0) + item_count
+    
+    return DistributionSummary(
+        raid_group_id=group_id,
+        weeks=weeks,
+        member_totals=member_totals
+    )
+
+@router.get("/groups/{group_id}/state", response_model=DistributionState)
+def get_distribution_state(
+    group_id: int,
+    week_number: Optional[int] = Query(None, ge=0),
+    current_user: User = Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    특정 주차의 분배 상태 조회 (우선순위, 획득 완료 멤버, 획득 재화)
+    week_number를 주면 다음 주차 분배가 시작되기 직전 상태를 이벤트 로그로 재구성
+    가장 가까운 스냅샷에서 시작하므로 이력 길이와 관계없이 적용하는 이벤트 수가 제한됨
+    """
+    # 공대 멤버 확인
+    current_user = deps.get_raid_group_member(group_id, current_user, db)
+    
+    started_at = time.perf_counter()
+    result = load_state(db, group_id, week_number)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Distribution state before the event log baseline is not available"
+        )
+    
+    state = result["state"]
+    return DistributionState(
+        raid_group_id=group_id,
+        week_number=week_number,
+        last_event_id=result["last_event_id"],
+        snapshot_event_id=result["snapshot_event_id"],
+        replayed_events=result["replayed_events"],
+        latest_week_number=state["week_number"],
+        obtained={int(user_id): obtained for user_id, obtained in state["obtained"].items()},
+        loot_counts={int(user_id): count for user_id, count in state["loot_counts"].items()},
+        rules=[
+            DistributionRuleState(distribution_id=int(rule_id), **rule)
+            for rule_id, rule in sorted(state["rules"].items(), key=lambda item: int(item[0]))
+        ],
+        elapsed_ms=round((time.perf_counter() - started_at) * 1000, 2)
+    )
+
 #SECTION - 재화 요구량 계산
 
 @router.get("/groups/{group_id}/resources", response_model=List[ResourceRequirementSchema])
@@ -412,27 +709,96 @@ def calculate_resource_requirement(
         )
         db.add(requirement)
     
-    requirement.required_resources = required_resources["total"]
-    requirement.remaining_resources = required_resources["total"] # 초기값
-    requirement.last_calculated_at = datetime.now(timezone.utc)
+    _apply_calculated_resources(requirement, required_resources)
     
-    # 달성률 계산
-    requirement.completion_percentage = 0 # 초기값
-    
-    db.commit()
+    _commit_or_conflict(db, ResourceRequirement, raid_group_id=group_id, user_id=current_user.id)
     db.refresh(requirement)
     
     # 결과 반환
-    result = ResourceCalculationResult(
-        user_id=current_user.id,
+    return _build_calculation_result(current_user.id, group_id, required_resources)
+
+@router.post("/groups/{group_id}/resources/calculate-all", response_model=GroupResourceCalculationResult)
+def calculate_all_resource_requirements(
+    group_id: int,
+    current_user: User = Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    공대원 전체 재화 요구량 계산 및 업데이트 (공대장 또는 분배 권한자)
+    출발 세트와 BIS 세트가 모두 있는 멤버만 계산
+    """
+    # 권한 확인 (공대장 또는 분배 권한자)
+    current_user = deps.get_group_access(group_id, current_user, db).require_distribution_manager()
+    
+    started_at = time.perf_counter()
+    
+    member_ids = [
+        user_id for (user_id,) in db.query(RaidMember.user_id).filter(
+            RaidMember.raid_group_id == group_id
+        ).all()
+    ]
+    
+    # 모든 멤버의 출발/BIS 세트와 아이템을 한 번에 조회
+    equipment_sets = db.query(EquipmentSet).filter(
+        and_(
+            EquipmentSet.raid_group_id == group_id,
+            EquipmentSet.user_id.in_(member_ids),
+            or_(
+                EquipmentSet.is_starting_set == True,
+                EquipmentSet.is_bis_set == True
+            )
+        )
+    ).options(
+        selectinload(EquipmentSet.items)
+    ).order_by(EquipmentSet.id.asc()).all()
+    
+    starting_sets = {}
+    bis_sets = {}
+    for equipment_set in equipment_sets:
+        if equipment_set.is_starting_set:
+            starting_sets.setdefault(equipment_set.user_id, equipment_set)
+        if equipment_set.is_bis_set:
+            bis_sets.setdefault(equipment_set.user_id, equipment_set)
+    
+    requirements = {
+        requirement.user_id: requirement
+        for requirement in db.query(ResourceRequirement).filter(
+            ResourceRequirement.raid_group_id == group_id
+        ).all()
+    }
+    
+    results = []
+    skipped_user_ids = []
+    
+    for user_id in member_ids:
+        starting_set = starting_sets.get(user_id)
+        bis_set = bis_sets.get(user_id)
+        if not starting_set or not bis_set:
+            skipped_user_ids.append(user_id)
+            continue
+        
+        required_resources = _calculate_resources(db, starting_set, bis_set)
+        
+        requirement = requirements.get(user_id)
+        if not requirement:
+            requirement = ResourceRequirement(
+                user_id=user_id,
+                raid_group_id=group_id
+            )
+            db.add(requirement)
+        
+        _apply_calculated_resources(requirement, required_resources)
+        results.append(_build_calculation_result(user_id, group_id, required_resources))
+    
+    # 모든 멤버의 요구량을 한 트랜잭션으로 저장
+    _commit_or_conflict(db)
+    
+    return GroupResourceCalculationResult(
         raid_group_id=group_id,
-        required_resources=required_resources["total"],
-        equipment_changes=required_resources["changes"],
-        upgrade_materials_needed=required_resources["upgrade_materials"],
-        tome_cost_total=required_resources["tome_cost"]
+        results=results,
+        skipped_user_ids=skipped_user_ids,
+        elapsed_ms=round((time.perf_counter() - started_at) * 1000, 2)
     )
-    
-    return result
 
 @router.put("/groups/{group_id}/resources/update", response_model=ResourceRequirementSchema)
 def update_obtained_resources(
@@ -460,29 +826,22 @@ def update_obtained_resources(
             detail="Resource requirement not found"
         )
     
-    # 획득 재화 업데이트
+    # 클라이언트가 조회한 버전과 다르면 다른 요청(분배 기록 등)이 먼저 수정한 것
+    _check_version(update_in.version, requirement.version)
+    
+    # 획득 재화 업데이트 (남은 재화, 달성률 계산)
     if update_in.obtained_resources:
         requirement.obtained_resources = update_in.obtained_resources
+        refresh_requirement_progress(requirement)
         
-        # 남은 재화 계산
-        remaining = {}
-        for key, required in requirement.required_resources.items():
-            obtained = requirement.obtained_resources.get(key, 0)
-            remaining[key] = max(0, required - obtained)
-        
-        requirement.remaining_resources = remaining
-        
-        # 달성률 계산
-        total_required = sum(requirement.required_resources.values())
-        total_obtained = sum(requirement.obtained_resources.values())
-        
-        if total_required > 0:
-            requirement.completion_percentage = min(100, int((total_obtained / total_required) * 100))
-        else:
-            requirement.completion_percentage = 100
+        append_distribution_events(
+            db, group_id,
+            [(OBTAINED_UPDATED, None, {"user_id": current_user.id, "obtained_resources": requirement.obtained_resources})],
+            current_user.id
+        )
     
     db.add(requirement)
-    db.commit()
+    _commit_or_conflict(db, ResourceRequirement, id=requirement.id)
     db.refresh(requirement)
     
     return requirement
@@ -498,29 +857,59 @@ def calculate_distribution_priority(
     """
     우선 순위 자동 계산 (공대장 또는 분배 권한자)
     """
-    # 권한 확인
-    member = db.query(RaidMember).filter(
-        and_(
-            RaidMember.raid_group_id == group_id,
-            RaidMember.user_id == current_user.id
+    # 권한 확인 (공대장 또는 분배 권한자)
+    access = deps.get_group_access(group_id, current_user, db)
+    current_user = access.require_distribution_manager()
+    
+    # 공대 설정 확인 (권한 조회 시 함께 가져온 분배 방식 사용)
+    if access.distribution_method != DistributionMethod.PRIORITY:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This raid group does not use priority distribution"
         )
-    ).first()
     
-    if not member or not member.can_manage_distribution:
-        current_user = deps.get_raid_group_leader(group_id, current_user, db)
+    # 모든 멤버의 재화 요구량 (가중치에 따라 참석률/획득 이력 포함) 조회
+    weights = PriorityWeights.from_settings()
+    priority_inputs = load_priority_inputs(db, [group_id], weights)
     
-    # 공대 설정 확인
-    group = db.query(RaidGroup).filter(RaidGroup.id == group_id).first()
-    if group.distribution_method != "priority":
+    if not priority_inputs["requirements"]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This raid group does not use priority distribution"
+            detail="No resource requirements found. Members must calculate their requirements first."
         )
     
-    # 모든 멤버의 재화 요구량 조회
+    # 각 아이템별 우선순위 계산
+    priorities = calculate_priority_orders(weights=weights, **priority_inputs).get(group_id, {})
+    
+    # 기존 분배 규칙 업데이트 (규칙이 없는 아이템은 응답에 포함)
+    missing_rules = apply_priority_orders(db, {group_id: priorities}, current_user.id).get(group_id, [])
+    
+    _commit_or_conflict(db)
+    
+    return {
+        "message": "Priorities calculated successfully",
+        "priorities": priorities,
+        "missing_rules": missing_rules
+    }
+
+@router.post("/groups/{group_id}/suggest-week", response_model=WeekAssignmentSuggestion)
+def suggest_week_distribution(
+    group_id: int,
+    request_in: WeekAssignmentRequest,
+    current_user: User = Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    한 주 드랍 전체의 추천 분배 (공대장 또는 분배 권한자)
+    공대 전체 예상 BIS 도달 주차 합이 가장 작도록 배정하며
+    멤버는 층마다 한 주에 아이템 하나만 받을 수 있고 동점이면 기존 우선순위 순서를 따름
+    """
+    # 권한 확인 (공대장 또는 분배 권한자)
+    current_user = deps.get_group_access(group_id, current_user, db).require_distribution_manager()
+    
     requirements = db.query(ResourceRequirement).filter(
         ResourceRequirement.raid_group_id == group_id
-    ).all()
+    ).order_by(ResourceRequirement.id.asc()).all()
     
     if not requirements:
         raise HTTPException(
@@ -528,28 +917,206 @@ def calculate_distribution_priority(
             detail="No resource requirements found. Members must calculate their requirements first."
         )
     
-    # 각 아이템별 우선순위 계산
-    priorities = _calculate_priorities(db, group_id, requirements)
+    started_at = time.perf_counter()
     
-    # 기존 분배 규칙 업데이트
-    for item_name, priority_order in priorities.items():
-        rule = db.query(ItemDistribution).filter(
-            and_(
-                ItemDistribution.raid_group_id == group_id,
-                ItemDistribution.item_name == item_name,
-                ItemDistribution.is_active == True
-            )
-        ).first()
-        
-        if rule:
-            rule.priority_order = priority_order
-            db.add(rule)
+    user_ids = [requirement.user_id for requirement in requirements]
+    member_index = {user_id: index for index, user_id in enumerate(user_ids)}
     
-    db.commit()
+    # 활성 분배 규칙 (같은 이름이면 먼저 만든 규칙)
+    rules = {}
+    for rule in db.query(
+        ItemDistribution.id,
+        ItemDistribution.item_name
+    ).filter(
+        ItemDistribution.raid_group_id == group_id,
+        ItemDistribution.is_active == True
+    ).order_by(ItemDistribution.id.asc()):
+        rules.setdefault(rule.item_name, rule)
     
-    return {"message": "Priorities calculated successfully", "priorities": priorities}
+    priority_orders = load_priority_orders(db, [rule.id for rule in rules.values()])
+    priority_ranks = {
+        item_name: {
+            member_index[user_id]: rank
+            for rank, user_id in enumerate(priority_orders[rule.id])
+            if user_id in member_index
+        }
+        for item_name, rule in rules.items()
+    }
+    
+    # 이번 주에 이미 아이템을 받은 멤버는 해당 층에서 제외
+    locked_out_user_ids = {}
+    for floor_number, user_id in db.query(
+        DistributionHistory.floor_number,
+        DistributionHistory.user_id
+    ).filter(
+        DistributionHistory.raid_group_id == group_id,
+        DistributionHistory.week_number == request_in.week_number,
+        DistributionHistory.floor_number.isnot(None)
+    ).distinct():
+        locked_out_user_ids.setdefault(floor_number, set()).add(user_id)
+    
+    suggestion = suggest_week_assignment(
+        remaining_resources=[requirement.remaining_resources or {} for requirement in requirements],
+        drops=[(drop.item_name, drop.floor_number) for drop in request_in.drops],
+        sources=_build_loot_sources(),
+        priority_ranks=priority_ranks,
+        locked_out={
+            floor_number: {member_index[user_id] for user_id in locked if user_id in member_index}
+            for floor_number, locked in locked_out_user_ids.items()
+        }
+    )
+    
+    return WeekAssignmentSuggestion(
+        raid_group_id=group_id,
+        week_number=request_in.week_number,
+        assignments=[
+            {
+                **drop.model_dump(),
+                "user_id": user_ids[member] if member is not None else None,
+                "distribution_id": rules[drop.item_name].id if drop.item_name in rules else None
+            }
+            for drop, member in zip(request_in.drops, suggestion["assignments"])
+        ],
+        estimated_weeks_before=dict(zip(user_ids, suggestion["weeks_before"])),
+        estimated_weeks_after=dict(zip(user_ids, suggestion["weeks_after"])),
+        locked_out_user_ids={
+            floor_number: sorted(locked)
+            for floor_number, locked in locked_out_user_ids.items()
+        },
+        elapsed_ms=round((time.perf_counter() - started_at) * 1000, 2)
+    )
+
+#SECTION - BIS 도달 예측
+
+@router.get("/groups/{group_id}/forecast", response_model=BisForecastResult)
+def forecast_bis_weeks(
+    group_id: int,
+    simulations: int = Query(2000, ge=1, le=settings.FORECAST_MAX_SIMULATIONS),
+    max_weeks: int = Query(52, ge=1, le=settings.FORECAST_MAX_WEEKS),
+    seed: Optional[int] = Query(None, ge=0),
+    current_user: User = Depends(deps.get_current_user),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    현재 재화 요구량과 주간 드랍 테이블, 공대 분배 방식으로
+    레이드 주차를 시뮬레이션하여 멤버별/공대 전체 BIS 도달 주차 분포 예측
+    (seed를 지정하면 같은 결과를 재현)
+    """
+    # 공대 멤버 확인
+    access = deps.get_group_access(group_id, current_user, db)
+    current_user = access.require_member()
+    
+    # 우선순위 분배와 같은 점수를 쓰기 위해 가중치에 따라 참석률/획득 이력도 조회
+    weights = PriorityWeights.from_settings()
+    priority_inputs = load_priority_inputs(db, [group_id], weights)
+    requirements = priority_inputs["requirements"]
+    
+    if not requirements:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No resource requirements found. Members must calculate their requirements first."
+        )
+    
+    started_at = time.perf_counter()
+    
+    priority_method = access.distribution_method == DistributionMethod.PRIORITY
+    member_keys = [(group_id, requirement.user_id) for requirement in requirements]
+    forecast = forecast_service.forecast(
+        simulations=simulations,
+        remaining_resources=[requirement.remaining_resources or {} for requirement in requirements],
+        sources=_build_loot_sources(),
+        priority_method=priority_method,
+        weights=weights,
+        attendance=[priority_inputs["attendance_rates"].get(key, 0.0) for key in member_keys],
+        loot_counts=[priority_inputs["loot_counts"].get(key, 0) for key in member_keys],
+        max_weeks=max_weeks,
+        seed=seed
+    )
+    
+    return BisForecastResult(
+        raid_group_id=group_id,
+        distribution_method=(DistributionMethod.PRIORITY if priority_method else DistributionMethod.FIRST_COME).value,
+        simulations=simulations,
+        max_weeks=max_weeks,
+        seed=seed,
+        members=[
+            {"user_id": requirement.user_id, **summary}
+            for requirement, summary in zip(requirements, forecast["members"])
+        ],
+        group=forecast["group"],
+        ignored_items=forecast["ignored_items"],
+        elapsed_ms=round((time.perf_counter() - started_at) * 1000, 2)
+    )
 
 #SECTION - 유틸리티 함수
+
+# 분배 이력 내보내기 컬럼 (ORM 객체 대신 필요한 컬럼만 조회)
+HISTORY_EXPORT_COLUMNS = (
+    DistributionHistory.id,
+    DistributionHistory.week_number,
+    DistributionHistory.distributed_at,
+    DistributionHistory.user_id,
+    User.character_name,
+    DistributionHistory.item_name,
+    DistributionHistory.item_type,
+    DistributionHistory.floor_number,
+    DistributionHistory.distribution_id,
+    DistributionHistory.notes
+)
+
+def _export_value(value):
+    """내보내기용 값 변환 (Enum은 값, 일시는 ISO 형식)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return getattr(value, "value", value)
+
+def _csv_safe(value):
+    """스프레드시트에서 수식으로 실행되지 않도록 수식 시작 문자 앞에 ' 추가"""
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@"):
+        return "'" + value
+    return value
+
+def _stream_history_export(query: Select, export_format: str) -> Iterator[str]:
+    """
+    분배 이력을 EXPORT_CHUNK_SIZE 행씩 읽어 NDJSON/CSV 문자열로 전송
+    요청 세션은 응답 전송 전에 닫히므로 전송 중에는 별도 세션 사용
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(query.execution_options(yield_per=settings.EXPORT_CHUNK_SIZE))
+        columns = list(result.keys())
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == "csv":
+            # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+            buffer.write("\ufeff")
+            writer.writerow(columns)
+        
+        for rows in result.partitions():
+            if export_format == "csv":
+                writer.writerows(
+                    [_csv_safe(_export_value(value)) for value in row]
+                    for row in rows
+                )
+            else:
+                for row in rows:
+                    buffer.write(json.dumps(
+                        {column: _export_value(value) for column, value in zip(columns, row)},
+                        ensure_ascii=False
+                    ))
+                    buffer.write("\n")
+            
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        
+        # 이력이 없으면 CSV 헤더만 전송
+        if buffer.tell():
+            yield buffer.getvalue()
+    finally:
+        db.close()
+
 def _calculate_resources(db: Session, starting_set: EquipmentSet, bis_set: EquipmentSet) -> Dict:
     """
     출발 세트에서 BIS 세트까지 필요한 재화 계산
@@ -565,19 +1132,24 @@ def _calculate_resources(db: Session, starting_set: EquipmentSet, bis_set: Equip
     starting_items = {item.slot: item for item in starting_set.items}
     bis_items = {item.slot: item for item in bis_set.items}
     
+    # 장비 정보는 카탈로그에서 한 번에 조회
+    catalog = equipment_catalog.get_many(
+        db,
+        [item.equipment_id for item in starting_set.items + bis_set.items]
+    )
+    
     for slot, bis_item in bis_items.items():
         starting_item = starting_items.get(slot)
         
         if not starting_item or starting_item.equipment_id != bis_item.equipment_id:
             # 장비 변경 필요
-            bis_equipment = db.query(Equipment).filter(
-                Equipment.id == bis_item.equipment_id
-            ).first()
+            bis_equipment = catalog.get(bis_item.equipment_id)
             
             if bis_equipment:
+                starting_equipment = catalog.get(starting_item.equipment_id) if starting_item else None
                 change = {
                     "slot": slot.value,
-                    "from": starting_item.equipment.name if starting_item else "없음",
+                    "from": starting_equipment.name if starting_equipment else "없음",
                     "to": bis_equipment.name,
                     "type": bis_equipment.equipment_type.value
                 }
@@ -601,45 +1173,88 @@ def _calculate_resources(db: Session, starting_set: EquipmentSet, bis_set: Equip
     
     return required
 
-def _calculate_priorities(db: Session, group_id: int, requirements: List[ResourceRequirement]) -> Dict:
+def _apply_calculated_resources(requirement: ResourceRequirement, required_resources: Dict):
     """
-    재화 요구량 기반 우선순위 계산
+    계산된 재화를 요구량 레코드에 반영
+    분배 이력으로 누적된 획득 재화는 유지하고 남은 재화와 달성률을 다시 계산
     """
-    priorities = {}
+    requirement.required_resources = required_resources["total"]
+    requirement.last_calculated_at = datetime.now(timezone.utc)
     
-    # 각 아이템 타입별로 계산
-    item_types = [
-        ("귀걸이_낱장", 3), ("목걸이_낱장", 3), ("팔찌_낱장", 3), ("반지_낱장", 3),
-        ("머리_낱장", 4), ("장갑_낱장", 4), ("신발_낱장", 4),
-        ("상의_낱장", 6), ("하의_낱장", 6),
-        ("무기_낱장", 8),
-        ("경화약", 4), ("강화섬유", 4), ("강화약", 4)
+    refresh_requirement_progress(requirement)
+
+def _build_calculation_result(user_id: int, group_id: int, required_resources: Dict) -> ResourceCalculationResult:
+    """
+    재화 계산 결과 응답 생성
+    """
+    return ResourceCalculationResult(
+        user_id=user_id,
+        raid_group_id=group_id,
+        required_resources=required_resources["total"],
+        equipment_changes=required_resources["changes"],
+        upgrade_materials_needed=required_resources["upgrade_materials"],
+        tome_cost_total=required_resources["tome_cost"]
+    )
+
+def _version_conflict(current_version: Optional[int]) -> HTTPException:
+    """다른 요청이 먼저 수정한 경우의 409 응답 (현재 버전 포함)"""
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail={
+            "message": "Modified by another request. Reload and retry.",
+            "current_version": current_version
+        }
+    )
+
+def _check_version(expected_version: Optional[int], current_version: int):
+    """클라이언트가 보낸 버전이 현재 버전과 다르면 409"""
+    if expected_version is not None and expected_version != current_version:
+        raise _version_conflict(current_version)
+
+def _commit_or_conflict(db: Session, model=None, **filters):
+    """
+    커밋 (버전이 있는 행의 UPDATE는 조회한 버전이 그대로일 때만 반영됨)
+    그 사이 다른 요청이 먼저 수정했으면 롤백하고 409
+    model과 조건을 주면 충돌한 행의 현재 버전을 응답에 포함
+    """
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        current_version = None
+        if model is not None:
+            current_version = db.query(model.version).filter_by(**filters).scalar()
+        raise _version_conflict(current_version)
+
+def _build_loot_sources() -> List[LootSource]:
+    """
+    층별 주간 드랍 테이블 (각 층 주 1회 클리어 기준)
+    - 상자: 층 슬롯 중 하나가 드랍되며 해당 슬롯 낱장 필요 수를 한 번에 채움
+    - 낱장: 멤버마다 층별 1장씩 받아 가장 많이 필요한 슬롯에 사용
+    - 보강 재료와 주간 석판 획득 상한
+    """
+    floor_coffers = [
+        ([ModelEquipmentSlot.EARRINGS, ModelEquipmentSlot.NECKLACE,
+          ModelEquipmentSlot.BRACELET, ModelEquipmentSlot.RING], 2),
+        ([ModelEquipmentSlot.HEAD, ModelEquipmentSlot.HANDS, ModelEquipmentSlot.FEET], 2),
+        ([ModelEquipmentSlot.BODY, ModelEquipmentSlot.LEGS], 2),
+        ([ModelEquipmentSlot.WEAPON], 1)
     ]
     
-    for item_name, _ in item_types:
-        # 해당 아이템이 필요한 멤버들의 점수 계산
-        scores = []
-        
-        for req in requirements:
-            if item_name in req.required_resources:
-                need = req.required_resources[item_name]
-                obtained = req.obtained_resources.get(item_name, 0)
-                remaining = need - obtained
-                
-                if remaining > 0:
-                    # 전체 재화 필요량도 고려
-                    total_need = sum(req.remaining_resources.values())
-                    score = (remaining * 1000) + total_need # 해당 아이템 필요량을 우선시
-                    scores.append((req.user_id, score))
-        
-        # 점수 기준 정렬 (높은 순)
-        scores.sort(key=lambda x: x[1], reverse=True)
-        priority_order = [user_id for user_id, _ in scores]
-        
-        if priority_order:
-            priorities[item_name] = priority_order
+    sources = []
+    for slots, coffer_count in floor_coffers:
+        token_names = tuple(_get_token_name(slot) for slot in slots)
+        sources.append(LootSource(token_names, tuple(_get_token_count(slot) for slot in slots), count=coffer_count))
+        sources.append(LootSource(token_names, (1,) * len(slots), personal=True))
+    
+    # 2층 장신구 보강 재료, 3층 방어구/무기 보강 재료
+    # (재화 요구량 계산과 같은 슬롯별 매핑으로 이름을 정해야 요구량과 맞물림)
+    for slot in (ModelEquipmentSlot.RING, ModelEquipmentSlot.BODY, ModelEquipmentSlot.WEAPON):
+        sources.append(LootSource((_get_upgrade_material(slot),), (1,)))
     
-    return priorities
+    # 주간 석판 획득 상한
+    sources.append(LootSource(("석판",), (450,), personal=True))
+    return sources
 
 def _get_token_name(slot: ModelEquipmentSlot) -> str:
     """슬롯에 따른 토큰(낱장) 이름 반환"""
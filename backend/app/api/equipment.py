@@ -1,12 +1,13 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_
 
 from app.core import deps
+from app.core.equipment_catalog import equipment_catalog
+from app.utils.equipment import apply_set_item_level_delta, refresh_set_item_levels, recalculate_set_item_levels
 from app.models.user import User
 from app.models.equipment import Equipment, EquipmentSet, EquipmentSetItem, EquipmentSlot as ModelEquipmentSlot
-from app.models.raid import RaidMember
 from app.schemas.equipment import (
     Equipment as EquipmentSchema,
     EquipmentCreate,
@@ -16,6 +17,7 @@ from app.schemas.equipment import (
     EquipmentSetUpdate,
     EquipmentSetItem as EquipmentSetItemSchema,
     EquipmentSetItemCreate,
+    EquipmentSetItemsReplace,
     EquipmentSetItemUpdate,
     EquipmentSlot,
     EquipmentType
@@ -84,6 +86,8 @@ def create_equipment(
     db.add(equipment)
     db.commit()
     db.refresh(equipment)
+    
+    equipment_catalog.invalidate()
     return equipment
 
 @router.put("/{equipment_id}", response_model=EquipmentSchema)
@@ -110,6 +114,13 @@ def update_equipment(
     db.add(equipment)
     db.commit()
     db.refresh(equipment)
+    
+    equipment_catalog.invalidate()
+    
+    # 아이템 레벨/부위가 바뀌면 이 장비를 포함한 세트의 아이템 레벨 재계산
+    if "item_level" in update_data or "slot" in update_data:
+        recalculate_set_item_levels(db, equipment_id=equipment_id)
+    
     return equipment
 
 @router.delete("/{equipment_id}")
@@ -133,6 +144,8 @@ def delete_equipment(
     db.add(equipment)
     db.commit()
     
+    equipment_catalog.invalidate()
+    
     return {"message": "Equipment deactivated successfully"}
 
 #SECTION - 장비 세트 관리
@@ -175,14 +188,9 @@ def get_equipment_set(
     
     # 본인 세트이거나 같은 공대원의 세트만 조회 가능
     if equipment_set.user_id != current_user.id:
-        member = db.query(RaidMember).filter(
-            and_(
-                RaidMember.raid_group_id == equipment_set.raid_group_id,
-                RaidMember.user_id == current_user.id
-            )
-        ).first()
+        access = deps.get_group_access(equipment_set.raid_group_id, current_user, db)
         
-        if not member:
+        if not access.is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to view this equipment set"
@@ -200,18 +208,7 @@ def create_equipemnt_set(
     새 장비 세트 생성
     """
     # 공대 멤버인지 확인
-    member = db.query(RaidMember).filter(
-        and_(
-            RaidMember.raid_group_id == set_in.raid_group_id,
-            RaidMember.user_id == current_user.id
-        )
-    ).first()
-    
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this raid group"
-        )
+    current_user = deps.get_group_access(set_in.raid_group_id, current_user, db).require_member()
     
     # 같은 타입의 세트가 이미 있는지 확인
     if set_in.is_starting_set:
@@ -337,8 +334,19 @@ def add_equipment_to_set(
             detail="Equipment set not found"
         )
     
+    # 요청 스키마의 슬롯은 같은 값의 모델 슬롯으로 변환
+    slot = ModelEquipmentSlot(item_in.slot.value)
+    
+    # 같은 슬롯에 이미 장비가 있는지 확인
+    existing = db.query(EquipmentSetItem).filter(
+        and_(
+            EquipmentSetItem.equipment_set_id == set_id,
+            EquipmentSetItem.slot == slot
+        )
+    ).first()
+    
     # 장비 존재 확인
-    equipment = db.query(Equipment).filter(Equipment.id == item_in.equipment_id).first()
+    equipment = equipment_catalog.get(db, item_in.equipment_id)
     if not equipment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -346,41 +354,112 @@ def add_equipment_to_set(
         )
     
     # 슬롯 일치 확인
-    if equipment.slot != item_in.slot:
+    if equipment.slot != slot:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Equipment slot mismatch"
         )
     
-    # 같은 슬롯에 이미 장비가 있는지 확인
-    existing = db.query(EquipmentSetItem).filter(
-        and_(
-            EquipmentSetItem.equipment_set_id == set_id,
-            EquipmentSetItem.slot == item_in.slot
-        )
-    ).first()
-    
+    removed_equipment_id = None
     if existing:
         # 기존 장비 교체
+        removed_equipment_id = existing.equipment_id
         existing.equipment_id = item_in.equipment_id
-        db.add(existing)
-        db.commit()
-        db.refresh(existing)
-        return existing
+        set_item = existing
     else:
         # 새 아이템 추가
         set_item = EquipmentSetItem(
-            **item_in.model_dump(),
+            equipment_id=item_in.equipment_id,
+            slot=slot,
             equipment_set_id=set_id
         )
-        db.add(set_item)
-        db.commit()
-        db.refresh(set_item)
-        
-        # 세트의 아이템 레벨 재계산
-        _recalculate_set_item_level(db, equipment_set)
-        
-        return set_item
+    db.add(set_item)
+    
+    # 세트의 아이템 레벨에 바뀐 부위만 반영 (같은 트랜잭션)
+    apply_set_item_level_delta(db, set_id, item_in.equipment_id, removed_equipment_id)
+    
+    db.commit()
+    db.refresh(set_item)
+    return set_item
+
+@router.put("/sets/{set_id}/items", response_model=EquipmentSetSchema)
+def replace_set_items(
+    set_id: int,
+    items_in: EquipmentSetItemsReplace,
+    current_user: User = Depends(deps.get_current_active_user),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    장비 세트의 아이템 전체 교체 (요청에 없는 부위는 제거)
+    바뀐 부위만 한 트랜잭션에서 추가/수정/삭제하고 아이템 레벨은 한 번만 계산
+    """
+    # 세트 소유자 확인 (기존 아이템도 함께 조회)
+    # 아이템 레벨을 다시 계산할 때까지 같은 세트의 다른 변경은 대기
+    equipment_set = db.query(EquipmentSet).options(
+        selectinload(EquipmentSet.items)
+    ).filter(
+        and_(
+            EquipmentSet.id == set_id,
+            EquipmentSet.user_id == current_user.id
+        )
+    ).with_for_update().first()
+    
+    if not equipment_set:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Equipment set not found"
+        )
+    
+    # 요청 스키마의 슬롯은 같은 값의 모델 슬롯으로 변환
+    requested = {}
+    for item_in in items_in.items:
+        slot = ModelEquipmentSlot(item_in.slot.value)
+        if slot in requested:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Duplicate slot: {item_in.slot.value}"
+            )
+        requested[slot] = item_in.equipment_id
+    
+    # 요청한 장비는 카탈로그에서 한 번에 확인
+    catalog = equipment_catalog.get_many(db, requested.values())
+    missing_ids = sorted(set(requested.values()) - set(catalog))
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Equipment not found: {missing_ids}"
+        )
+    
+    mismatched_slots = [slot.value for slot, equipment_id in requested.items() if catalog[equipment_id].slot != slot]
+    if mismatched_slots:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Equipment slot mismatch: {mismatched_slots}"
+        )
+    
+    # 기존 아이템과 비교하여 바뀐 부위만 반영 (같은 장비는 획득 여부 유지)
+    existing = {item.slot: item for item in equipment_set.items}
+    for slot, set_item in existing.items():
+        if slot not in requested:
+            equipment_set.items.remove(set_item)
+        elif set_item.equipment_id != requested[slot]:
+            set_item.equipment_id = requested[slot]
+    
+    for slot, equipment_id in requested.items():
+        if slot not in existing:
+            equipment_set.items.append(EquipmentSetItem(
+                equipment_id=equipment_id,
+                slot=slot
+            ))
+    
+    # 세트의 아이템 레벨은 교체 후 세트 아이템과 장비 테이블로 한 번만 계산
+    db.flush()
+    refresh_set_item_levels(db, set_id=set_id)
+    db.commit()
+    
+    return db.query(EquipmentSet).options(
+        selectinload(EquipmentSet.items).selectinload(EquipmentSetItem.equipment)
+    ).filter(EquipmentSet.id == set_id).first()
 
 @router.put("/sets/{set_id}/items/{item_id}", response_model=EquipmentSetItemSchema)
 def update_set_item(
@@ -423,6 +502,22 @@ def update_set_item(
     
     update_data = item_in.model_dump(exclude_unset=True)
     
+    # 장비가 바뀌면 카탈로그에서 확인 (아이템 레벨 증감은 장비 테이블로 계산)
+    removed_equipment_id = None
+    if update_data.get("equipment_id") is not None and update_data["equipment_id"] != set_item.equipment_id:
+        equipment = equipment_catalog.get(db, update_data["equipment_id"])
+        if not equipment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Equipment not found"
+            )
+        if equipment.slot != set_item.slot:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Equipment slot mismatch"
+            )
+        removed_equipment_id = set_item.equipment_id
+    
     # 획득 여부가 변경되고 True로 설정되면 획득 시간 기록
     if "is_obtained" in update_data and update_data["is_obtained"] and not set_item.is_obtained:
         from datetime import datetime, timezone
@@ -432,12 +527,13 @@ def update_set_item(
         setattr(set_item, field, value)
     
     db.add(set_item)
-    db.commit()
-    db.refresh(set_item)
     
-    # 세트의 아이템 레벨 재계산
-    _recalculate_set_item_level(db, equipment_set)
+    # 세트의 아이템 레벨에 바뀐 부위만 반영 (같은 트랜잭션)
+    if removed_equipment_id is not None:
+        apply_set_item_level_delta(db, set_id, set_item.equipment_id, removed_equipment_id)
     
+    db.commit()
+    db.refresh(set_item)
     return set_item
 
 @router.delete("/sets/{set_id}/items/{item_id}")
@@ -478,46 +574,10 @@ def remove_item_from_set(
             detail="Set item not found"
         )
     
+    # 제거한 부위만큼 세트의 아이템 레벨에서 차감 (같은 트랜잭션)
+    apply_set_item_level_delta(db, set_id, removed_equipment_id=set_item.equipment_id)
+    
     db.delete(set_item)
     db.commit()
     
-    # 세트의 아이템 레벨 재계산
-    _recalculate_set_item_level(db, equipment_set)
-    
     return {"message": "Item removed set successfully"}
-
-#SECTION - 유틸리티 함수
-
-def _recalculate_set_item_level(db: Session, equipment_set: EquipmentSet):
-    """
-    장비 세트의 평균 아이템 레벨 재계산
-    """
-    items = db.query(EquipmentSetItem).filter(
-        EquipmentSetItem.equipment_set_id == equipment_set.id
-    ).all()
-    
-    if not items:
-        equipment_set.total_item_level = 0
-    else:
-        total_level = 0
-        item_count = 0
-        
-        for item in items:
-            equipment = db.query(Equipment).filter(Equipment.id == item.equipment_id).first()
-            if equipment:
-                # 무기는 2개로 계산 (메인+보조)
-                if equipment.slot == ModelEquipmentSlot.WEAPON:
-                    total_level += equipment.item_level * 2
-                    item_count += 2
-                else:
-                    total_level += equipment.item_level
-                    item_count += 1
-        
-        # 전체 부위는 11개 (무기 2개로 계산)
-        if item_count > 0:
-            equipment_set.total_item_level = total_level // 11 # 실제 착용 부위 수로 나누기
-        else:
-            equipment_set.total_item_level = 0
-    
-    db.add(equipment_set)
-    db.commit()
\ No newline at end of file
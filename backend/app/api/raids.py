@@ -5,7 +5,7 @@ from sqlalchemy import and_
 
 from app.core import deps
 from app.models.user import User
-from app.models.raid import Raid, RaidGroup, RaidMember
+from app.models.raid import Raid, RaidGroup, RaidMember, DistributionMethod as ModelDistributionMethod
 from app.schemas.raid import (
     Raid as RaidSchema,
     RaidCreate,
@@ -154,7 +154,8 @@ def create_raid_group(
     
     # 공대 생성
     group = RaidGroup(
-        **group_in.model_dump(),
+        **group_in.model_dump(exclude={"distribution_method"}),
+        distribution_method=ModelDistributionMethod(group_in.distribution_method.value),
         raid_id=raid_id,
         leader_id=current_user.id
     )
@@ -220,6 +221,8 @@ def update_raid_group(
         )
     
     update_data = group_in.model_dump(exclude_unset=True)
+    if update_data.get("distribution_method") is not None:
+        update_data["distribution_method"] = ModelDistributionMethod(update_data["distribution_method"].value)
     for field, value in update_data.items():
         setattr(group, field, value)
     
@@ -385,13 +388,14 @@ def remove_raid_member(
             detail="Member not found"
         )
     
+    access = deps.get_group_access(group_id, current_user, db)
+    
     # 본인이 아니면 공대장 권한 필요
     if member.user_id != current_user.id:
-        current_user = deps.get_raid_group_leader(group_id, current_user, db)
+        current_user = access.require_leader()
     
     # 공대장은 탈퇴 불가
-    group = db.query(RaidGroup).filter(RaidGroup.id == group_id).first()
-    if member.user_id == group.leader_id:
+    if member.user_id == access.leader_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Leader cannot leave the raid group"
@@ -1,13 +1,15 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_,func, Integer, cast
-from datetime import datetime, date, timezone, timedelta
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, or_,func, Integer, cast, tuple_
+from datetime import datetime, date, time, timezone, timedelta
 
 from app.core import deps
 from app.models.user import User
-from app.models.raid import RaidGroup, RaidMember
-from app.models.raid_schedule import RaidSchedule, RaidAttendance
+from app.models.raid import RaidMember
+from app.models.raid_schedule import RaidSchedule, RaidAttendance, RecurrenceType as ModelRecurrenceType
+from app.utils import schedule as schedule_utils
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 from app.schemas.raid_schedule import (
     RaidSchedule as RaidScheduleSchema,
     RaidScheduleCreate,
@@ -22,11 +24,18 @@ from app.schemas.raid_schedule import (
 
 router = APIRouter()
 
+# 일정 응답에 포함되는 관계 데이터 (한 번에 로드)
+SCHEDULE_RESPONSE_OPTIONS = (
+    selectinload(RaidSchedule.created_by),
+    selectinload(RaidSchedule.attendances).selectinload(RaidAttendance.user)
+)
+
 #SECTION - 레이드 일정 관리
 
 @router.get("/groups/{group_id}/schedules", response_model=List[RaidScheduleSchema])
 def get_raid_schedules(
     group_id: int,
+    response: Response,
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
     is_confirmed: Optional[bool] = None,
@@ -34,11 +43,14 @@ def get_raid_schedules(
     is_cancelled: Optional[bool] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db)
 ):
     """
     레이드 일정 목록 조회
+    cursor를 주면 skip 대신 (날짜, 시작 시간, ID) 기준으로 이어서 조회
+    페이지가 가득 차면 다음 페이지 커서를 X-Next-Cursor 헤더로 반환
     """
     # 공대 멤버 확인
     current_user = deps.get_raid_group_member(group_id, current_user, db)
@@ -61,71 +73,90 @@ def get_raid_schedules(
     if is_cancelled is not None:
         query = query.filter(RaidSchedule.is_cancelled == is_cancelled)
     
-    # 날짜 기준 정렬
-    query = query.order_by(RaidSchedule.scheduled_date.asc(), RaidSchedule.start_time.asc())
-    
-    schedules = query.offset(skip).limit(limit).all()
+    # 날짜 기준 정렬 (같은 시각이면 ID 순)
+    query = query.order_by(RaidSchedule.scheduled_date.asc(), RaidSchedule.start_time.asc(), RaidSchedule.id.asc())
     
-    # 참석 인원 수 계산
-    for schedule in schedules:
-        schedule.confirmed_count = db.query(RaidAttendance).filter(
-            and_(
-                RaidAttendance.schedule_id == schedule.id,
-                RaidAttendance.status == AttendanceStatus.CONFIRMED
+    after = None
+    if cursor:
+        # 이전 페이지 마지막 항목 이후부터 인덱스로 바로 조회
+        try:
+            after = decode_cursor(cursor, (date, time, int))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
             )
-        ).count()
+        query = query.filter(
+            tuple_(RaidSchedule.scheduled_date, RaidSchedule.start_time, RaidSchedule.id) > tuple_(*after)
+        )
+        skip = 0
+    
+    # 가상 발생분은 확정/완료/취소 상태가 아님
+    occurrences = []
+    if not (is_confirmed or is_completed or is_cancelled):
+        occurrence_from = from_date
+        if after:
+            # 커서 날짜 이전 발생분은 계산하지 않음
+            occurrence_from = max(from_date, after[0]) if from_date else after[0]
+        occurrences = schedule_utils.get_virtual_occurrences(db, [group_id], occurrence_from, to_date)
+        if after:
+            occurrences = [occurrence for occurrence in occurrences if _schedule_sort_key(occurrence) > after]
+    
+    if not occurrences:
+        schedules = query.options(*SCHEDULE_RESPONSE_OPTIONS).offset(skip).limit(limit).all()
+    else:
+        # 페이지 앞에 올 수 있는 가상 발생분은 최대 len(occurrences)개이므로
+        # 저장된 일정은 그만큼 앞에서부터 정렬 키만 조회하여 합친 뒤 페이지를 나눔
+        stored_offset = max(0, skip - len(occurrences))
+        stored_keys = query.with_entities(
+            RaidSchedule.scheduled_date,
+            RaidSchedule.start_time,
+            RaidSchedule.id
+        ).offset(stored_offset).limit(skip + limit - stored_offset).all()
         
-        schedule.declined_count = db.query(RaidAttendance).filter(
-            and_(
-                RaidAttendance.schedule_id == schedule.id,
-                RaidAttendance.status == AttendanceStatus.DECLINED
-            )
-        ).count()
-    
+        page = sorted(
+            [(tuple(key), None) for key in stored_keys]
+            + [(_schedule_sort_key(occurrence), occurrence) for occurrence in occurrences],
+            key=lambda entry: (entry[0], entry[1] is not None)
+        )[skip - stored_offset:skip - stored_offset + limit]
+        
+        # 페이지에 들어간 저장된 일정만 관계 데이터와 함께 로드
+        page_ids = [key[2] for key, occurrence in page if occurrence is None]
+        stored = {}
+        if page_ids:
+            stored = {
+                schedule.id: schedule
+                for schedule in db.query(RaidSchedule).options(*SCHEDULE_RESPONSE_OPTIONS).filter(
+                    RaidSchedule.id.in_(page_ids)
+                )
+            }
+        schedules = [
+            occurrence if occurrence is not None else stored[key[2]]
+            for key, occurrence in page
+        ]
+    
+    if len(schedules) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(_schedule_sort_key(schedules[-1]))
     return schedules
 
 @router.get("/groups/{group_id}/schedules/{schedule_id}", response_model=RaidScheduleSchema)
 def get_raid_schedule(
     group_id: int,
     schedule_id: int,
+    occurrence_date: Optional[date] = None,
     current_user: User = Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db)
 ):
     """
     특정 레이드 일정 조회
+    반복 일정은 occurrence_date로 특정 발생분을 조회
     """
     # 공대 멤버 확인
     current_user = deps.get_raid_group_member(group_id, current_user, db)
     
-    schedule = db.query(RaidSchedule).filter(
-        and_(
-            RaidSchedule.id == schedule_id,
-            RaidSchedule.raid_group_id == group_id
-        )
-    ).first()
-    
-    if not schedule:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Schedule not found"
-        )
-    
-    # 참석 인원 수 계산
-    schedule.confirmed_count = db.query(RaidAttendance).filter(
-        and_(
-            RaidAttendance.schedule_id == schedule.id,
-            RaidAttendance.status == AttendanceStatus.CONFIRMED
-        )
-    ).count()
-    
-    schedule.declined_count = db.query(RaidAttendance).filter(
-        and_(
-            RaidAttendance.schedule_id == schedule.id,
-            RaidAttendance.status == AttendanceStatus.DECLINED
-        )
-    ).count()
+    schedule = get_group_schedule(db, group_id, schedule_id, with_relations=True)
     
-    return schedule
+    return resolve_occurrence(db, schedule, occurrence_date)
 
 @router.post("/groups/{group_id}/schedules", response_model=RaidScheduleSchema)
 def create_raid_schedule(
@@ -136,118 +167,56 @@ def create_raid_schedule(
 ):
     """
     새 레이드 일정 생성 (공대장 또는 일정 권한자)
-    반복 설정이 있으면 여러 일정을 생성합니다.
+    반복 일정은 반복 규칙만 저장하고 발생분은 조회 시 계산합니다.
     """
-    # 권한 확인 (기존 코드 유지)
-    member = db.query(RaidMember).filter(
-        and_(
-            RaidMember.raid_group_id == group_id,
-            RaidMember.user_id == current_user.id
-        )
-    ).first()
-    
-    if not member or not member.can_manage_schedule:
-        # 공대장인지 확인
-        group = db.query(RaidGroup).filter(
-            and_(
-                RaidGroup.id == group_id,
-                RaidGroup.leader_id == current_user.id
-            )
-        ).first()
-        
-        if not group:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to manage schedules"
-            )
-    
-    # 기본 일정 생성
-    schedule = RaidSchedule(
-        **schedule_in.model_dump(exclude={'recurrence_type', 'recurrence_end_date', 'recurrence_count', 'recurrence_days'}),
-        raid_group_id=group_id,
-        created_by_id=current_user.id,
-        recurrence_type=schedule_in.recurrence_type,
-        recurrence_end_date=schedule_in.recurrence_end_date,
-        recurrence_count=schedule_in.recurrence_count,
-        recurrence_days=schedule_in.recurrence_days
+    # 권한 확인 (공대장 또는 일정 권한자)
+    current_user = deps.get_group_access(group_id, current_user, db).require_schedule_manager()
+    
+    member_ids = [
+        user_id for (user_id,) in db.query(RaidMember.user_id).filter(
+            RaidMember.raid_group_id == group_id
+        ).all()
+    ]
+    
+    # 일정과 모든 공대원의 참석 레코드(응답 대기)를 한 트랜잭션에서 생성
+    schedule_id, = schedule_utils.create_schedules_with_attendances(
+        db,
+        [{
+            **schedule_in.model_dump(),
+            # Core INSERT는 변환하지 않으므로 요청 스키마의 반복 유형을 같은 값의 모델 반복 유형으로 변환
+            "recurrence_type": ModelRecurrenceType(schedule_in.recurrence_type.value),
+            "raid_group_id": group_id,
+            "created_by_id": current_user.id
+        }],
+        member_ids
     )
-    db.add(schedule)
     db.commit()
     
-    # 모든 공대원의 참석 레코드 생성
-    members = db.query(RaidMember).filter(
-        RaidMember.raid_group_id == group_id
-    ).all()
-    
-    for member in members:
-        attendance = RaidAttendance(
-            schedule_id=schedule.id,
-            user_id=member.user_id,
-            status=AttendanceStatus.PENDING
-        )
-        db.add(attendance)
-    
-    # 반복 일정 생성
-    if schedule_in.recurrence_type != RecurrenceType.NONE:
-        recurring_schedules = create_recurring_schedules(db, schedule, schedule_in)
-        
-        for recurring_schedule in recurring_schedules:
-            db.add(recurring_schedule)
-            db.flush()  # ID 생성을 위해
-            
-            # 각 반복 일정에 대한 참석 레코드 생성
-            for member in members:
-                attendance = RaidAttendance(
-                    schedule_id=recurring_schedule.id,
-                    user_id=member.user_id,
-                    status=AttendanceStatus.PENDING
-                )
-                db.add(attendance)
-    
-    db.commit()
-    db.refresh(schedule)
+    schedule = db.get(RaidSchedule, schedule_id)
     
-    schedule.confirmed_count = 0
-    schedule.declined_count = 0
     schedule.is_recurring = schedule_in.recurrence_type != RecurrenceType.NONE
     
     return schedule
 
-@router.put("/groups/{group_id}/schedules/{shcedule_id}", response_model=RaidScheduleSchema)
+@router.put("/groups/{group_id}/schedules/{schedule_id}", response_model=RaidScheduleSchema)
 def update_raid_schedule(
     group_id: int,
     schedule_id: int,
     schedule_in: RaidScheduleUpdate,
+    occurrence_date: Optional[date] = None,
     current_user: User = Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db)
 ):
     """
     레이드 일정 수정
+    반복 일정의 발생분(occurrence_date)을 수정하면 해당 발생분만 개별 일정으로 저장
     """
-    # 권한 확인 (위와 동일)
-    member = db.query(RaidMember).filter(
-        and_(
-            RaidMember.raid_group_id == group_id,
-            RaidMember.user_id == current_user.id
-        )
-    ).first()
-    
-    if not member or not member.can_manage_schedule:
-        current_user = deps.get_raid_group_leader(group_id, current_user, db)
+    # 권한 확인 (공대장 또는 일정 권한자)
+    current_user = deps.get_group_access(group_id, current_user, db).require_schedule_manager()
     
     # 일정 조회
-    schedule = db.query(RaidSchedule).filter(
-        and_(
-            RaidSchedule.id == schedule_id,
-            RaidSchedule.raid_group_id == group_id
-        )
-    ).first()
-    
-    if not schedule:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Schedule not found"
-        )
+    schedule = get_group_schedule(db, group_id, schedule_id)
+    schedule = resolve_occurrence(db, schedule, occurrence_date, materialize=True)
     
     update_data = schedule_in.model_dump(exclude_unset=True)
     
@@ -264,49 +233,35 @@ def update_raid_schedule(
     
     db.add(schedule)
     db.commit()
-    db.refresh(schedule)
-    
-    # 참석 인원 수 계산
-    schedule.confirmed_coutn = db.query(RaidAttendance).filter(
-        and_(
-            RaidAttendance.schedule_id == schedule.id,
-            RaidAttendance.status == AttendanceStatus.CONFIRMED
-        )
-    ).count()
-    
-    schedule.declined_count = db.query(RaidAttendance).filter(
-        and_(
-            RaidAttendance.schedule_id == schedule.id,
-            RaidAttendance.status == AttendanceStatus.DECLINED
-        )
-    ).count()
     
-    return schedule
+    # 응답용으로 관계 데이터와 함께 다시 조회
+    return get_group_schedule(db, group_id, schedule.id, with_relations=True)
 
 @router.delete("/groups/{group_id}/schedules/{schedule_id}")
 def delete_raid_schedule(
     group_id: int,
     schedule_id: int,
+    occurrence_date: Optional[date] = None,
     current_user: User = Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db)
 ):
     """
     레이드 일정 삭제 (공대장만)
+    반복 일정의 발생분(occurrence_date)은 삭제 대신 취소된 발생분으로 저장
+    반복 일정 자체를 삭제하면 저장된 발생분도 함께 삭제
     """
     current_user = deps.get_raid_group_leader(group_id, current_user, db)
     
-    schedule = db.query(RaidSchedule).filter(
-        and_(
-            RaidSchedule.id == schedule_id,
-            RaidSchedule.raid_group_id == group_id
-        )
-    ).first()
+    schedule = get_group_schedule(db, group_id, schedule_id)
     
-    if not schedule:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Schedule not found"
-        )
+    if occurrence_date is not None and occurrence_date != schedule.scheduled_date:
+        occurrence = resolve_occurrence(db, schedule, occurrence_date, materialize=True)
+        if not occurrence.is_cancelled:
+            occurrence.is_cancelled = True
+            occurrence.cancelled_at = datetime.now(timezone.utc)
+            db.commit()
+        
+        return {"message": "Schedule occurrence cancelled successfully"}
     
     db.delete(schedule)
     db.commit()
@@ -319,31 +274,26 @@ def delete_raid_schedule(
 def get_schedule_attendance(
     group_id: int,
     schedule_id: int,
+    occurrence_date: Optional[date] = None,
     current_user: User = Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db)
 ):
     """
     일정 참석 현황 조회
+    저장되지 않은 반복 일정 발생분은 참석 레코드가 없으므로 빈 목록
     """
     # 공대 멤버 확인
     current_user = deps.get_raid_group_member(group_id, current_user, db)
     
     # 일정 확인
-    schedule = db.query(RaidSchedule).filter(
-        and_(
-            RaidSchedule.id == schedule_id,
-            RaidSchedule.raid_group_id == group_id
-        )
-    ).first()
+    schedule = get_group_schedule(db, group_id, schedule_id)
+    schedule = resolve_occurrence(db, schedule, occurrence_date)
     
-    if not schedule:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Schedule not found"
-        )
+    if getattr(schedule, "is_virtual", False):
+        return []
     
     attendances = db.query(RaidAttendance).filter(
-        RaidAttendance.schedule_id == schedule_id
+        RaidAttendance.schedule_id == schedule.id
     ).all()
     
     return attendances
@@ -352,16 +302,22 @@ def get_schedule_attendance(
 def update_my_attendance(
     group_id: int,
     schedule_id: int,
-    attendance_in: RaidScheduleUpdate,
+    attendance_in: RaidAttendanceUpdate,
+    occurrence_date: Optional[date] = None,
     current_user: User = Depends(deps.get_current_active_user),
     db: Session = Depends(deps.get_db)
 ):
     """
     내 참석 여부 업데이트
+    반복 일정의 발생분(occurrence_date)에 응답하면 해당 발생분을 개별 일정으로 저장
     """
     # 공대 멤버 확인
     current_user = deps.get_raid_group_member(group_id, current_user, db)
     
+    if occurrence_date is not None:
+        schedule = get_group_schedule(db, group_id, schedule_id)
+        schedule_id = resolve_occurrence(db, schedule, occurrence_date, materialize=True).id
+    
     # 참석 레코드 조회
     attendance = db.query(RaidAttendance).filter(
         and_(
@@ -378,8 +334,9 @@ def update_my_attendance(
     
     update_data = attendance_in.model_dump(exclude_unset=True)
     
-    # 응답 시간 기록
-    if "status" in update_data and update_data["status"] != attendance.status:
+    # 상태 변경 및 인원 수 갱신, 응답 시간 기록
+    new_status = update_data.pop("status", None)
+    if new_status is not None and schedule_utils.set_attendance_status(db, attendance, new_status):
         attendance.responded_at = datetime.now(timezone.utc)
     
     for field, value in update_data.items():
@@ -397,22 +354,19 @@ def update_member_attendance(
     schedule_id: int,
     user_id: int,
     attendance_in: RaidAttendanceUpdate,
+    occurrence_date: Optional[date] = None,
     current_user: User = Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db)
 ):
     """
     멤버 참석 여부 업데이트 (공대장 또는 일정 권한자)
     """
-    # 권한 확인
-    member = db.query(RaidMember).filter(
-        and_(
-            RaidMember.raid_group_id == group_id,
-            RaidMember.user_id == current_user.id
-        )
-    ).first()
+    # 권한 확인 (공대장 또는 일정 권한자)
+    current_user = deps.get_group_access(group_id, current_user, db).require_schedule_manager()
     
-    if not member or not member.can_manage_schedule:
-        current_user = deps.get_raid_group_leader(group_id, current_user, db)
+    if occurrence_date is not None:
+        schedule = get_group_schedule(db, group_id, schedule_id)
+        schedule_id = resolve_occurrence(db, schedule, occurrence_date, materialize=True).id
     
     # 참석 레코드 조회
     attendance = db.query(RaidAttendance).filter(
@@ -429,6 +383,12 @@ def update_member_attendance(
         )
     
     update_data = attendance_in.model_dump(exclude_unset=True)
+    
+    # 상태 변경 및 인원 수 갱신
+    new_status = update_data.pop("status", None)
+    if new_status is not None:
+        schedule_utils.set_attendance_status(db, attendance, new_status)
+    
     for field, value in update_data.items():
         setattr(attendance, field, value)
     
@@ -477,44 +437,32 @@ def get_schedule_dashboard(
             RaidSchedule.scheduled_date <= end_date,
             RaidSchedule.is_cancelled == False
         )
+    ).options(
+        selectinload(RaidSchedule.created_by),
+        selectinload(RaidSchedule.attendances).selectinload(RaidAttendance.user)
     ).order_by(
         RaidSchedule.scheduled_date.asc(),
         RaidSchedule.start_time.asc()
     ).all()
     
-    # 과거/미래 일정 분리
+    # 내 참석 상태 (참석 레코드는 응답에 포함되므로 미리 로드된 목록에서 확인)
+    my_attendance = {}
+    
+    for schedule in schedules:
+        for attendance in schedule.attendances:
+            if attendance.user_id == current_user.id:
+                my_attendance[schedule.id] = attendance.status
+                break
+    
+    # 반복 일정의 저장되지 않은 발생분 (응답 전이므로 내 참석 상태 없음)
+    schedules += schedule_utils.get_virtual_occurrences(db, group_ids, start_date, end_date)
+    schedules.sort(key=_schedule_sort_key)
+    
+    # 과거/미래 일정 분리 (메모리에서 처리)
     upcoming = []
     past = []
-    my_attendance = {}
     
     for schedule in schedules:
-        # 참석 인원 수 계산
-        schedule.confirmed_count = db.query(RaidAttendance).filter(
-            and_(
-                RaidAttendance.schedule_id == schedule.id,
-                RaidAttendance.status == AttendanceStatus.CONFIRMED
-            )
-        ).count()
-        
-        schedule.declined_count = db.query(RaidAttendance).filter(
-            and_(
-                RaidAttendance.schedule_id == schedule.id,
-                RaidAttendance.status == AttendanceStatus.DECLINED
-            )
-        ).count()
-        
-        # 내 참석 상태
-        my_att = db.query(RaidAttendance).filter(
-            and_(
-                RaidAttendance.schedule_id == schedule.id,
-                RaidAttendance.user_id == current_user.id
-            )
-        ).first()
-        
-        if my_att:
-            my_attendance[schedule.id] = my_att.status
-        
-        # 과거/미래 분리
         if schedule.scheduled_date < today or schedule.is_completed:
             past.append(schedule)
         else:
@@ -594,98 +542,88 @@ def get_attendance_statistics(
     
     return {"statistics": result}
 
-def create_recurring_schedules(
+#SECTION - 관리자
+
+@router.get("/admin/attendance-counts/check")
+def check_attendance_counts(
+    raid_group_id: Optional[int] = None,
+    current_user: User = Depends(deps.get_current_admin_user),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    일정별 참석 인원 수 정합성 확인 (관리자만)
+    복구는 `python manage.py repair-attendance-counts`로 실행
+    """
+    mismatches = schedule_utils.find_attendance_count_mismatches(db, raid_group_id)
+    
+    return {
+        "is_consistent": not mismatches,
+        "mismatch_count": len(mismatches),
+        "mismatches": mismatches
+    }
+
+#SECTION - 유틸리티 함수
+
+def get_group_schedule(
     db: Session,
-    base_schedule: RaidSchedule,
-    rule: RaidScheduleCreate
-) -> List[RaidSchedule]:
+    group_id: int,
+    schedule_id: int,
+    with_relations: bool = False
+) -> RaidSchedule:
     """
-    반복 규칙에 따라 여러 일정 생성
+    공대의 일정 조회 (없으면 404)
+    with_relations면 응답에 포함되는 작성자/참석 정보도 함께 로드
     """
-    schedules = []
-    current_date = base_schedule.scheduled_date
-    end_date = rule.recurrence_end_date
-    count = rule.recurrence_count or 52  # 기본값 52주
-    created_count = 0
-    
-    # 선택된 요일 파싱
-    selected_days = []
-    if rule.recurrence_days and rule.recurrence_type == RecurrenceType.WEEKLY:
-        selected_days = [int(d) for d in rule.recurrence_days.split(',')]
-    
-    while created_count < count:
-        # 종료일 체크
-        if end_date and current_date > end_date:
-            break
-        
-        # 반복 유형에 따른 처리
-        if rule.recurrence_type == RecurrenceType.DAILY:
-            # 매일
-            current_date += timedelta(days=1)
-        elif rule.recurrence_type == RecurrenceType.WEEKLY:
-            # 매주
-            if selected_days:
-                # 선택된 요일만
-                found = False
-                for _ in range(7):
-                    current_date += timedelta(days=1)
-                    if current_date.weekday() in selected_days:
-                        found = True
-                        break
-                if not found:
-                    continue
-            else:
-                # 7일 후
-                current_date += timedelta(days=7)
-        elif rule.recurrence_type == RecurrenceType.BIWEEKLY:
-            # 격주
-            current_date += timedelta(days=14)
-        elif rule.recurrence_type == RecurrenceType.MONTHLY:
-            # 매월 같은 날
-            # 월의 마지막 날 처리
-            next_month = current_date.month + 1
-            next_year = current_date.year
-            if next_month > 12:
-                next_month = 1
-                next_year += 1
-            
-            try:
-                current_date = current_date.replace(month=next_month, year=next_year)
-            except ValueError:
-                # 예: 1월 31일 -> 2월 31일이 없는 경우
-                # 해당 월의 마지막 날로 설정
-                import calendar
-                last_day = calendar.monthrange(next_year, next_month)[1]
-                current_date = current_date.replace(
-                    month=next_month, 
-                    year=next_year, 
-                    day=last_day
-                )
-        
-        # 일정 생성
-        new_schedule = RaidSchedule(
-            raid_group_id=base_schedule.raid_group_id,
-            created_by_id=base_schedule.created_by_id,
-            title=base_schedule.title,
-            description=base_schedule.description,
-            scheduled_date=current_date,
-            start_time=base_schedule.start_time,
-            end_time=base_schedule.end_time,
-            target_floors=base_schedule.target_floors,
-            minimum_members=base_schedule.minimum_members,
-            notes=base_schedule.notes,
-            recurrence_type=base_schedule.recurrence_type,
-            recurrence_end_date=base_schedule.recurrence_end_date,
-            recurrence_count=base_schedule.recurrence_count,
-            recurrence_days=base_schedule.recurrence_days,
-            parent_schedule_id=base_schedule.id
+    query = db.query(RaidSchedule).filter(
+        and_(
+            RaidSchedule.id == schedule_id,
+            RaidSchedule.raid_group_id == group_id
         )
-        
-        schedules.append(new_schedule)
-        created_count += 1
-        
-        # 너무 많은 일정 생성 방지
-        if created_count >= 100:
-            break
+    )
+    if with_relations:
+        query = query.options(*SCHEDULE_RESPONSE_OPTIONS)
+    schedule = query.first()
     
-    return schedules
\ No newline at end of file
+    if not schedule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule not found"
+        )
+    
+    return schedule
+
+def resolve_occurrence(
+    db: Session,
+    schedule: RaidSchedule,
+    occurrence_date: Optional[date],
+    materialize: bool = False
+):
+    """
+    반복 일정의 특정 발생분 조회
+    저장된 발생분이 있으면 그 일정을, 없으면 가상 발생분(또는 materialize 시 새로 저장한 일정)을 반환
+    """
+    if occurrence_date is None or occurrence_date == schedule.scheduled_date:
+        return schedule
+    
+    if not schedule_utils.is_recurring_series(schedule) or not schedule_utils.is_occurrence_date(schedule, occurrence_date):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule occurrence not found"
+        )
+    
+    if materialize:
+        return schedule_utils.materialize_occurrence(db, schedule, occurrence_date)
+    
+    occurrence = schedule_utils.get_occurrence_override(db, schedule, occurrence_date)
+    if occurrence:
+        return occurrence
+    
+    member_count = db.query(func.count(RaidMember.id)).filter(
+        RaidMember.raid_group_id == schedule.raid_group_id
+    ).scalar()
+    return schedule_utils.build_virtual_occurrence(schedule, occurrence_date, member_count)
+
+def _schedule_sort_key(schedule):
+    """일정 정렬 기준 (날짜, 시작 시간, ID - 가상 발생분은 원본 일정 ID)"""
+    schedule_id = schedule.id if schedule.id is not None else schedule.parent_schedule_id
+    return (schedule.scheduled_date, schedule.start_time, schedule_id)
@@ -15,6 +15,32 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080 # 7일
     
+    # 인증 캐시 설정
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000 # 최대 캐시 항목 수
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60 # 캐시 유지 시간 (0이면 비활성화)
+    
+    # 비밀번호 해시 설정
+    PASSWORD_HASH_WORKERS: int = 2 # bcrypt 전용 프로세스 수 (0이면 요청 스레드에서 실행)
+    PASSWORD_HASH_MAX_PENDING: int = 8 # 최대 대기 작업 수 (초과 시 503, 워커 스레드 수의 1/4까지만 허용)
+    
+    # 장비 카탈로그 설정
+    EQUIPMENT_CATALOG_TTL_SECONDS: int = 300 # 다른 워커의 장비 변경 반영 주기 (0이면 무효화 시에만 갱신)
+    EQUIPMENT_CATALOG_MISS_RELOAD_SECONDS: int = 10 # 없는 장비 ID 조회 시 다시 읽는 최소 간격
+    
+    # 분배 우선순위 점수 가중치
+    PRIORITY_WEIGHT_ITEM_NEED: float = 1000.0 # 해당 아이템 남은 필요량
+    PRIORITY_WEIGHT_TOTAL_NEED: float = 1.0 # 전체 남은 필요량
+    PRIORITY_WEIGHT_ATTENDANCE: float = 0.0 # 실제 참석률 (0~1)
+    PRIORITY_WEIGHT_PREVIOUS_LOOT: float = 0.0 # 지금까지 획득한 아이템 수 (감점)
+    
+    # BIS 도달 예측 시뮬레이션 설정
+    FORECAST_WORKERS: int = 2 # 시뮬레이션 전용 프로세스 수 (0이면 현재 프로세스에서 실행)
+    FORECAST_MAX_SIMULATIONS: int = 20000 # 요청당 최대 시뮬레이션 수
+    FORECAST_MAX_WEEKS: int = 104 # 최대 시뮬레이션 주차
+    
+    # 분배 이벤트 로그 설정
+    DISTRIBUTION_SNAPSHOT_INTERVAL: int = 100 # 스냅샷 사이 최대 이벤트 수 (상태 재구성 시 적용할 이벤트 수 상한)
+    
     # 서버 설정
     HOST: str = "0.0.0.0"
     PORT: int = 8000
@@ -29,6 +55,7 @@ class Settings(BaseSettings):
     # 페이지네이션
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
+    EXPORT_CHUNK_SIZE: int = 1000 # 내보내기 시 한 번에 읽어 전송하는 행 수
     
     # 파일 업로드
     MAX_UPLOAD_SIZE: int = 5 * 1024 * 1024 # 5MB
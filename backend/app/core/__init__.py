@@ -9,8 +9,12 @@ from app.core.deps import (
     get_current_active_user,
     get_current_admin_user,
     get_raid_group_member,
-    get_raid_group_leader
+    get_raid_group_leader,
+    get_group_access,
+    GroupAccess
 )
+from app.core.principal_cache import principal_cache
+from app.core.equipment_catalog import equipment_catalog
 
 __all__ = [
     # Security
@@ -23,5 +27,10 @@ __all__ = [
     "get_current_active_user",
     "get_current_admin_user",
     "get_raid_group_member",
-    "get_raid_group_leader"
+    "get_raid_group_leader",
+    "get_group_access",
+    "GroupAccess",
+    # Cache
+    "principal_cache",
+    "equipment_catalog"
 ]
\ No newline at end of file
@@ -1,14 +1,18 @@
 from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status
+from fastapi.exceptions import ResponseValidationError
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.exc import ObjectDeletedError
 
 from app.config import settings
 from app.database import SessionLocal
 from app.models.user import User
 from app.models.raid import RaidMember, RaidGroup
 from app.schemas.user import TokenData
+from app.core.principal_cache import principal_cache
 
 # OAuth2 스키마 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -26,7 +30,7 @@ def get_db() -> Generator:
 def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme)
-) -> User:
+) -> Generator[User, None, None]:
     """
     현재 로그인한 사용자 가져오기
 
@@ -46,6 +50,27 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    # 캐시된 사용자 정보가 있으면 디코드와 조회 생략
+    snapshot = principal_cache.get(token)
+    if snapshot is not None:
+        if not snapshot.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Inactive user"
+            )
+        user = _attach_user_snapshot(db, snapshot.user_id, snapshot.is_active, snapshot.is_admin)
+        try:
+            yield user
+        except (ObjectDeletedError, ResponseValidationError):
+            # 캐시 유지 시간 안에 삭제된 사용자는 지연 로딩 시점에 인증 실패로 처리
+            # (응답 직렬화 중 지연 로딩 오류는 ResponseValidationError로 감싸짐)
+            db.rollback()
+            if db.query(User.id).filter(User.id == snapshot.user_id).first() is not None:
+                raise
+            principal_cache.invalidate_user(snapshot.user_id)
+            raise credentials_exception
+        return
+    
     try:
         # 토큰 디코드
         payload = jwt.decode(
@@ -57,7 +82,7 @@ def get_current_user(
         if user_id is None:
             raise credentials_exception
         token_data = TokenData(user_id=user_id)
-    except (JWTError, ValueError):
+    except (JWTError, ValueError, TypeError):
         raise credentials_exception
     
     # 사용자 조회
@@ -65,6 +90,14 @@ def get_current_user(
     if user is None:
         raise credentials_exception
     
+    principal_cache.put(
+        token,
+        user_id=user.id,
+        is_active=user.is_active,
+        is_admin=user.is_admin,
+        token_expires_at=payload.get("exp")
+    )
+    
     # 비활성 사용자 체크
     if not user.is_active:
         raise HTTPException(
@@ -72,6 +105,20 @@ def get_current_user(
             detail="Inactive user"
         )
     
+    yield user
+
+def _attach_user_snapshot(db: Session, user_id: int, is_active: bool, is_admin: bool) -> User:
+    """
+    캐시된 스냅샷으로 세션에 연결된 사용자 객체 생성
+    스냅샷에 없는 필드는 처음 접근할 때 지연 로딩됨
+    """
+    user = db.identity_map.get(db.identity_key(User, user_id))
+    if user is not None:
+        return user
+    
+    user = User(id=user_id, is_active=is_active, is_admin=is_admin)
+    make_transient_to_detached(user)
+    db.add(user)
     return user
 
 def get_current_active_user(
@@ -100,6 +147,124 @@ def get_current_admin_user(
         )
     return current_user
 
+class GroupAccess:
+    """
+    공대에 대한 현재 사용자의 권한 정보
+    멤버 여부, 공대장 여부, 일정/분배 관리 권한을 한 번의 조회로 확인
+    """
+    
+    def __init__(
+        self,
+        raid_group_id: int,
+        user: User,
+        leader_id: Optional[int] = None,
+        member_id: Optional[int] = None,
+        member_can_manage_schedule: bool = False,
+        member_can_manage_distribution: bool = False,
+        distribution_method=None
+    ):
+        self.raid_group_id = raid_group_id
+        self.user = user
+        self.leader_id = leader_id
+        self.distribution_method = distribution_method
+        self.member_id = member_id
+        self.group_exists = leader_id is not None
+        self.is_member = member_id is not None
+        self.is_leader = self.group_exists and leader_id == user.id
+        self.can_manage_schedule = self.is_leader or (self.is_member and bool(member_can_manage_schedule))
+        self.can_manage_distribution = self.is_leader or (self.is_member and bool(member_can_manage_distribution))
+    
+    def require_member(self) -> User:
+        """공대 멤버가 아니면 403"""
+        if not self.is_member:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not a member of this raid group"
+            )
+        return self.user
+    
+    def require_leader(self) -> User:
+        """공대장이 아니면 403"""
+        if not self.is_leader:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not the leader of this raid group"
+            )
+        return self.user
+    
+    def require_schedule_manager(self) -> User:
+        """공대장 또는 일정 권한자가 아니면 403"""
+        if not self.can_manage_schedule:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to manage schedules"
+            )
+        return self.user
+    
+    def require_distribution_manager(self) -> User:
+        """공대장 또는 분배 권한자가 아니면 403"""
+        if not self.can_manage_distribution:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to manage distribution"
+            )
+        return self.user
+
+def get_group_access(
+    group_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> GroupAccess:
+    """
+    공대 권한 정보 조회
+    공대와 멤버 정보를 하나의 조인 쿼리로 가져오며,
+    같은 요청(세션) 안에서는 결과를 재사용
+
+    Args:
+        group_id: 공대 ID
+        current_user: 현재 사용자
+        db: 데이터베이스 세션
+
+    Returns:
+        GroupAccess 객체
+    """
+    cache_key = ("group_access", group_id, current_user.id)
+    access = db.info.get(cache_key)
+    if access is not None:
+        return access
+    
+    row = db.query(
+        RaidGroup.leader_id,
+        RaidMember.id,
+        RaidMember.can_manage_schedule,
+        RaidMember.can_manage_distribution,
+        RaidGroup.distribution_method
+    ).outerjoin(
+        RaidMember,
+        and_(
+            RaidMember.raid_group_id == RaidGroup.id,
+            RaidMember.user_id == current_user.id
+        )
+    ).filter(
+        RaidGroup.id == group_id
+    ).first()
+    
+    if row is None:
+        access = GroupAccess(group_id, current_user)
+    else:
+        access = GroupAccess(
+            group_id,
+            current_user,
+            leader_id=row[0],
+            member_id=row[1],
+            member_can_manage_schedule=row[2],
+            member_can_manage_distribution=row[3],
+            distribution_method=row[4]
+        )
+    
+    db.info[cache_key] = access
+    return access
+
 def get_raid_group_member(
     raid_group_id: int,
     current_user: User = Depends(get_current_user),
@@ -119,18 +284,7 @@ def get_raid_group_member(
     Raises:
         HTTPException: 공대 멤버가 아닌 경우
     """
-    member = db.query(RaidMember).filter(
-        RaidMember.raid_group_id == raid_group_id,
-        RaidMember.user_id == current_user.id
-    ).first()
-    
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this raid group"
-        )
-    
-    return current_user
+    return get_group_access(raid_group_id, current_user, db).require_member()
 
 def get_raid_group_leader(
     raid_group_id: int,
@@ -151,15 +305,4 @@ def get_raid_group_leader(
     Raises:
         HTTPException: 공대장이 아닌 경우
     """
-    raid_group = db.query(RaidGroup).filter(
-        RaidGroup.id == raid_group_id,
-        RaidGroup.leader_id == current_user.id
-    ).first()
-    
-    if not raid_group:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not the leader of this raid group"
-        )
-    
-    return current_user
\ No newline at end of file
+    return get_group_access(raid_group_id, current_user, db).require_leader()
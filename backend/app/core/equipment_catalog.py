@@ -0,0 +1,143 @@
+import time
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.equipment import Equipment, EquipmentSlot, EquipmentType
+
+
+@dataclass(frozen=True)
+class EquipmentRecord:
+    """
+    재화/아이템 레벨 계산에 필요한 장비 정보
+    """
+    id: int
+    name: str
+    slot: EquipmentSlot
+    equipment_type: EquipmentType
+    item_level: int
+    tome_cost: int
+
+
+class EquipmentCatalog:
+    """
+    장비 카탈로그 (프로세스 내 읽기 전용 캐시)
+    장비 목록은 관리자만 수정하므로 한 번에 모두 읽어 두고
+    계산 시 장비마다 조회하지 않도록 함
+    """
+    
+    def __init__(self, ttl_seconds: int, miss_reload_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.miss_reload_seconds = miss_reload_seconds
+        self._records: Optional[Dict[int, EquipmentRecord]] = None
+        self._loaded_at = 0.0
+        self._generation = 0
+        # 마지막으로 읽었을 때 없던 장비 ID (다시 읽을 때까지 재조회하지 않음)
+        self._missing_ids: Set[int] = set()
+        self._miss_reload_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _is_fresh(self) -> bool:
+        if self._records is None:
+            return False
+        # TTL은 다른 워커 프로세스에서 수정한 내용을 반영하기 위함
+        return self.ttl_seconds <= 0 or time.monotonic() - self._loaded_at < self.ttl_seconds
+    
+    def _load(self, db: Session) -> Dict[int, EquipmentRecord]:
+        with self._lock:
+            generation = self._generation
+        
+        rows = db.query(
+            Equipment.id,
+            Equipment.name,
+            Equipment.slot,
+            Equipment.equipment_type,
+            Equipment.item_level,
+            Equipment.tome_cost
+        ).all()
+        records = {
+            row.id: EquipmentRecord(
+                id=row.id,
+                name=row.name,
+                slot=row.slot,
+                equipment_type=row.equipment_type,
+                item_level=row.item_level,
+                tome_cost=row.tome_cost or 0
+            )
+            for row in rows
+        }
+        
+        with self._lock:
+            # 읽는 도중 무효화되었다면 저장하지 않음 (다음 조회에서 다시 읽음)
+            if generation == self._generation:
+                self._records = records
+                self._loaded_at = time.monotonic()
+                self._missing_ids = set()
+        return records
+    
+    def _should_reload_for(self, missing_ids: Set[int]) -> bool:
+        # 없는 ID로 전체 카탈로그를 반복해서 읽지 않도록
+        # 이미 없다고 확인된 ID는 건너뛰고, 재조회는 miss_reload_seconds에 한 번만 허용
+        with self._lock:
+            if missing_ids <= self._missing_ids:
+                return False
+            now = time.monotonic()
+            if now - self._miss_reload_at < self.miss_reload_seconds:
+                return False
+            self._miss_reload_at = now
+            return True
+    
+    def _get_records(self, db: Session) -> Dict[int, EquipmentRecord]:
+        with self._lock:
+            if self._is_fresh():
+                return self._records
+        return self._load(db)
+    
+    def get_many(self, db: Session, equipment_ids: Iterable[int]) -> Dict[int, EquipmentRecord]:
+        """
+        여러 장비 정보 조회
+        없는 ID는 제외하고 반환하므로 호출자가 404/400으로 처리
+        
+        Args:
+            db: 데이터베이스 세션 (카탈로그를 읽어야 할 때만 사용)
+            equipment_ids: 장비 ID 목록
+        
+        Returns:
+            장비 ID별 장비 정보 (없는 ID는 제외)
+        """
+        equipment_ids = set(equipment_ids)
+        records = self._get_records(db)
+        
+        # 다른 프로세스에서 추가된 장비일 수 있으므로 한 번 다시 읽음
+        missing_ids = equipment_ids - records.keys()
+        if missing_ids and self._should_reload_for(missing_ids):
+            records = self._load(db)
+            with self._lock:
+                self._missing_ids |= equipment_ids - records.keys()
+        
+        return {
+            equipment_id: records[equipment_id]
+            for equipment_id in equipment_ids
+            if equipment_id in records
+        }
+    
+    def get(self, db: Session, equipment_id: int) -> Optional[EquipmentRecord]:
+        """장비 정보 조회"""
+        return self.get_many(db, [equipment_id]).get(equipment_id)
+    
+    def invalidate(self) -> None:
+        """카탈로그 무효화 (장비 생성/수정/삭제 후 호출)"""
+        with self._lock:
+            self._records = None
+            self._generation += 1
+            self._missing_ids = set()
+
+
+# 애플리케이션 전역 장비 카탈로그
+equipment_catalog = EquipmentCatalog(
+    ttl_seconds=settings.EQUIPMENT_CATALOG_TTL_SECONDS,
+    miss_reload_seconds=settings.EQUIPMENT_CATALOG_MISS_RELOAD_SECONDS
+)
@@ -0,0 +1,56 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Optional
+
+from app.config import settings
+from app.utils.forecast import SIMULATION_CHUNK_SIZE, forecast_weeks_to_bis
+
+
+class ForecastService:
+    """
+    BIS 도달 주차 예측 서비스
+    시뮬레이션 묶음을 별도 프로세스 풀에 나누어 실행하여
+    CPU를 오래 쓰는 예측 요청이 다른 API 요청을 막지 않도록 함
+    """
+    
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+    
+    def _get_executor(self) -> Optional[Executor]:
+        # 워커 수가 0이면 현재 프로세스에서 실행
+        if self.max_workers <= 0:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+    
+    def forecast(self, simulations: int, **kwargs) -> Dict:
+        """
+        BIS 도달 주차 예측 (인자는 forecast_weeks_to_bis 참고)
+        
+        Args:
+            simulations: 시뮬레이션 수
+        
+        Returns:
+            forecast_weeks_to_bis 결과
+        """
+        executor = None
+        # 묶음이 하나뿐이면 프로세스 간 전달 비용이 더 크므로 현재 프로세스에서 실행
+        if simulations > SIMULATION_CHUNK_SIZE:
+            executor = self._get_executor()
+        
+        return forecast_weeks_to_bis(
+            simulations=simulations,
+            map_chunks=executor.map if executor else map,
+            **kwargs
+        )
+    
+    def shutdown(self) -> None:
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 애플리케이션 전역 예측 서비스
+forecast_service = ForecastService(max_workers=settings.FORECAST_WORKERS)
@@ -0,0 +1,103 @@
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from app.config import settings
+from app.core import security
+
+# 동기 핸들러를 실행하는 워커 스레드 수 (anyio 기본값)
+THREADPOOL_SIZE = 40
+
+
+class PasswordService:
+    """
+    비밀번호 해시/검증 서비스
+    bcrypt 연산을 별도 프로세스 풀에서 실행하여
+    로그인이 몰려도 다른 API 요청이 밀리지 않도록 함
+    (동기 핸들러의 워커 스레드에서 호출하며 이벤트 루프에서 호출하지 않음)
+    
+    대기 중인 작업은 결과가 나올 때까지 워커 스레드를 점유하므로
+    대기 작업 수를 스레드 수의 1/4 이하로 제한하고 초과분은 점유 전에 거절
+    """
+    
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max(1, min(max_pending, THREADPOOL_SIZE // 4))
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def pending(self) -> int:
+        """처리 대기 중인 작업 수"""
+        return self._pending
+    
+    def _get_executor(self) -> Optional[Executor]:
+        # 워커 수가 0이면 호출한 스레드에서 실행
+        if self.max_workers <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+    
+    def _run(self, func, *args):
+        with self._lock:
+            # 대기열이 가득 차면 즉시 거절 (백프레셔)
+            if self._pending >= self.max_pending:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many concurrent password operations, please retry",
+                    headers={"Retry-After": "1"}
+                )
+            self._pending += 1
+        
+        try:
+            executor = self._get_executor()
+            if executor is None:
+                return func(*args)
+            return executor.submit(func, *args).result()
+        finally:
+            with self._lock:
+                self._pending -= 1
+    
+    def hash(self, password: str) -> str:
+        """
+        비밀번호 해시 생성
+        
+        Args:
+            password: 평문 비밀번호
+        
+        Returns:
+            해시된 비밀번호
+        """
+        return self._run(security.get_password_hash, password)
+    
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        비밀번호 검증
+        
+        Args:
+            plain_password: 평문 비밀번호
+            hashed_password: 해시된 비밀번호
+        
+        Returns:
+            일치 여부
+        """
+        return self._run(security.verify_password, plain_password, hashed_password)
+    
+    def shutdown(self) -> None:
+        """프로세스 풀 종료"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# 애플리케이션 전역 비밀번호 서비스
+password_service = PasswordService(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
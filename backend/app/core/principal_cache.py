@@ -0,0 +1,151 @@
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+from sqlalchemy import event
+
+from app.config import settings
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class PrincipalSnapshot:
+    """
+    검증된 토큰의 주체와 최소한의 사용자 정보
+    """
+    user_id: int
+    is_active: bool
+    is_admin: bool
+    expires_at: float
+
+
+class PrincipalCache:
+    """
+    검증된 사용자(principal) 캐시
+    토큰 서명을 키로 디코드 결과와 사용자 스냅샷을 저장하여
+    요청마다 반복되는 jwt.decode와 사용자 조회를 생략
+    """
+    
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, PrincipalSnapshot]" = OrderedDict()
+        self._keys_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key_for(token: str) -> str:
+        """토큰의 서명 부분을 캐시 키로 사용"""
+        return token.rsplit(".", 1)[-1]
+    
+    def get(self, token: str) -> Optional[PrincipalSnapshot]:
+        """
+        캐시된 스냅샷 조회 (만료된 항목은 제거)
+        """
+        key = self.key_for(token)
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is None:
+                self.misses += 1
+                return None
+            if snapshot.expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return snapshot
+    
+    def put(
+        self,
+        token: str,
+        user_id: int,
+        is_active: bool,
+        is_admin: bool,
+        token_expires_at: Optional[float] = None
+    ) -> None:
+        """
+        스냅샷 저장
+        
+        Args:
+            token: JWT 토큰
+            user_id: 사용자 ID
+            is_active: 활성 여부
+            is_admin: 관리자 여부
+            token_expires_at: 토큰 만료 시각 (epoch 초)
+        """
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        
+        ttl = self.ttl_seconds
+        if token_expires_at is not None:
+            ttl = min(ttl, token_expires_at - time.time())
+            if ttl <= 0:
+                return
+        
+        key = self.key_for(token)
+        snapshot = PrincipalSnapshot(
+            user_id=user_id,
+            is_active=is_active,
+            is_admin=is_admin,
+            expires_at=time.monotonic() + ttl
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = snapshot
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            
+            # 용량 초과 시 가장 오래 사용되지 않은 항목부터 제거
+            while len(self._entries) > self.max_size:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+    
+    def invalidate_user(self, user_id: int) -> None:
+        """특정 사용자의 모든 캐시 항목 제거"""
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+    
+    def clear(self) -> None:
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/실패 통계 반환"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size
+            }
+    
+    def _remove(self, key: str) -> None:
+        snapshot = self._entries.pop(key, None)
+        if snapshot is None:
+            return
+        keys = self._keys_by_user.get(snapshot.user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[snapshot.user_id]
+
+
+# 애플리케이션 전역 캐시 인스턴스
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, target) -> None:
+    """사용자 삭제 시 해당 사용자의 캐시 항목 제거"""
+    principal_cache.invalidate_user(target.id)
@@ -3,6 +3,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.api import api_router
 from app.database import engine, Base
+from app.core.password_service import password_service
+from app.core.forecast_service import forecast_service
 
 # 데이터베이스 테이블 생성 (개발 환경용)
 # 프로덕션에서는 Alembic 마이그레이션 사용
@@ -24,11 +26,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 커서 페이지네이션의 다음 페이지 커서
+    expose_headers=["X-Next-Cursor"],
 )
 
 # API 라우터 포함
 app.include_router(api_router, prefix="/api")
 
+# 종료 시 비밀번호 해시 프로세스 풀 정리
+@app.on_event("shutdown")
+def shutdown_password_service():
+    password_service.shutdown()
+
+# 종료 시 BIS 예측 프로세스 풀 정리
+@app.on_event("shutdown")
+def shutdown_forecast_service():
+    forecast_service.shutdown()
+
 # 루트 엔드포인트
 @app.get("/")
 def read_root():
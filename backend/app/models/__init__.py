@@ -2,7 +2,7 @@
 from app.models.user import User
 from app.models.raid import Raid, RaidGroup, RaidMember
 from app.models.equipment import Equipment, EquipmentSet, EquipmentSetItem
-from app.models.item_distribution import ItemDistribution, DistributionHistory
+from app.models.item_distribution import ItemDistribution, ItemDistributionPriority, ItemDistributionCompletion, DistributionHistory, DistributionWeeklyRollup, DistributionEvent, DistributionSnapshot
 from app.models.raid_schedule import RaidSchedule
 
 __all__ = [
@@ -14,6 +14,11 @@ __all__ = [
     "EquipmentSet",
     "EquipmentSetItem",
     "ItemDistribution",
+    "ItemDistributionPriority",
+    "ItemDistributionCompletion",
     "DistributionHistory",
+    "DistributionWeeklyRollup",
+    "DistributionEvent",
+    "DistributionSnapshot",
     "RaidSchedule"
 ]
\ No newline at end of file
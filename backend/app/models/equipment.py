@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 import enum
@@ -67,6 +67,9 @@ class EquipmentSet(Base):
     플레이어의 출발 세트, 최종 BIS 세트 등을 관리
     """
     __tablename__ = "equipment_sets"
+    __table_args__ = (
+        Index("ix_equipment_sets_user_group", "user_id", "raid_group_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)  # 세트 이름 (예: "출발 세트", "최종 BIS")
@@ -82,6 +85,7 @@ class EquipmentSet(Base):
     
     # 통계
     total_item_level = Column(Integer, default=0)  # 평균 아이템 레벨
+    item_level_sum = Column(Integer, default=0, server_default="0", nullable=False)  # 아이템 레벨 합계 (무기 2배, 평균 증분 갱신용)
     
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
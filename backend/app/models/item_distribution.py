@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 import enum
@@ -23,7 +23,7 @@ class ItemDistribution(Base):
     각 공대의 아이템별 분배 순서를 관리
     """
     __tablename__ = "item_distributions"
-
+    
     id = Column(Integer, primary_key=True, index=True)
     
     # 외래키
@@ -34,20 +34,103 @@ class ItemDistribution(Base):
     item_type = Column(Enum(ItemType), nullable=False)
     floor_number = Column(Integer, nullable=False)  # 드랍 층 (1-4층)
     
-    # 분배 정보
-    priority_order = Column(JSON)  # 우선순위 순서 (user_id 리스트)
-    completed_users = Column(JSON, default=[])  # 이미 획득한 유저 리스트
-    
     # 추가 정보
     notes = Column(Text)  # 분배 관련 메모
     is_active = Column(Boolean, default=True)
     
+    # 낙관적 동시성 제어 (UPDATE 시 버전이 같을 때만 반영하고 1 증가)
+    version = Column(Integer, nullable=False, server_default="1")
+    
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
     
+    __mapper_args__ = {"version_id_col": version}
+    
     # 관계
     raid_group = relationship("RaidGroup", back_populates="item_distributions")
     histories = relationship("DistributionHistory", back_populates="distribution_rule")
+    # 분배 정보 (목록 조회 시 규칙 수와 관계없이 한 번에 조회)
+    priority_entries = relationship(
+        "ItemDistributionPriority",
+        back_populates="distribution_rule",
+        order_by="ItemDistributionPriority.position",
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
+    completions = relationship(
+        "ItemDistributionCompletion",
+        back_populates="distribution_rule",
+        order_by="ItemDistributionCompletion.id",
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
+    
+    @property
+    def priority_order(self) -> list:
+        """우선순위 순서 (user_id 리스트)"""
+        return [entry.user_id for entry in self.priority_entries]
+    
+    @priority_order.setter
+    def priority_order(self, user_ids: list) -> None:
+        # 기존 행은 순서만 바꾸고 빠진 멤버만 삭제 (같은 멤버를 지우고 다시 넣지 않음)
+        entries = {entry.user_id: entry for entry in self.priority_entries}
+        updated = []
+        for position, user_id in enumerate(dict.fromkeys(user_ids or [])):
+            entry = entries.get(user_id) or ItemDistributionPriority(user_id=user_id)
+            entry.position = position
+            updated.append(entry)
+        self.priority_entries = updated
+    
+    @property
+    def completed_users(self) -> list:
+        """이미 획득한 유저 리스트"""
+        return [completion.user_id for completion in self.completions]
+    
+    @completed_users.setter
+    def completed_users(self, user_ids: list) -> None:
+        completions = {completion.user_id: completion for completion in self.completions}
+        self.completions = [
+            completions.get(user_id) or ItemDistributionCompletion(user_id=user_id)
+            for user_id in dict.fromkeys(user_ids or [])
+        ]
+
+
+class ItemDistributionPriority(Base):
+    """
+    분배 규칙별 우선순위 순서
+    """
+    __tablename__ = "item_distribution_priorities"
+    __table_args__ = (
+        Index("ix_item_distribution_priorities_rule_user", "distribution_id", "user_id", unique=True),
+        Index("ix_item_distribution_priorities_rule_position", "distribution_id", "position"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    distribution_id = Column(Integer, ForeignKey("item_distributions.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    position = Column(Integer, nullable=False)  # 0부터 시작하는 순위
+    
+    # 관계
+    distribution_rule = relationship("ItemDistribution", back_populates="priority_entries")
+
+
+class ItemDistributionCompletion(Base):
+    """
+    분배 규칙별 획득 완료 멤버
+    (규칙, 멤버)마다 한 행이므로 동시에 기록해도 다른 멤버의 기록을 덮어쓰지 않음
+    """
+    __tablename__ = "item_distribution_completions"
+    __table_args__ = (
+        Index("ix_item_distribution_completions_rule_user", "distribution_id", "user_id", unique=True),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    distribution_id = Column(Integer, ForeignKey("item_distributions.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    completed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    
+    # 관계
+    distribution_rule = relationship("ItemDistribution", back_populates="completions")
 
 
 class DistributionHistory(Base):
@@ -56,7 +139,11 @@ class DistributionHistory(Base):
     실제로 누가 언제 어떤 아이템을 획득했는지 기록
     """
     __tablename__ = "distribution_histories"
-
+    __table_args__ = (
+        # 최신순 목록과 커서 페이지네이션 (분배 일시, ID)
+        Index("ix_distribution_histories_group_distributed_at_id", "raid_group_id", "distributed_at", "id"),
+    )
+    
     id = Column(Integer, primary_key=True, index=True)
     
     # 외래키
@@ -71,7 +158,7 @@ class DistributionHistory(Base):
     
     # 분배 정보
     week_number = Column(Integer, nullable=False)  # 몇 주차
-    distributed_at = Column(DateTime, default=datetime.now(timezone.utc))  # 분배 일시
+    distributed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))  # 분배 일시
     
     # 추가 정보
     notes = Column(Text)
@@ -82,13 +169,76 @@ class DistributionHistory(Base):
     distribution_rule = relationship("ItemDistribution", back_populates="histories")
 
 
+class DistributionWeeklyRollup(Base):
+    """
+    주차/멤버/아이템 타입별 획득 수 집계
+    분배 이력을 기록/삭제할 때 같은 트랜잭션에서 증감하여
+    공정성 통계를 이력 전체를 읽지 않고 조회
+    """
+    __tablename__ = "distribution_weekly_rollups"
+    __table_args__ = (
+        Index(
+            "ix_distribution_weekly_rollups_group_week_user_type",
+            "raid_group_id", "week_number", "user_id", "item_type",
+            unique=True
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    raid_group_id = Column(Integer, ForeignKey("raid_groups.id"), nullable=False)
+    week_number = Column(Integer, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    item_type = Column(Enum(ItemType), nullable=False)
+    item_count = Column(Integer, nullable=False, default=0)
+
+
+class DistributionEvent(Base):
+    """
+    분배 이벤트 로그 (추가만 하고 수정/삭제하지 않음)
+    규칙/이력/획득 재화 변경을 순서대로 기록하여 특정 시점의 분배 상태를 재구성
+    """
+    __tablename__ = "distribution_events"
+    __table_args__ = (
+        Index("ix_distribution_events_group_id", "raid_group_id", "id"),
+        Index("ix_distribution_events_group_week", "raid_group_id", "week_number", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    raid_group_id = Column(Integer, ForeignKey("raid_groups.id", ondelete="CASCADE"), nullable=False)
+    event_type = Column(String(50), nullable=False)
+    week_number = Column(Integer)  # 분배 이력 이벤트의 주차 (규칙 변경 등은 없음)
+    payload = Column(JSON, nullable=False)
+    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # 관리 명령어는 없음
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class DistributionSnapshot(Base):
+    """
+    분배 상태 스냅샷
+    last_event_id까지의 이벤트를 반영한 상태를 저장하여 재구성 시 이후 이벤트만 적용
+    """
+    __tablename__ = "distribution_snapshots"
+    __table_args__ = (
+        Index("ix_distribution_snapshots_group_event", "raid_group_id", "last_event_id"),
+        Index("ix_distribution_snapshots_group_week_event", "raid_group_id", "week_number", "last_event_id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    raid_group_id = Column(Integer, ForeignKey("raid_groups.id", ondelete="CASCADE"), nullable=False)
+    last_event_id = Column(Integer, nullable=False)  # 0이면 이벤트 이전 상태
+    week_number = Column(Integer, nullable=False)  # 반영된 분배 이력의 최대 주차 (없으면 0)
+    state = Column(JSON, nullable=False)
+    is_baseline = Column(Boolean, nullable=False, default=False)  # 테이블에서 만든 기준 스냅샷 (이전 이벤트 없음)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
 class ResourceRequirement(Base):
     """
     재화 요구량 계산을 위한 테이블
     각 플레이어가 최종 BIS까지 필요한 재화량을 저장
     """
     __tablename__ = "resource_requirements"
-
+    
     id = Column(Integer, primary_key=True, index=True)
     
     # 외래키
@@ -106,6 +256,11 @@ class ResourceRequirement(Base):
     
     last_calculated_at = Column(DateTime, default=datetime.now(timezone.utc))
     
+    # 낙관적 동시성 제어 (UPDATE 시 버전이 같을 때만 반영하고 1 증가)
+    version = Column(Integer, nullable=False, server_default="1")
+    
+    __mapper_args__ = {"version_id_col": version}
+    
     # 관계
     user = relationship("User", back_populates="resource_requirements")
     raid_group = relationship("RaidGroup", back_populates="resource_requirements")
\ No newline at end of file
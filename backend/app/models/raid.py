@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 import enum
@@ -77,6 +77,10 @@ class RaidMember(Base):
     공대와 사용자 간의 다대다 관계를 나타냄
     """
     __tablename__ = "raid_members"
+    __table_args__ = (
+        # 한 사용자는 같은 공대에 한 번만 소속
+        Index("ix_raid_members_group_user", "raid_group_id", "user_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
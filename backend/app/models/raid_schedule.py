@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Date, Time, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Date, Time, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship, backref
 from datetime import datetime, timezone
 import enum
 from app.database import Base
@@ -19,6 +19,14 @@ class RaidSchedule(Base):
     공대의 레이드 일정을 관리
     """
     __tablename__ = "raid_schedules"
+    __table_args__ = (
+        # 날짜순 목록과 커서 페이지네이션 (날짜, 시작 시간, ID)
+        Index("ix_raid_schedules_group_date_time_id", "raid_group_id", "scheduled_date", "start_time", "id"),
+        # 목록 조회마다 공대의 반복 일정 원본만 찾는 용도 (일정 수와 무관하게 검색)
+        Index("ix_raid_schedules_group_recurrence", "raid_group_id", "recurrence_type"),
+        # 반복 일정의 발생일별 저장 일정은 하나
+        Index("ix_raid_schedules_parent_occurrence", "parent_schedule_id", "occurrence_date", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -41,6 +49,7 @@ class RaidSchedule(Base):
     recurrence_count = Column(Integer)  # 반복 횟수 (end_date 대신 사용 가능)
     recurrence_days = Column(String(20))  # 요일 선택 (weekly인 경우, "1,3,5" = 월,수,금)
     parent_schedule_id = Column(Integer, ForeignKey("raid_schedules.id"))  # 원본 일정 ID
+    occurrence_date = Column(Date)  # 원본 반복 규칙상의 발생일 (저장된 발생분만)
     
     # 레이드 정보
     target_floors = Column(String(50))
@@ -53,6 +62,12 @@ class RaidSchedule(Base):
     # 참석 관련
     minimum_members = Column(Integer, default=8)
     
+    # 참석 상태별 인원 수 (참석 응답 변경 시 함께 갱신)
+    confirmed_count = Column(Integer, default=0, server_default="0", nullable=False)
+    declined_count = Column(Integer, default=0, server_default="0", nullable=False)
+    tentative_count = Column(Integer, default=0, server_default="0", nullable=False)
+    pending_count = Column(Integer, default=0, server_default="0", nullable=False)
+    
     # 메모
     notes = Column(Text)
     completion_notes = Column(Text)
@@ -67,8 +82,12 @@ class RaidSchedule(Base):
     raid_group = relationship("RaidGroup", back_populates="schedules")
     created_by = relationship("User", back_populates="created_schedules")
     attendances = relationship("RaidAttendance", back_populates="schedule", cascade="all, delete-orphan")
-    # 반복 일정 관계
-    parent_schedule = relationship("RaidSchedule", remote_side=[id], backref="child_schedules")
+    # 반복 일정 관계 (원본 일정을 삭제하면 저장된 발생분도 함께 삭제)
+    parent_schedule = relationship(
+        "RaidSchedule",
+        remote_side=[id],
+        backref=backref("child_schedules", cascade="all, delete-orphan")
+    )
 
 
 class RaidAttendance(Base):
@@ -77,6 +96,11 @@ class RaidAttendance(Base):
     각 일정에 대한 멤버들의 참석 여부를 관리
     """
     __tablename__ = "raid_attendances"
+    __table_args__ = (
+        # 일정당 사용자별 참석 레코드는 하나
+        Index("ix_raid_attendances_schedule_user", "schedule_id", "user_id", unique=True),
+        Index("ix_raid_attendances_schedule_status", "schedule_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
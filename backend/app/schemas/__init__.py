@@ -12,14 +12,18 @@ from app.schemas.raid import (
 from app.schemas.equipment import (
     EquipmentBase, EquipmentCreate, EquipmentUpdate, Equipment,
     EquipmentSetBase, EquipmentSetCreate, EquipmentSetUpdate, EquipmentSet,
-    EquipmentSetItemBase, EquipmentSetItemCreate, EquipmentSetItemUpdate, EquipmentSetItem,
+    EquipmentSetItemBase, EquipmentSetItemCreate, EquipmentSetItemsReplace, EquipmentSetItemUpdate, EquipmentSetItem,
     EquipmentSlot, EquipmentType
 )
 from app.schemas.item_distribution import (
     ItemDistributionBase, ItemDistributionCreate, ItemDistributionUpdate, ItemDistribution,
     DistributionHistoryBase, DistributionHistoryCreate, DistributionHistory,
+    DistributionHistoryBatchItem, DistributionHistoryBatchCreate,
+    LootRollup, DistributionSummary, DistributionRuleState, DistributionState,
     ResourceRequirementBase, ResourceRequirementUpdate, ResourceRequirement,
-    ResourceCalculationResult, ItemType
+    ResourceCalculationResult, GroupResourceCalculationResult,
+    BisForecastSummary, MemberBisForecast, BisForecastResult,
+    WeekDrop, WeekAssignmentRequest, SuggestedAssignment, WeekAssignmentSuggestion, ItemType
 )
 from app.schemas.raid_schedule import (
     RaidScheduleBase, RaidScheduleCreate, RaidScheduleUpdate, RaidSchedule,
@@ -39,13 +43,17 @@ __all__ = [
     # Equipment
     "EquipmentBase", "EquipmentCreate", "EquipmentUpdate", "Equipment",
     "EquipmentSetBase", "EquipmentSetCreate", "EquipmentSetUpdate", "EquipmentSet",
-    "EquipmentSetItemBase", "EquipmentSetItemCreate", "EquipmentSetItemUpdate", "EquipmentSetItem",
+    "EquipmentSetItemBase", "EquipmentSetItemCreate", "EquipmentSetItemsReplace", "EquipmentSetItemUpdate", "EquipmentSetItem",
     "EquipmentSlot", "EquipmentType",
     # Distribution
     "ItemDistributionBase", "ItemDistributionCreate", "ItemDistributionUpdate", "ItemDistribution",
     "DistributionHistoryBase", "DistributionHistoryCreate", "DistributionHistory",
+    "DistributionHistoryBatchItem", "DistributionHistoryBatchCreate",
+    "LootRollup", "DistributionSummary", "DistributionRuleState", "DistributionState",
     "ResourceRequirementBase", "ResourceRequirementUpdate", "ResourceRequirement",
-    "ResourceCalculationResult", "ItemType",
+    "ResourceCalculationResult", "GroupResourceCalculationResult",
+    "BisForecastSummary", "MemberBisForecast", "BisForecastResult",
+    "WeekDrop", "WeekAssignmentRequest", "SuggestedAssignment", "WeekAssignmentSuggestion", "ItemType",
     # Schedule
     "RaidScheduleBase", "RaidScheduleCreate", "RaidScheduleUpdate", "RaidSchedule",
     "RaidAttendanceBase", "RaidAttendanceCreate", "RaidAttendanceUpdate", "RaidAttendance",
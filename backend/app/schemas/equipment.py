@@ -117,6 +117,11 @@ class EquipmentSetItemCreate(EquipmentSetItemBase):
     pass
 
 
+class EquipmentSetItemsReplace(BaseModel):
+    """장비 세트 아이템 전체 교체 스키마 (없는 부위는 제거)"""
+    items: List[EquipmentSetItemCreate] = Field(default_factory=list, max_length=len(EquipmentSlot))
+
+
 class EquipmentSetItemUpdate(BaseModel):
     """장비 세트 아이템 수정 스키마"""
     equipment_id: Optional[int] = None
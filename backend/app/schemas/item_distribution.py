@@ -40,6 +40,7 @@ class ItemDistributionUpdate(BaseModel):
     completed_users: Optional[List[int]] = None
     notes: Optional[str] = None
     is_active: Optional[bool] = None
+    version: Optional[int] = None  # 마지막으로 조회한 버전 (다르면 409)
 
 
 class ItemDistribution(ItemDistributionBase):
@@ -49,6 +50,7 @@ class ItemDistribution(ItemDistributionBase):
     priority_order: List[int]
     completed_users: List[int]
     is_active: bool
+    version: int
     created_at: datetime
     updated_at: datetime
     
@@ -71,6 +73,22 @@ class DistributionHistoryCreate(DistributionHistoryBase):
     distribution_id: Optional[int] = None
 
 
+class DistributionHistoryBatchItem(BaseModel):
+    """주간 일괄 분배 기록 항목 스키마"""
+    user_id: int
+    distribution_id: Optional[int] = None
+    item_name: str = Field(..., min_length=1, max_length=200)
+    item_type: ItemType
+    floor_number: Optional[int] = Field(None, ge=1, le=4)
+    notes: Optional[str] = None
+
+
+class DistributionHistoryBatchCreate(BaseModel):
+    """주간 일괄 분배 기록 스키마"""
+    week_number: int = Field(..., ge=1)
+    distributions: List[DistributionHistoryBatchItem] = Field(..., min_length=1, max_length=100)
+
+
 class DistributionHistory(DistributionHistoryBase):
     """분배 이력 응답 스키마"""
     id: int
@@ -86,6 +104,43 @@ class DistributionHistory(DistributionHistoryBase):
 
 
 # ResourceRequirement 스키마
+class LootRollup(BaseModel):
+    """주차/멤버/아이템 타입별 획득 수 스키마"""
+    week_number: int
+    user_id: int
+    item_type: ItemType
+    count: int
+
+
+class DistributionSummary(BaseModel):
+    """분배 집계 응답 스키마"""
+    raid_group_id: int
+    weeks: List[LootRollup] = []  # 주차, 멤버, 아이템 타입 순
+    member_totals: Dict[int, Dict[str, int]] = {}  # 멤버별 아이템 타입별 합계
+
+
+class DistributionRuleState(BaseModel):
+    """재구성된 분배 규칙 상태 스키마"""
+    distribution_id: int
+    item_name: str
+    priority_order: List[int] = []
+    completed_users: List[int] = []
+
+
+class DistributionState(BaseModel):
+    """특정 주차의 분배 상태 응답 스키마"""
+    raid_group_id: int
+    week_number: Optional[int] = None  # 요청한 주차 (없으면 현재 상태)
+    latest_week_number: int = 0  # 반영된 분배 이력의 최대 주차
+    last_event_id: int  # 마지막으로 반영된 이벤트
+    snapshot_event_id: int  # 재구성을 시작한 스냅샷 (0이면 처음부터)
+    replayed_events: int  # 스냅샷 이후 적용한 이벤트 수
+    obtained: Dict[int, Dict[str, int]] = {}  # 멤버별 획득 재화
+    loot_counts: Dict[int, int] = {}  # 멤버별 획득 아이템 수
+    rules: List[DistributionRuleState] = []
+    elapsed_ms: float = 0  # 재구성 소요 시간
+
+
 class ResourceRequirementBase(BaseModel):
     """재화 요구량 기본 스키마"""
     required_resources: Dict[str, int] = Field(default_factory=dict)
@@ -96,6 +151,7 @@ class ResourceRequirementBase(BaseModel):
 class ResourceRequirementUpdate(BaseModel):
     """재화 요구량 수정 스키마"""
     obtained_resources: Optional[Dict[str, int]] = None
+    version: Optional[int] = None  # 마지막으로 조회한 버전 (다르면 409)
 
 
 class ResourceRequirement(ResourceRequirementBase):
@@ -105,6 +161,7 @@ class ResourceRequirement(ResourceRequirementBase):
     raid_group_id: int
     completion_percentage: int
     last_calculated_at: datetime
+    version: int
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -125,6 +182,73 @@ class ResourceCalculationResult(BaseModel):
     priority_rankings: Optional[Dict[str, int]] = None  # 각 아이템별 우선순위
 
 
+class GroupResourceCalculationResult(BaseModel):
+    """공대 전체 재화 계산 결과 스키마"""
+    raid_group_id: int
+    results: List[ResourceCalculationResult] = []
+    skipped_user_ids: List[int] = []  # 출발 세트 또는 BIS 세트가 없는 멤버
+    elapsed_ms: float = 0  # 계산 소요 시간
+
+
+# BIS 도달 예측 스키마
+class BisForecastSummary(BaseModel):
+    """BIS 도달 주차 분포 요약 스키마"""
+    mean_weeks: Optional[float] = None  # 최대 주차 안에 도달한 시뮬레이션의 평균
+    median_weeks: Optional[int] = None  # 최대 주차 안에 도달하지 못하면 None
+    p90_weeks: Optional[int] = None
+    completion_rate: float  # 최대 주차 안에 BIS에 도달한 비율
+    weeks_distribution: List[float] = []  # 주차별 도달 확률 (인덱스 = 주차)
+
+
+class MemberBisForecast(BisForecastSummary):
+    """멤버별 BIS 도달 예측 스키마"""
+    user_id: int
+
+
+class BisForecastResult(BaseModel):
+    """공대 BIS 도달 예측 결과 스키마"""
+    raid_group_id: int
+    distribution_method: str
+    simulations: int
+    max_weeks: int
+    seed: Optional[int] = None
+    members: List[MemberBisForecast] = []
+    group: BisForecastSummary  # 가장 늦은 멤버 기준
+    ignored_items: List[str] = []  # 드랍 테이블로 얻을 수 없어 제외한 재화
+    elapsed_ms: float = 0  # 계산 소요 시간
+
+
+# 주간 분배 추천 스키마
+class WeekDrop(BaseModel):
+    """주간 드랍 아이템 스키마"""
+    item_name: str = Field(..., min_length=1, max_length=200)
+    item_type: ItemType
+    floor_number: int = Field(..., ge=1, le=4)
+
+
+class WeekAssignmentRequest(BaseModel):
+    """주간 분배 추천 요청 스키마"""
+    week_number: int = Field(..., ge=1)
+    drops: List[WeekDrop] = Field(..., min_length=1, max_length=64)
+
+
+class SuggestedAssignment(WeekDrop):
+    """드랍별 추천 분배 스키마"""
+    user_id: Optional[int] = None  # 필요한 멤버가 없으면 None
+    distribution_id: Optional[int] = None  # 같은 이름의 활성 분배 규칙
+
+
+class WeekAssignmentSuggestion(BaseModel):
+    """주간 분배 추천 결과 스키마"""
+    raid_group_id: int
+    week_number: int
+    assignments: List[SuggestedAssignment] = []
+    estimated_weeks_before: Dict[int, float] = {}  # 멤버별 예상 BIS 도달 주차 (분배 전)
+    estimated_weeks_after: Dict[int, float] = {}  # 멤버별 예상 BIS 도달 주차 (분배 후)
+    locked_out_user_ids: Dict[int, List[int]] = {}  # 층별로 이번 주에 이미 아이템을 받은 멤버
+    elapsed_ms: float = 0  # 계산 소요 시간
+
+
 # Forward reference 해결
 from app.schemas.user import User
 DistributionHistory.model_rebuild()
\ No newline at end of file
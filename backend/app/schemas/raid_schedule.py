@@ -64,7 +64,7 @@ class RaidScheduleUpdate(BaseModel):
 
 class RaidSchedule(RaidScheduleBase):
     """레이드 일정 응답 스키마"""
-    id: int
+    id: Optional[int] = None  # 가상 발생분은 없음 (parent_schedule_id + occurrence_date로 식별)
     raid_group_id: int
     created_by_id: int
     recurrence_type: RecurrenceType
@@ -72,6 +72,7 @@ class RaidSchedule(RaidScheduleBase):
     recurrence_count: Optional[int] = None
     recurrence_days: Optional[str] = None
     parent_schedule_id: Optional[int] = None
+    occurrence_date: Optional[date] = None
     is_confirmed: bool
     is_completed: bool
     is_cancelled: bool
@@ -86,7 +87,10 @@ class RaidSchedule(RaidScheduleBase):
     attendances: Optional[List["RaidAttendance"]] = []
     confirmed_count: Optional[int] = 0
     declined_count: Optional[int] = 0
+    tentative_count: Optional[int] = 0
+    pending_count: Optional[int] = 0
     is_recurring: Optional[bool] = None  # 반복 일정 여부
+    is_virtual: bool = False  # 저장되지 않은 반복 일정 발생분 여부
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -8,6 +8,60 @@ from app.utils.user import (
     is_active,
     is_admin
 )
+from app.utils.schedule import (
+    apply_attendance_status_change,
+    set_attendance_status,
+    create_schedules_with_attendances,
+    recalculate_attendance_counts,
+    find_attendance_count_mismatches,
+    iter_occurrence_dates,
+    get_virtual_occurrences,
+    materialize_occurrence
+)
+from app.utils.priority import (
+    PriorityWeights,
+    calculate_priority_orders,
+    recalculate_priorities
+)
+from app.utils.distribution_rules import (
+    load_priority_orders,
+    replace_priority_orders,
+    add_completed_users,
+    remove_completed_user
+)
+from app.utils.resources import (
+    refresh_requirement_progress,
+    apply_obtained_delta,
+    apply_obtained_deltas,
+    reconcile_obtained_resources
+)
+from app.utils.rollups import (
+    apply_rollup_deltas,
+    rebuild_loot_rollups
+)
+from app.utils.distribution_events import (
+    append_distribution_events,
+    load_state,
+    create_snapshot,
+    create_baseline_snapshots
+)
+from app.utils.equipment import (
+    apply_set_item_level_delta,
+    refresh_set_item_levels,
+    recalculate_set_item_levels
+)
+from app.utils.forecast import (
+    LootSource,
+    forecast_weeks_to_bis
+)
+from app.utils.assignment import (
+    solve_assignment,
+    suggest_week_assignment
+)
+from app.utils.pagination import (
+    encode_cursor,
+    decode_cursor
+)
 
 __all__ = [
     "get_user",
@@ -17,5 +71,49 @@ __all__ = [
     "update_user",
     "authenticate_user",
     "is_active",
-    "is_admin"
+    "is_admin",
+    # Schedule
+    "apply_attendance_status_change",
+    "set_attendance_status",
+    "create_schedules_with_attendances",
+    "recalculate_attendance_counts",
+    "find_attendance_count_mismatches",
+    "iter_occurrence_dates",
+    "get_virtual_occurrences",
+    "materialize_occurrence",
+    # Priority
+    "PriorityWeights",
+    "calculate_priority_orders",
+    "recalculate_priorities",
+    # Distribution rules
+    "load_priority_orders",
+    "replace_priority_orders",
+    "add_completed_users",
+    "remove_completed_user",
+    # Resources
+    "refresh_requirement_progress",
+    "apply_obtained_delta",
+    "apply_obtained_deltas",
+    "reconcile_obtained_resources",
+    # Rollups
+    "apply_rollup_deltas",
+    "rebuild_loot_rollups",
+    # Distribution events
+    "append_distribution_events",
+    "load_state",
+    "create_snapshot",
+    "create_baseline_snapshots",
+    # Equipment
+    "apply_set_item_level_delta",
+    "refresh_set_item_levels",
+    "recalculate_set_item_levels",
+    # Forecast
+    "LootSource",
+    "forecast_weeks_to_bis",
+    # Assignment
+    "solve_assignment",
+    "suggest_week_assignment",
+    # Pagination
+    "encode_cursor",
+    "decode_cursor"
 ]
\ No newline at end of file
@@ -0,0 +1,205 @@
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.utils.forecast import LootSource
+
+# 필요한 멤버가 없는 드랍을 분배하지 않을 때의 비용 / 받을 수 없는 멤버의 비용
+UNASSIGNED_COST = 1e6
+INELIGIBLE_COST = 1e9
+
+# 목적 함수 보조 항 가중치
+# 병목이 아닌 재화도 줄이도록 전체 남은 주차 합을 작게 반영하고
+# 그래도 같으면 기존 우선순위 순서로 결정
+TOTAL_WEEKS_WEIGHT = 1e-3
+PRIORITY_RANK_WEIGHT = 1e-6
+
+# 층 단위 재배정 최대 반복 횟수
+MAX_SWEEPS = 20
+
+
+def solve_assignment(cost: np.ndarray) -> List[int]:
+    """
+    최소 비용 선형 할당 (헝가리안 알고리즘)
+    
+    Args:
+        cost: (행 x 열) 비용 행렬 (행 수 <= 열 수)
+    
+    Returns:
+        행마다 할당된 열 인덱스
+    """
+    rows, columns = cost.shape
+    u = [0.0] * (rows + 1)
+    v = [0.0] * (columns + 1)
+    matched = [0] * (columns + 1)
+    way = [0] * (columns + 1)
+    
+    for row in range(1, rows + 1):
+        matched[0] = row
+        column = 0
+        min_value = [float("inf")] * (columns + 1)
+        used = [False] * (columns + 1)
+        
+        while matched[column] != 0:
+            used[column] = True
+            current_row = matched[column]
+            delta = float("inf")
+            next_column = 0
+            for j in range(1, columns + 1):
+                if used[j]:
+                    continue
+                reduced = cost[current_row - 1, j - 1] - u[current_row] - v[j]
+                if reduced < min_value[j]:
+                    min_value[j] = reduced
+                    way[j] = column
+                if min_value[j] < delta:
+                    delta = min_value[j]
+                    next_column = j
+            for j in range(columns + 1):
+                if used[j]:
+                    u[matched[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_value[j] -= delta
+            column = next_column
+        
+        # 증가 경로를 따라 할당 갱신
+        while column:
+            previous = way[column]
+            matched[column] = matched[previous]
+            column = previous
+    
+    assignment = [0] * rows
+    for column in range(1, columns + 1):
+        if matched[column]:
+            assignment[matched[column] - 1] = column - 1
+    return assignment
+
+def weekly_supply_pools(sources: Sequence[LootSource], member_count: int) -> List[Tuple[Tuple[str, ...], float]]:
+    """
+    드랍 테이블에서 재화 묶음별 멤버 1인당 주간 기대 획득량 계산
+    (같은 후보 아이템을 가진 출처는 하나의 묶음으로 합침)
+    
+    Args:
+        sources: 주간 획득 재화 출처
+        member_count: 공대 인원 수
+    
+    Returns:
+        (아이템 이름 묶음, 1인당 주간 기대 획득량) 목록
+    """
+    rates: Dict[Tuple[str, ...], float] = {}
+    for source in sources:
+        supply = source.count * sum(source.units) / len(source.units)
+        if not source.personal:
+            supply /= max(1, member_count)
+        rates[source.item_names] = rates.get(source.item_names, 0.0) + supply
+    return list(rates.items())
+
+def _member_costs(remaining: np.ndarray, pool_matrix: np.ndarray, pool_rates: np.ndarray) -> np.ndarray:
+    # 멤버별 예상 BIS 도달 주차 (가장 늦게 모이는 재화 묶음 기준) + 전체 남은 주차 합 보조 항
+    weeks = (remaining @ pool_matrix) / pool_rates
+    return weeks.max(axis=-1) + TOTAL_WEEKS_WEIGHT * weeks.sum(axis=-1)
+
+def _member_weeks(remaining: np.ndarray, pool_matrix: np.ndarray, pool_rates: np.ndarray) -> List[float]:
+    # 멤버별 예상 BIS 도달 주차 (응답용)
+    weeks = (remaining @ pool_matrix) / pool_rates
+    return [round(float(value), 2) for value in weeks.max(axis=-1)]
+
+def suggest_week_assignment(
+    remaining_resources: Sequence[Dict[str, int]],
+    drops: Sequence[Tuple[str, int]],
+    sources: Sequence[LootSource],
+    priority_ranks: Optional[Dict[str, Dict[int, int]]] = None,
+    locked_out: Optional[Dict[int, Set[int]]] = None
+) -> Dict:
+    """
+    한 주 드랍 전체를 공대 전체 예상 BIS 도달 주차 합이 가장 작도록 분배
+    멤버는 한 주에 층마다 아이템을 하나만 받을 수 있으므로 층 안에서는 비용이 독립이고
+    층마다 다른 층 배정을 고정한 채 헝가리안 알고리즘으로 다시 배정하는 과정을
+    더 이상 좋아지지 않을 때까지 반복
+    
+    Args:
+        remaining_resources: 멤버별 남은 재화
+        drops: (아이템 이름, 층) 목록 (드랍 1개는 해당 재화 1개)
+        sources: 주간 획득 재화 출처 (예상 주차 계산용)
+        priority_ranks: 아이템별 멤버 순위 (멤버 인덱스 -> 순위, 동점 처리용)
+        locked_out: 층별로 이번 주에 이미 아이템을 받아 제외할 멤버 인덱스
+    
+    Returns:
+        assignments: 드랍 순서대로 받을 멤버 인덱스 (필요한 멤버가 없으면 None)
+        weeks_before: 분배 전 멤버별 예상 BIS 도달 주차
+        weeks_after: 분배 후 멤버별 예상 BIS 도달 주차
+    """
+    priority_ranks = priority_ranks or {}
+    locked_out = locked_out or {}
+    member_count = len(remaining_resources)
+    
+    pools = weekly_supply_pools(sources, member_count)
+    item_names = sorted({item_name for item_names, _ in pools for item_name in item_names} | {item for item, _ in drops})
+    item_index = {item_name: index for index, item_name in enumerate(item_names)}
+    
+    # 아이템 -> 재화 묶음 행렬과 묶음별 공급량
+    pool_matrix = np.zeros((len(item_names), len(pools)))
+    for column, (pool_items, _) in enumerate(pools):
+        for item_name in pool_items:
+            pool_matrix[item_index[item_name], column] = 1
+    pool_rates = np.array([rate for _, rate in pools])
+    
+    remaining = np.zeros((member_count, len(item_names)))
+    for row, resources in enumerate(remaining_resources):
+        for item_name, count in resources.items():
+            if item_name in item_index:
+                remaining[row, item_index[item_name]] = max(0, count)
+    
+    # 층별 드랍 인덱스
+    floors: Dict[int, List[int]] = {}
+    for index, (_, floor_number) in enumerate(drops):
+        floors.setdefault(floor_number, []).append(index)
+    
+    assignments: List[Optional[int]] = [None] * len(drops)
+    
+    def received(skip_floor: Optional[int] = None) -> np.ndarray:
+        # 해당 층을 제외한 현재 배정으로 받는 재화
+        gained = np.zeros_like(remaining)
+        for index, member in enumerate(assignments):
+            if member is not None and drops[index][1] != skip_floor:
+                gained[member, item_index[drops[index][0]]] += 1
+        return gained
+    
+    for _ in range(MAX_SWEEPS):
+        changed = False
+        for floor_number, drop_indexes in floors.items():
+            base = np.maximum(remaining - received(floor_number), 0)
+            base_costs = _member_costs(base, pool_matrix, pool_rates)
+            locked = locked_out.get(floor_number, set())
+            
+            # (드랍 x (멤버 + 미분배)) 비용 행렬
+            cost = np.full((len(drop_indexes), member_count + len(drop_indexes)), UNASSIGNED_COST)
+            for row, index in enumerate(drop_indexes):
+                item_name = drops[index][0]
+                column = item_index[item_name]
+                ranks = priority_ranks.get(item_name, {})
+                
+                after = base.copy()
+                after[:, column] = np.maximum(after[:, column] - 1, 0)
+                gain = _member_costs(after, pool_matrix, pool_rates) - base_costs
+                for member in range(member_count):
+                    if base[member, column] <= 0 or member in locked:
+                        cost[row, member] = INELIGIBLE_COST
+                    else:
+                        cost[row, member] = gain[member] + PRIORITY_RANK_WEIGHT * ranks.get(member, member_count)
+            
+            for row, column in enumerate(solve_assignment(cost)):
+                member = column if column < member_count else None
+                if assignments[drop_indexes[row]] != member:
+                    assignments[drop_indexes[row]] = member
+                    changed = True
+        
+        if not changed:
+            break
+    
+    return {
+        "assignments": assignments,
+        "weeks_before": _member_weeks(remaining, pool_matrix, pool_rates),
+        "weeks_after": _member_weeks(np.maximum(remaining - received(), 0), pool_matrix, pool_rates)
+    }
@@ -0,0 +1,397 @@
+import copy
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.raid import RaidGroup
+from app.models.item_distribution import (
+    ItemDistribution,
+    ItemDistributionCompletion,
+    DistributionHistory,
+    DistributionEvent,
+    DistributionSnapshot,
+    ResourceRequirement
+)
+from app.utils.distribution_rules import load_priority_orders
+
+# 분배 이벤트 종류
+RULE_CREATED = "rule_created"
+RULE_UPDATED = "rule_updated"
+RULE_DELETED = "rule_deleted"
+HISTORY_RECORDED = "history_recorded"
+HISTORY_DELETED = "history_deleted"
+PRIORITIES_UPDATED = "priorities_updated"
+OBTAINED_UPDATED = "obtained_updated"
+
+
+def empty_state() -> Dict:
+    """
+    이벤트가 없는 공대의 분배 상태
+    (JSON으로 저장하므로 사용자 ID/규칙 ID 키는 문자열)
+    """
+    return {
+        "week_number": 0,  # 반영된 분배 이력의 최대 주차
+        "obtained": {},  # 사용자 ID -> {아이템 이름: 획득 수}
+        "loot_counts": {},  # 사용자 ID -> 획득 아이템 수
+        "rules": {}  # 규칙 ID -> {item_name, priority_order, completed_users}
+    }
+
+def rule_payload(rule: ItemDistribution) -> Dict:
+    """규칙 생성/수정 이벤트 내용"""
+    return {
+        "distribution_id": rule.id,
+        "item_name": rule.item_name,
+        "priority_order": list(rule.priority_order),
+        "completed_users": list(rule.completed_users)
+    }
+
+def history_payload(history, counted: bool = True) -> Dict:
+    """
+    분배 이력 이벤트에 기록하는 이력 내용
+    counted는 획득 재화에 반영되었는지 여부 (필요 재화에 없는 아이템은 False)
+    """
+    return {
+        "id": history.id,
+        "user_id": history.user_id,
+        "item_name": history.item_name,
+        "item_type": getattr(history.item_type, "value", history.item_type),
+        "week_number": history.week_number,
+        "distribution_id": history.distribution_id,
+        "counted": counted
+    }
+
+def _add_count(counts: Dict, key: str, delta: int) -> None:
+    # 0 이하가 되면 제거 (재화 요구량 반영과 같은 규칙)
+    count = max(0, counts.get(key, 0) + delta)
+    if count:
+        counts[key] = count
+    else:
+        counts.pop(key, None)
+
+def apply_event(state: Dict, event_type: str, payload: Dict) -> None:
+    """
+    분배 상태에 이벤트 하나를 반영 (API의 실제 변경과 같은 규칙)
+    
+    Args:
+        state: empty_state 형식의 분배 상태 (직접 수정)
+        event_type: 이벤트 종류
+        payload: 이벤트 내용
+    """
+    rules = state["rules"]
+    
+    if event_type in (RULE_CREATED, RULE_UPDATED):
+        rules[str(payload["distribution_id"])] = {
+            "item_name": payload["item_name"],
+            "priority_order": list(payload["priority_order"]),
+            "completed_users": list(payload["completed_users"])
+        }
+    
+    elif event_type == RULE_DELETED:
+        rules.pop(str(payload["distribution_id"]), None)
+    
+    elif event_type in (HISTORY_RECORDED, HISTORY_DELETED):
+        delta = 1 if event_type == HISTORY_RECORDED else -1
+        for history in payload["histories"]:
+            user_key = str(history["user_id"])
+            # 획득 재화에 반영된 이력만 적용 (counted가 없는 이전 이벤트는 반영된 것으로 간주)
+            if history.get("counted", True):
+                obtained = state["obtained"].setdefault(user_key, {})
+                _add_count(obtained, history["item_name"], delta)
+                if not obtained:
+                    state["obtained"].pop(user_key)
+            _add_count(state["loot_counts"], user_key, delta)
+            
+            # 규칙의 획득 완료 멤버 추가/제거
+            rule = rules.get(str(history["distribution_id"]))
+            if rule is not None:
+                completed = rule["completed_users"]
+                if delta > 0 and history["user_id"] not in completed:
+                    completed.append(history["user_id"])
+                elif delta < 0 and history["user_id"] in completed:
+                    completed.remove(history["user_id"])
+            
+            if delta > 0:
+                state["week_number"] = max(state["week_number"], history["week_number"])
+    
+    elif event_type == PRIORITIES_UPDATED:
+        for rule_id, priority_order in payload["orders"].items():
+            rule = rules.get(str(rule_id))
+            if rule is not None:
+                rule["priority_order"] = list(priority_order)
+    
+    elif event_type == OBTAINED_UPDATED:
+        obtained = {item_name: count for item_name, count in payload["obtained_resources"].items() if count > 0}
+        if obtained:
+            state["obtained"][str(payload["user_id"])] = obtained
+        else:
+            state["obtained"].pop(str(payload["user_id"]), None)
+
+def append_distribution_events(
+    db: Session,
+    raid_group_id: int,
+    events: Sequence[Tuple[str, Optional[int], Dict]],
+    created_by_id: Optional[int] = None
+) -> None:
+    """
+    공대의 분배 이벤트 추가 (커밋은 호출자가 처리)
+    마지막 스냅샷 이후 이벤트가 DISTRIBUTION_SNAPSHOT_INTERVAL개 이상이면 같은 트랜잭션에서 스냅샷 생성
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 공대 ID
+        events: (이벤트 종류, 주차, 내용) 목록
+        created_by_id: 요청한 사용자 ID
+    """
+    if not events:
+        return
+    
+    # 같은 공대의 이벤트 기록을 커밋까지 직렬화하여 이벤트 ID 순서와 커밋 순서를 맞춤
+    # (먼저 받은 ID가 나중에 커밋되면 그 사이 만든 스냅샷에서 빠질 수 있음)
+    db.query(RaidGroup.id).filter(RaidGroup.id == raid_group_id).with_for_update().scalar()
+    
+    db.execute(
+        insert(DistributionEvent),
+        [
+            {
+                "raid_group_id": raid_group_id,
+                "event_type": event_type,
+                "week_number": week_number,
+                "payload": payload,
+                "created_by_id": created_by_id
+            }
+            for event_type, week_number, payload in events
+        ]
+    )
+    
+    snapshot_event_id = db.query(func.max(DistributionSnapshot.last_event_id)).filter(
+        DistributionSnapshot.raid_group_id == raid_group_id
+    ).scalar() or 0
+    pending = db.query(func.count(DistributionEvent.id)).filter(
+        DistributionEvent.raid_group_id == raid_group_id,
+        DistributionEvent.id > snapshot_event_id
+    ).scalar()
+    
+    if pending >= settings.DISTRIBUTION_SNAPSHOT_INTERVAL:
+        create_snapshot(db, raid_group_id)
+
+def load_state(db: Session, raid_group_id: int, week_number: Optional[int] = None) -> Optional[Dict]:
+    """
+    가장 가까운 스냅샷에서 이후 이벤트를 적용하여 분배 상태 재구성
+    week_number를 주면 그 다음 주차의 첫 분배 이력 이벤트 직전 상태에
+    그 이후 뒤늦게 기록/삭제된 해당 주차 이하의 분배 이력 이벤트를 더한 상태
+    스냅샷은 DISTRIBUTION_SNAPSHOT_INTERVAL개 이벤트마다 만들어지므로 적용하는 이벤트 수는 그 이하
+    (한 번에 기록된 일괄 이벤트만큼 넘을 수 있음)
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 공대 ID
+        week_number: 조회할 주차 (없으면 현재 상태)
+    
+    Returns:
+        state: 분배 상태
+        last_event_id: 마지막으로 반영된 이벤트 ID
+        snapshot_event_id: 시작한 스냅샷의 마지막 이벤트 ID (없으면 0)
+        replayed_events: 적용한 이벤트 수
+        (기준 스냅샷 이전 주차라 재구성할 수 없으면 None)
+    """
+    snapshot_query = db.query(
+        DistributionSnapshot.last_event_id,
+        DistributionSnapshot.state
+    ).filter(
+        DistributionSnapshot.raid_group_id == raid_group_id
+    )
+    if week_number is None:
+        snapshot_query = snapshot_query.order_by(DistributionSnapshot.last_event_id.desc())
+    else:
+        # 최대 주차는 이벤트 순서대로 커지므로 해당 주차 이하 중 가장 늦은 스냅샷
+        snapshot_query = snapshot_query.filter(
+            DistributionSnapshot.week_number <= week_number
+        ).order_by(
+            DistributionSnapshot.week_number.desc(),
+            DistributionSnapshot.last_event_id.desc()
+        )
+    snapshot = snapshot_query.first()
+    
+    if snapshot:
+        snapshot_event_id, state = snapshot.last_event_id, copy.deepcopy(snapshot.state)
+    else:
+        # 기준 스냅샷이 있으면 그 이전 상태는 이벤트로 남아 있지 않음
+        has_baseline = db.query(DistributionSnapshot.id).filter(
+            DistributionSnapshot.raid_group_id == raid_group_id,
+            DistributionSnapshot.is_baseline == True
+        ).first()
+        if has_baseline:
+            return None
+        snapshot_event_id, state = 0, empty_state()
+    
+    event_query = select(
+        DistributionEvent.id,
+        DistributionEvent.event_type,
+        DistributionEvent.week_number,
+        DistributionEvent.payload
+    ).where(
+        DistributionEvent.raid_group_id == raid_group_id,
+        DistributionEvent.id > snapshot_event_id
+    ).order_by(
+        DistributionEvent.id.asc()
+    ).execution_options(yield_per=settings.DISTRIBUTION_SNAPSHOT_INTERVAL)
+    
+    last_event_id = snapshot_event_id
+    replayed_events = 0
+    cut_event_id = None
+    events = db.execute(event_query)
+    try:
+        for event_id, event_type, event_week, payload in events:
+            if week_number is not None and event_week is not None and event_week > week_number:
+                cut_event_id = event_id
+                break
+            apply_event(state, event_type, payload)
+            last_event_id = event_id
+            replayed_events += 1
+    finally:
+        # 중간에 멈춰도 남은 결과를 읽지 않도록 커서 정리
+        events.close()
+    
+    if cut_event_id is not None:
+        # 다음 주차 이후에 뒤늦게 기록/삭제된 해당 주차 이하의 분배 이력 이벤트도 반영
+        # (공대/주차/ID 인덱스로 해당 이벤트만 조회)
+        for event_id, event_type, event_week, payload in db.execute(
+            event_query.where(
+                DistributionEvent.id > cut_event_id,
+                DistributionEvent.week_number <= week_number
+            )
+        ):
+            apply_event(state, event_type, payload)
+            last_event_id = event_id
+            replayed_events += 1
+    
+    return {
+        "state": state,
+        "last_event_id": last_event_id,
+        "snapshot_event_id": snapshot_event_id,
+        "replayed_events": replayed_events
+    }
+
+def create_snapshot(db: Session, raid_group_id: int) -> Optional[DistributionSnapshot]:
+    """
+    현재 분배 상태 스냅샷 생성 (커밋은 호출자가 처리)
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 공대 ID
+    
+    Returns:
+        생성된 스냅샷 (마지막 스냅샷 이후 이벤트가 없으면 None)
+    """
+    result = load_state(db, raid_group_id)
+    if not result["replayed_events"]:
+        return None
+    
+    snapshot = DistributionSnapshot(
+        raid_group_id=raid_group_id,
+        last_event_id=result["last_event_id"],
+        week_number=result["state"]["week_number"],
+        state=result["state"]
+    )
+    db.add(snapshot)
+    return snapshot
+
+def build_state_from_tables(db: Session, raid_group_id: int) -> Dict:
+    """
+    현재 테이블(분배 규칙/이력/재화 요구량)에서 분배 상태 생성
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 공대 ID
+    
+    Returns:
+        empty_state 형식의 분배 상태
+    """
+    state = empty_state()
+    
+    for user_id, obtained_resources in db.query(
+        ResourceRequirement.user_id,
+        ResourceRequirement.obtained_resources
+    ).filter(
+        ResourceRequirement.raid_group_id == raid_group_id
+    ):
+        obtained = {item_name: count for item_name, count in (obtained_resources or {}).items() if count > 0}
+        if obtained:
+            state["obtained"][str(user_id)] = obtained
+    
+    for user_id, count, max_week in db.query(
+        DistributionHistory.user_id,
+        func.count(DistributionHistory.id),
+        func.max(DistributionHistory.week_number)
+    ).filter(
+        DistributionHistory.raid_group_id == raid_group_id
+    ).group_by(DistributionHistory.user_id):
+        state["loot_counts"][str(user_id)] = count
+        state["week_number"] = max(state["week_number"], max_week or 0)
+    
+    rules = dict(db.query(ItemDistribution.id, ItemDistribution.item_name).filter(
+        ItemDistribution.raid_group_id == raid_group_id
+    ).order_by(ItemDistribution.id).all())
+    priority_orders = load_priority_orders(db, list(rules))
+    completed_users: Dict[int, List[int]] = {rule_id: [] for rule_id in rules}
+    if rules:
+        for rule_id, user_id in db.query(
+            ItemDistributionCompletion.distribution_id,
+            ItemDistributionCompletion.user_id
+        ).filter(
+            ItemDistributionCompletion.distribution_id.in_(list(rules))
+        ).order_by(ItemDistributionCompletion.id):
+            completed_users[rule_id].append(user_id)
+    
+    for rule_id, item_name in rules.items():
+        state["rules"][str(rule_id)] = {
+            "item_name": item_name,
+            "priority_order": priority_orders[rule_id],
+            "completed_users": completed_users[rule_id]
+        }
+    
+    return state
+
+def create_baseline_snapshots(db: Session, raid_group_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    현재 테이블 기준으로 공대별 기준 스냅샷 생성 (이벤트 로그 도입 전 데이터 반영/상태 복구용)
+    이후 상태 재구성은 이 스냅샷에서 시작
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_ids: 특정 공대만 생성할 경우 공대 ID 목록
+    
+    Returns:
+        생성된 스냅샷 수
+    """
+    query = db.query(RaidGroup.id)
+    if raid_group_ids is not None:
+        query = query.filter(RaidGroup.id.in_(list(raid_group_ids)))
+    group_ids = [group_id for (group_id,) in query.order_by(RaidGroup.id)]
+    
+    for group_id in group_ids:
+        # 스냅샷을 만드는 동안 이벤트가 추가되지 않도록 잠금
+        db.query(RaidGroup.id).filter(RaidGroup.id == group_id).with_for_update().scalar()
+        
+        last_event_id, event_week = db.query(
+            func.max(DistributionEvent.id),
+            func.max(DistributionEvent.week_number)
+        ).filter(
+            DistributionEvent.raid_group_id == group_id
+        ).one()
+        state = build_state_from_tables(db, group_id)
+        # 주차별 스냅샷 선택이 맞도록 이미 기록된 이벤트의 주차보다 작아지지 않게 함
+        # (삭제된 이력의 주차도 이벤트 로그에는 남아 있음)
+        state["week_number"] = max(state["week_number"], event_week or 0)
+        
+        db.add(DistributionSnapshot(
+            raid_group_id=group_id,
+            last_event_id=last_event_id or 0,
+            week_number=state["week_number"],
+            state=state,
+            is_baseline=True
+        ))
+    
+    db.commit()
+    return len(group_ids)
@@ -0,0 +1,147 @@
+from typing import Dict, Iterable, List, Sequence
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.item_distribution import ItemDistribution, ItemDistributionPriority, ItemDistributionCompletion
+
+def bump_rule_versions(db: Session, rule_ids: Iterable[int]) -> None:
+    """
+    자식 테이블만 바뀐 분배 규칙의 버전 증가 (커밋은 호출자가 처리)
+    원자적 증가이므로 동시에 호출해도 유실되지 않고 규칙을 조회해 둔 다른 요청의 수정은 409가 됨
+    
+    Args:
+        db: 데이터베이스 세션
+        rule_ids: 분배 규칙 ID 목록
+    """
+    rule_ids = list(rule_ids)
+    if rule_ids:
+        db.execute(
+            update(ItemDistribution).where(
+                ItemDistribution.id.in_(rule_ids)
+            ).values(
+                version=ItemDistribution.version + 1
+            ).execution_options(synchronize_session=False)
+        )
+
+def load_priority_orders(db: Session, rule_ids: Sequence[int]) -> Dict[int, List[int]]:
+    """
+    여러 분배 규칙의 우선순위 순서를 한 번에 조회
+    
+    Args:
+        db: 데이터베이스 세션
+        rule_ids: 분배 규칙 ID 목록
+    
+    Returns:
+        규칙 ID별 우선순위 순서 (user_id 리스트, 순서가 없는 규칙은 빈 리스트)
+    """
+    orders: Dict[int, List[int]] = {rule_id: [] for rule_id in rule_ids}
+    if not orders:
+        return orders
+    
+    for rule_id, user_id in db.query(
+        ItemDistributionPriority.distribution_id,
+        ItemDistributionPriority.user_id
+    ).filter(
+        ItemDistributionPriority.distribution_id.in_(list(orders))
+    ).order_by(
+        ItemDistributionPriority.distribution_id,
+        ItemDistributionPriority.position
+    ):
+        orders[rule_id].append(user_id)
+    
+    return orders
+
+def replace_priority_orders(db: Session, orders: Dict[int, List[int]]) -> None:
+    """
+    여러 분배 규칙의 우선순위 순서를 한 번의 DELETE와 INSERT로 교체 (커밋은 호출자가 처리)
+    
+    Args:
+        db: 데이터베이스 세션
+        orders: 규칙 ID별 새 우선순위 순서
+    """
+    if not orders:
+        return
+    
+    db.execute(
+        delete(ItemDistributionPriority).where(
+            ItemDistributionPriority.distribution_id.in_(list(orders))
+        )
+    )
+    
+    rows = [
+        {"distribution_id": rule_id, "user_id": user_id, "position": position}
+        for rule_id, user_ids in orders.items()
+        for position, user_id in enumerate(dict.fromkeys(user_ids))
+    ]
+    if rows:
+        db.execute(insert(ItemDistributionPriority), rows)
+    
+    bump_rule_versions(db, orders)
+
+def add_completed_users(db: Session, completions: Dict[int, Iterable[int]]) -> None:
+    """
+    분배 규칙별 획득 완료 멤버 추가 (커밋은 호출자가 처리)
+    이미 있는 (규칙, 멤버)는 건너뛰고 나머지는 한 번의 INSERT로 저장
+    
+    Args:
+        db: 데이터베이스 세션
+        completions: 규칙 ID별 획득한 사용자 ID 목록
+    """
+    pairs = {
+        (rule_id, user_id)
+        for rule_id, user_ids in completions.items()
+        for user_id in user_ids
+    }
+    if not pairs:
+        return
+    
+    rule_ids = {rule_id for rule_id, _ in pairs}
+    user_ids = {user_id for _, user_id in pairs}
+    
+    for attempt in range(2):
+        existing = {
+            (rule_id, user_id)
+            for rule_id, user_id in db.query(
+                ItemDistributionCompletion.distribution_id,
+                ItemDistributionCompletion.user_id
+            ).filter(
+                ItemDistributionCompletion.distribution_id.in_(rule_ids),
+                ItemDistributionCompletion.user_id.in_(user_ids)
+            )
+        }
+        
+        missing = sorted(pairs - existing)
+        if not missing:
+            return
+        
+        try:
+            # 다른 요청이 같은 멤버를 먼저 기록하면 이 INSERT만 취소하고 다시 확인
+            with db.begin_nested():
+                db.execute(
+                    insert(ItemDistributionCompletion),
+                    [{"distribution_id": rule_id, "user_id": user_id} for rule_id, user_id in missing]
+                )
+            bump_rule_versions(db, {rule_id for rule_id, _ in missing})
+            return
+        except IntegrityError:
+            if attempt:
+                raise
+
+def remove_completed_user(db: Session, rule_id: int, user_id: int) -> None:
+    """
+    분배 규칙의 획득 완료 멤버 제거 (커밋은 호출자가 처리)
+    
+    Args:
+        db: 데이터베이스 세션
+        rule_id: 분배 규칙 ID
+        user_id: 사용자 ID
+    """
+    result = db.execute(
+        delete(ItemDistributionCompletion).where(
+            ItemDistributionCompletion.distribution_id == rule_id,
+            ItemDistributionCompletion.user_id == user_id
+        )
+    )
+    if result.rowcount:
+        bump_rule_versions(db, [rule_id])
@@ -0,0 +1,116 @@
+from typing import Optional
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.equipment import Equipment, EquipmentSet, EquipmentSetItem, EquipmentSlot
+
+# 전체 부위 수 (무기는 메인+보조 2개로 계산)
+SET_SLOT_COUNT = 11
+
+def _item_level_weight(equipment_id: int):
+    """장비 테이블 기준 장비 하나의 아이템 레벨 (무기는 2개로 계산, 장비가 없으면 0)"""
+    return func.coalesce(
+        select(case(
+            (Equipment.slot == EquipmentSlot.WEAPON, Equipment.item_level * 2),
+            else_=Equipment.item_level
+        )).where(Equipment.id == equipment_id).scalar_subquery(),
+        0
+    )
+
+def apply_set_item_level_delta(
+    db: Session,
+    set_id: int,
+    added_equipment_id: Optional[int] = None,
+    removed_equipment_id: Optional[int] = None
+) -> None:
+    """
+    장비 세트의 아이템 레벨 합계에 바뀐 부위의 증감 반영 (커밋은 호출자가 처리)
+    증감은 UPDATE 안에서 장비 테이블로 계산하므로 워커별 장비 카탈로그가 오래되어도 어긋나지 않고
+    원자적 UPDATE 한 번으로 합계와 평균 아이템 레벨을 함께 갱신
+    
+    Args:
+        db: 데이터베이스 세션
+        set_id: 장비 세트 ID
+        added_equipment_id: 부위에 새로 들어간 장비 ID
+        removed_equipment_id: 부위에서 빠진 장비 ID
+    """
+    if added_equipment_id == removed_equipment_id:
+        return
+    
+    delta = _item_level_weight(added_equipment_id) if added_equipment_id is not None else 0
+    if removed_equipment_id is not None:
+        delta = delta - _item_level_weight(removed_equipment_id)
+    
+    db.execute(
+        update(EquipmentSet).where(EquipmentSet.id == set_id).values(
+            item_level_sum=EquipmentSet.item_level_sum + delta,
+            total_item_level=(EquipmentSet.item_level_sum + delta) // SET_SLOT_COUNT
+        ).execution_options(synchronize_session=False)
+    )
+
+def _actual_item_level_sum():
+    """세트 아이템과 장비 테이블 기준 아이템 레벨 합계 (상관 서브쿼리)"""
+    return select(
+        func.coalesce(func.sum(case(
+            (Equipment.slot == EquipmentSlot.WEAPON, Equipment.item_level * 2),
+            else_=Equipment.item_level
+        )), 0)
+    ).select_from(EquipmentSetItem).join(
+        Equipment, Equipment.id == EquipmentSetItem.equipment_id
+    ).where(
+        EquipmentSetItem.equipment_set_id == EquipmentSet.id
+    ).correlate(EquipmentSet).scalar_subquery()
+
+def refresh_set_item_levels(
+    db: Session,
+    set_id: Optional[int] = None,
+    equipment_id: Optional[int] = None
+) -> int:
+    """
+    세트 아이템과 장비 테이블에서 세트별 아이템 레벨을 다시 계산 (커밋은 호출자가 처리)
+    
+    Args:
+        db: 데이터베이스 세션
+        set_id: 특정 세트만 계산할 경우 세트 ID
+        equipment_id: 특정 장비를 포함한 세트만 계산할 경우 장비 ID
+    
+    Returns:
+        갱신된 세트 수
+    """
+    query = db.query(EquipmentSet)
+    if set_id is not None:
+        query = query.filter(EquipmentSet.id == set_id)
+    if equipment_id is not None:
+        query = query.filter(EquipmentSet.id.in_(
+            select(EquipmentSetItem.equipment_set_id).where(EquipmentSetItem.equipment_id == equipment_id)
+        ))
+    
+    item_level_sum = _actual_item_level_sum()
+    return query.update(
+        {
+            EquipmentSet.item_level_sum: item_level_sum,
+            EquipmentSet.total_item_level: item_level_sum // SET_SLOT_COUNT
+        },
+        synchronize_session=False
+    )
+
+def recalculate_set_item_levels(
+    db: Session,
+    set_id: Optional[int] = None,
+    equipment_id: Optional[int] = None
+) -> int:
+    """
+    세트 아이템과 장비 테이블에서 세트별 아이템 레벨을 다시 계산하여 저장
+    (장비 아이템 레벨 수정 반영/복구용, 한 번의 UPDATE로 처리)
+    
+    Args:
+        db: 데이터베이스 세션
+        set_id: 특정 세트만 계산할 경우 세트 ID
+        equipment_id: 특정 장비를 포함한 세트만 계산할 경우 장비 ID
+    
+    Returns:
+        갱신된 세트 수
+    """
+    updated = refresh_set_item_levels(db, set_id, equipment_id)
+    db.commit()
+    return updated
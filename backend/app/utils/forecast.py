@@ -0,0 +1,224 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.utils.priority import PriorityWeights
+
+# 한 번에 시뮬레이션하는 묶음 크기 (시드를 묶음 단위로 나누므로 워커 수와 관계없이 결과가 같음)
+SIMULATION_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class LootSource:
+    """
+    주간 획득 재화 출처
+    personal이면 모든 멤버가 매주 받고 (후보 중 가장 많이 필요한 아이템으로 사용)
+    아니면 후보 중 하나가 무작위로 드랍되어 분배 방식에 따라 한 명에게 분배됨
+    """
+    item_names: Tuple[str, ...]
+    units: Tuple[int, ...]  # 후보별 드랍 1개가 채우는 재화 수
+    count: int = 1  # 주당 드랍 개수
+    personal: bool = False
+
+def _compile_sources(sources: Sequence[LootSource], item_index: Dict[str, int]) -> List[Tuple]:
+    # 아이템 이름을 열 인덱스로 바꾸어 워커로 넘길 수 있는 형태로 변환
+    compiled = []
+    for source in sources:
+        compiled.append((
+            np.array([item_index[item_name] for item_name in source.item_names], dtype=np.intp),
+            np.array(source.units, dtype=np.int64),
+            source.count,
+            source.personal
+        ))
+    return compiled
+
+def simulate_chunk(
+    remaining: np.ndarray,
+    sources: List[Tuple],
+    priority_method: bool,
+    weights: PriorityWeights,
+    attendance: np.ndarray,
+    loot_counts: np.ndarray,
+    simulations: int,
+    max_weeks: int,
+    seed: np.random.SeedSequence
+) -> np.ndarray:
+    """
+    시뮬레이션 한 묶음 실행 (프로세스 풀에서 호출)
+    (시뮬레이션 x 멤버 x 아이템) 배열로 모든 시뮬레이션을 한 주씩 함께 진행
+    
+    Args:
+        remaining: (멤버 x 아이템) 남은 재화
+        sources: _compile_sources 결과
+        priority_method: 우선순위 분배 여부 (아니면 먹고 빠지기)
+        weights: 우선순위 점수 가중치
+        attendance: 멤버별 참석률
+        loot_counts: 멤버별 기존 획득 아이템 수
+        simulations: 시뮬레이션 수
+        max_weeks: 최대 주차
+        seed: 난수 시드
+    
+    Returns:
+        (시뮬레이션 x 멤버) BIS 도달 주차 (max_weeks 안에 도달하지 못하면 max_weeks + 1)
+    """
+    rng = np.random.default_rng(seed)
+    member_count = remaining.shape[0]
+    
+    state = np.repeat(remaining[None, :, :], simulations, axis=0)
+    totals = state.sum(axis=2)
+    received = np.repeat(loot_counts[None, :].astype(np.float64), simulations, axis=0)
+    sim_index = np.arange(simulations)
+    member_index = np.arange(member_count)
+    
+    # 참석률은 시뮬레이션 중 바뀌지 않으므로 미리 계산
+    member_bonus = weights.attendance * attendance
+    
+    weeks = np.full((simulations, member_count), max_weeks + 1, dtype=np.int32)
+    weeks[totals == 0] = 0
+    
+    for week in range(1, max_weeks + 1):
+        for columns, units, count, personal in sources:
+            if personal:
+                # 모든 멤버가 후보 중 가장 많이 필요한 아이템에 사용
+                for _ in range(count):
+                    needed = state[:, :, columns]
+                    choice = needed.argmax(axis=2)
+                    current = np.take_along_axis(needed, choice[:, :, None], axis=2)[:, :, 0]
+                    updated = np.maximum(current - units[choice], 0)
+                    state[sim_index[:, None], member_index[None, :], columns[choice]] = updated
+                    totals -= current - updated
+                continue
+            
+            picks = rng.integers(len(columns), size=(simulations, count))
+            for draw in range(count):
+                choice = picks[:, draw]
+                items = columns[choice]
+                needed = state[sim_index, :, items]
+                eligible = needed > 0
+                
+                if priority_method:
+                    # 우선순위 엔진과 같은 점수 (동점이면 먼저 입력된 멤버)
+                    scores = (
+                        weights.item_need * needed
+                        + weights.total_need * totals
+                        + member_bonus
+                        - weights.previous_loot * received
+                    )
+                    recipients = np.where(eligible, scores, -np.inf).argmax(axis=1)
+                else:
+                    # 먹고 빠지기: 필요한 멤버 중 지금까지 적게 받은 멤버 (동점이면 무작위)
+                    keys = received + rng.random((simulations, member_count))
+                    recipients = np.where(eligible, keys, np.inf).argmin(axis=1)
+                
+                # 필요한 멤버가 없으면 분배하지 않음
+                assigned = eligible.any(axis=1)
+                sims = sim_index[assigned]
+                members = recipients[assigned]
+                items = items[assigned]
+                current = state[sims, members, items]
+                updated = np.maximum(current - units[choice[assigned]], 0)
+                state[sims, members, items] = updated
+                totals[sims, members] -= current - updated
+                received[sims, members] += 1
+        
+        weeks[(totals == 0) & (weeks > max_weeks)] = week
+        if (weeks <= max_weeks).all():
+            break
+    
+    return weeks
+
+def summarize_weeks(weeks: np.ndarray, max_weeks: int) -> Dict:
+    """
+    BIS 도달 주차 표본 요약
+    
+    Args:
+        weeks: 시뮬레이션별 BIS 도달 주차 (도달하지 못하면 max_weeks + 1)
+        max_weeks: 최대 주차
+    
+    Returns:
+        평균/중앙값/90% 주차, 도달 비율, 주차별 확률 (인덱스 = 주차)
+    """
+    completed = weeks[weeks <= max_weeks]
+    distribution = np.bincount(completed, minlength=1) / len(weeks)
+    
+    def quantile(q: float) -> Optional[int]:
+        value = int(np.quantile(weeks, q, method="inverted_cdf"))
+        return value if value <= max_weeks else None
+    
+    return {
+        "mean_weeks": round(float(completed.mean()), 2) if completed.size else None,
+        "median_weeks": quantile(0.5),
+        "p90_weeks": quantile(0.9),
+        "completion_rate": round(completed.size / len(weeks), 4),
+        "weeks_distribution": [round(float(probability), 4) for probability in distribution]
+    }
+
+def forecast_weeks_to_bis(
+    remaining_resources: Sequence[Dict[str, int]],
+    sources: Sequence[LootSource],
+    priority_method: bool,
+    weights: PriorityWeights,
+    attendance: Sequence[float],
+    loot_counts: Sequence[int],
+    simulations: int,
+    max_weeks: int,
+    seed: Optional[int] = None,
+    map_chunks=map
+) -> Dict:
+    """
+    몬테카를로 시뮬레이션으로 멤버별/공대 전체 BIS 도달 주차 분포 계산
+    
+    Args:
+        remaining_resources: 멤버별 남은 재화
+        sources: 주간 획득 재화 출처 (드랍 테이블)
+        priority_method: 우선순위 분배 여부 (아니면 먹고 빠지기)
+        weights: 우선순위 점수 가중치
+        attendance: 멤버별 참석률
+        loot_counts: 멤버별 기존 획득 아이템 수
+        simulations: 시뮬레이션 수
+        max_weeks: 최대 주차
+        seed: 난수 시드 (같은 시드면 같은 결과)
+        map_chunks: 묶음 실행에 사용할 map 함수 (프로세스 풀의 map 등)
+    
+    Returns:
+        members: 멤버 순서대로 주차 분포 요약
+        group: 공대 전체 (가장 늦은 멤버 기준) 주차 분포 요약
+        ignored_items: 드랍 테이블로 얻을 수 없어 계산에서 제외한 아이템
+    """
+    item_names = sorted({item_name for source in sources for item_name in source.item_names})
+    item_index = {item_name: index for index, item_name in enumerate(item_names)}
+    
+    remaining = np.zeros((len(remaining_resources), len(item_names)), dtype=np.int64)
+    ignored_items = set()
+    for row, resources in enumerate(remaining_resources):
+        for item_name, count in resources.items():
+            if item_name in item_index:
+                remaining[row, item_index[item_name]] = max(0, count)
+            elif count > 0:
+                ignored_items.add(item_name)
+    
+    compiled = _compile_sources(sources, item_index)
+    attendance = np.asarray(attendance, dtype=np.float64)
+    loot_counts = np.asarray(loot_counts, dtype=np.float64)
+    
+    chunk_sizes = [
+        min(SIMULATION_CHUNK_SIZE, simulations - start)
+        for start in range(0, simulations, SIMULATION_CHUNK_SIZE)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    
+    chunks = list(map_chunks(
+        simulate_chunk,
+        *zip(*[
+            (remaining, compiled, priority_method, weights, attendance, loot_counts, size, max_weeks, chunk_seed)
+            for size, chunk_seed in zip(chunk_sizes, seeds)
+        ])
+    ))
+    weeks = np.concatenate(chunks, axis=0)
+    
+    return {
+        "members": [summarize_weeks(weeks[:, column], max_weeks) for column in range(weeks.shape[1])],
+        "group": summarize_weeks(weeks.max(axis=1), max_weeks),
+        "ignored_items": sorted(ignored_items)
+    }
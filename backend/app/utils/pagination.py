@@ -0,0 +1,60 @@
+import base64
+import json
+from datetime import date, datetime, time
+from typing import Any, Sequence, Tuple
+
+# 다음 페이지 커서를 전달하는 응답 헤더 (목록 응답 형식은 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    정렬 키 값을 불투명한 커서 문자열로 변환
+    
+    Args:
+        values: 마지막 항목의 정렬 키 값 (날짜/시간은 ISO 형식으로 저장)
+    
+    Returns:
+        URL에 그대로 쓸 수 있는 커서 문자열
+    """
+    payload = [
+        value.isoformat() if isinstance(value, (date, time)) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple:
+    """
+    커서 문자열을 정렬 키 값으로 복원
+    
+    Args:
+        cursor: encode_cursor로 만든 커서
+        types: 정렬 키별 타입 (datetime, date, time, int)
+    
+    Returns:
+        정렬 키 값 튜플
+    
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    
+    if not isinstance(payload, list) or len(payload) != len(types):
+        raise ValueError("Invalid cursor")
+    
+    values = []
+    for value, value_type in zip(payload, types):
+        if value_type in (datetime, date, time):
+            if not isinstance(value, str):
+                raise ValueError("Invalid cursor")
+            value = value_type.fromisoformat(value)
+        elif value_type is int:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError("Invalid cursor")
+        values.append(value)
+    return tuple(values)
@@ -0,0 +1,285 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import func, Integer, cast
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.raid import RaidGroup, DistributionMethod
+from app.models.item_distribution import ItemDistribution, DistributionHistory, ResourceRequirement
+from app.models.raid_schedule import RaidSchedule, RaidAttendance
+from app.utils.distribution_rules import load_priority_orders, replace_priority_orders
+from app.utils.distribution_events import PRIORITIES_UPDATED, append_distribution_events
+
+# 우선순위를 계산하는 아이템 (낱장 / 보강 재료)
+PRIORITY_ITEMS = (
+    "귀걸이_낱장", "목걸이_낱장", "팔찌_낱장", "반지_낱장",
+    "머리_낱장", "장갑_낱장", "신발_낱장",
+    "상의_낱장", "하의_낱장",
+    "무기_낱장",
+    "경화약", "강화섬유", "강화약"
+)
+
+
+@dataclass(frozen=True)
+class PriorityWeights:
+    """
+    우선순위 점수 가중치
+    점수 = 아이템 남은 필요량 * item_need + 전체 남은 필요량 * total_need
+         + 참석률 * attendance - 지금까지 획득한 아이템 수 * previous_loot
+    """
+    item_need: float = 1000.0
+    total_need: float = 1.0
+    attendance: float = 0.0
+    previous_loot: float = 0.0
+    
+    @classmethod
+    def from_settings(cls) -> "PriorityWeights":
+        """설정 파일의 가중치 사용"""
+        return cls(
+            item_need=settings.PRIORITY_WEIGHT_ITEM_NEED,
+            total_need=settings.PRIORITY_WEIGHT_TOTAL_NEED,
+            attendance=settings.PRIORITY_WEIGHT_ATTENDANCE,
+            previous_loot=settings.PRIORITY_WEIGHT_PREVIOUS_LOOT
+        )
+
+def calculate_priority_orders(
+    requirements: Sequence[ResourceRequirement],
+    weights: Optional[PriorityWeights] = None,
+    attendance_rates: Optional[Dict[tuple, float]] = None,
+    loot_counts: Optional[Dict[tuple, int]] = None,
+    item_names: Sequence[str] = PRIORITY_ITEMS
+) -> Dict[int, Dict[str, List[int]]]:
+    """
+    재화 요구량 기반 아이템별 우선순위 계산
+    (멤버 x 아이템) 행렬을 한 번 만들고 점수와 순서를 배열 연산으로 계산하므로
+    여러 공대의 요구량을 한 번에 넘겨도 됨
+    
+    Args:
+        requirements: 재화 요구량 목록 (여러 공대 가능)
+        weights: 점수 가중치 (기본값은 설정 파일)
+        attendance_rates: (공대 ID, 사용자 ID)별 참석률 (0~1)
+        loot_counts: (공대 ID, 사용자 ID)별 획득 아이템 수
+        item_names: 우선순위를 계산할 아이템 이름 목록
+    
+    Returns:
+        공대 ID별 {아이템 이름: 우선순위 순서 (user_id 리스트)}
+        남은 필요량이 있는 멤버가 없는 아이템은 제외
+    """
+    weights = weights or PriorityWeights.from_settings()
+    attendance_rates = attendance_rates or {}
+    loot_counts = loot_counts or {}
+    
+    if not requirements or not item_names:
+        return {}
+    
+    member_count = len(requirements)
+    item_index = {item_name: index for index, item_name in enumerate(item_names)}
+    
+    # 남은 필요량 행렬과 멤버별 벡터
+    needed = np.zeros((member_count, len(item_names)), dtype=np.float64)
+    required_mask = np.zeros((member_count, len(item_names)), dtype=bool)
+    total_need = np.zeros(member_count, dtype=np.float64)
+    attendance = np.zeros(member_count, dtype=np.float64)
+    loot = np.zeros(member_count, dtype=np.float64)
+    group_ids = np.empty(member_count, dtype=np.int64)
+    user_ids = np.empty(member_count, dtype=np.int64)
+    
+    for row, requirement in enumerate(requirements):
+        required = requirement.required_resources or {}
+        obtained = requirement.obtained_resources or {}
+        key = (requirement.raid_group_id, requirement.user_id)
+        
+        for item_name, need in required.items():
+            column = item_index.get(item_name)
+            if column is not None:
+                required_mask[row, column] = True
+                needed[row, column] = need - obtained.get(item_name, 0)
+        
+        total_need[row] = sum((requirement.remaining_resources or {}).values())
+        attendance[row] = attendance_rates.get(key, 0.0)
+        loot[row] = loot_counts.get(key, 0)
+        group_ids[row] = requirement.raid_group_id
+        user_ids[row] = requirement.user_id
+    
+    # 점수 계산 (멤버 x 아이템)
+    member_scores = (
+        weights.total_need * total_need
+        + weights.attendance * attendance
+        - weights.previous_loot * loot
+    )
+    scores = weights.item_need * needed + member_scores[:, None]
+    eligible = required_mask & (needed > 0)
+    
+    # 아이템마다 (공대, 점수 내림차순)으로 정렬 (동점이면 입력 순서 유지)
+    orders = np.lexsort((
+        -scores.T,
+        np.broadcast_to(group_ids, (len(item_names), member_count))
+    ))
+    
+    priorities: Dict[int, Dict[str, List[int]]] = {}
+    for column, item_name in enumerate(item_names):
+        order = orders[column]
+        order = order[eligible[order, column]]
+        if order.size == 0:
+            continue
+        
+        # 공대 경계에서 나누기
+        sorted_groups = group_ids[order]
+        boundaries = np.flatnonzero(np.diff(sorted_groups)) + 1
+        for group_order in np.split(order, boundaries):
+            group_id = int(group_ids[group_order[0]])
+            priorities.setdefault(group_id, {})[item_name] = user_ids[group_order].tolist()
+    
+    return priorities
+
+def load_priority_inputs(
+    db: Session,
+    group_ids: Sequence[int],
+    weights: PriorityWeights
+) -> Dict:
+    """
+    우선순위 계산에 필요한 데이터를 공대 수와 관계없이 고정된 쿼리 수로 조회
+    가중치가 0인 항목은 조회하지 않음
+    
+    Args:
+        db: 데이터베이스 세션
+        group_ids: 공대 ID 목록
+        weights: 점수 가중치
+    
+    Returns:
+        calculate_priority_orders 인자 (requirements, attendance_rates, loot_counts)
+    """
+    requirements = db.query(ResourceRequirement).filter(
+        ResourceRequirement.raid_group_id.in_(group_ids)
+    ).order_by(ResourceRequirement.id.asc()).all()
+    
+    attendance_rates = {}
+    if weights.attendance:
+        rows = db.query(
+            RaidSchedule.raid_group_id,
+            RaidAttendance.user_id,
+            func.count(RaidAttendance.id),
+            func.sum(cast(RaidAttendance.actually_attended == True, Integer))
+        ).join(
+            RaidSchedule, RaidSchedule.id == RaidAttendance.schedule_id
+        ).filter(
+            RaidSchedule.raid_group_id.in_(group_ids),
+            RaidSchedule.is_cancelled == False
+        ).group_by(RaidSchedule.raid_group_id, RaidAttendance.user_id).all()
+        attendance_rates = {
+            (group_id, user_id): (attended or 0) / total
+            for group_id, user_id, total, attended in rows
+            if total
+        }
+    
+    loot_counts = {}
+    if weights.previous_loot:
+        rows = db.query(
+            DistributionHistory.raid_group_id,
+            DistributionHistory.user_id,
+            func.count(DistributionHistory.id)
+        ).filter(
+            DistributionHistory.raid_group_id.in_(group_ids)
+        ).group_by(DistributionHistory.raid_group_id, DistributionHistory.user_id).all()
+        loot_counts = {
+            (group_id, user_id): count
+            for group_id, user_id, count in rows
+        }
+    
+    return {
+        "requirements": requirements,
+        "attendance_rates": attendance_rates,
+        "loot_counts": loot_counts
+    }
+
+def apply_priority_orders(
+    db: Session,
+    priorities: Dict[int, Dict[str, List[int]]],
+    created_by_id: Optional[int] = None
+) -> Dict[int, List[str]]:
+    """
+    계산된 우선순위를 활성 분배 규칙에 반영 (커밋은 호출자가 처리)
+    규칙과 현재 순서는 한 번씩 조회하고 순서가 바뀐 규칙만 한 번의 DELETE와 INSERT로 교체
+    
+    Args:
+        db: 데이터베이스 세션
+        priorities: 공대 ID별 {아이템 이름: 우선순위 순서}
+        created_by_id: 요청한 사용자 ID (분배 이벤트 기록용)
+    
+    Returns:
+        공대 ID별 활성 분배 규칙이 없는 아이템 이름 목록
+    """
+    if not priorities:
+        return {}
+    
+    # (공대 ID, 아이템 이름) -> 규칙 ID
+    rules = {}
+    for rule_id, group_id, item_name in db.query(
+        ItemDistribution.id,
+        ItemDistribution.raid_group_id,
+        ItemDistribution.item_name
+    ).filter(
+        ItemDistribution.raid_group_id.in_(list(priorities)),
+        ItemDistribution.is_active == True
+    ).order_by(ItemDistribution.id.asc()):
+        # 같은 이름의 규칙이 여러 개면 기존처럼 먼저 만든 규칙에 반영
+        rules.setdefault((group_id, item_name), rule_id)
+    
+    current_orders = load_priority_orders(db, list(rules.values()))
+    
+    updates = {}
+    group_updates: Dict[int, Dict[str, List[int]]] = {}
+    missing_rules = {}
+    for group_id, group_priorities in priorities.items():
+        for item_name, priority_order in group_priorities.items():
+            rule_id = rules.get((group_id, item_name))
+            if rule_id is None:
+                missing_rules.setdefault(group_id, []).append(item_name)
+            elif current_orders[rule_id] != priority_order:
+                updates[rule_id] = priority_order
+                group_updates.setdefault(group_id, {})[str(rule_id)] = list(priority_order)
+    
+    replace_priority_orders(db, updates)
+    
+    # 순서가 바뀐 공대만 분배 이벤트 기록
+    for group_id, orders in group_updates.items():
+        append_distribution_events(db, group_id, [(PRIORITIES_UPDATED, None, {"orders": orders})], created_by_id)
+    
+    return missing_rules
+
+def recalculate_priorities(
+    db: Session,
+    group_ids: Optional[Sequence[int]] = None,
+    weights: Optional[PriorityWeights] = None
+) -> Dict:
+    """
+    여러 공대의 우선순위를 한 번에 계산하여 분배 규칙에 반영
+    
+    Args:
+        db: 데이터베이스 세션
+        group_ids: 공대 ID 목록 (없으면 우선순위 분배 방식의 모든 공대)
+        weights: 점수 가중치 (기본값은 설정 파일)
+    
+    Returns:
+        priorities: 공대 ID별 {아이템 이름: 우선순위 순서}
+        missing_rules: 공대 ID별 활성 분배 규칙이 없는 아이템 이름 목록
+    """
+    weights = weights or PriorityWeights.from_settings()
+    
+    if group_ids is None:
+        group_ids = [
+            group_id for (group_id,) in db.query(RaidGroup.id).filter(
+                RaidGroup.distribution_method == DistributionMethod.PRIORITY
+            ).all()
+        ]
+    if not group_ids:
+        return {"priorities": {}, "missing_rules": {}}
+    
+    priorities = calculate_priority_orders(weights=weights, **load_priority_inputs(db, group_ids, weights))
+    
+    missing_rules = apply_priority_orders(db, priorities)
+    db.commit()
+    
+    return {"priorities": priorities, "missing_rules": missing_rules}
@@ -0,0 +1,207 @@
+from typing import Dict, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.item_distribution import DistributionHistory, ResourceRequirement
+from app.utils.priority import PRIORITY_ITEMS
+from app.utils.distribution_events import OBTAINED_UPDATED, append_distribution_events
+
+def refresh_requirement_progress(requirement: ResourceRequirement) -> None:
+    """
+    필요 재화와 획득 재화로 남은 재화와 달성률 갱신
+    
+    Args:
+        requirement: 재화 요구량 레코드
+    """
+    required_resources = requirement.required_resources or {}
+    obtained_resources = requirement.obtained_resources or {}
+    
+    # 남은 재화 계산
+    requirement.remaining_resources = {
+        key: max(0, required - obtained_resources.get(key, 0))
+        for key, required in required_resources.items()
+    }
+    
+    # 달성률 계산 (필요한 재화만, 필요량을 넘은 획득분은 제외)
+    total_required = sum(required_resources.values())
+    total_obtained = sum(
+        min(obtained_resources.get(key, 0), required)
+        for key, required in required_resources.items()
+    )
+    
+    if total_required > 0:
+        requirement.completion_percentage = min(100, int((total_obtained / total_required) * 100))
+    else:
+        requirement.completion_percentage = 100
+
+def apply_obtained_delta(
+    db: Session,
+    raid_group_id: int,
+    user_id: int,
+    item_name: str,
+    delta: int
+) -> ResourceRequirement:
+    """
+    분배 이력 추가/삭제를 획득 재화에 반영 (커밋은 호출자가 처리)
+    해당 아이템 한 개만 증감하므로 전체 재계산 없이 같은 트랜잭션에서 처리
+    필요 재화에 없는 아이템(탈것, 상자 등)은 반영하지 않음
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 공대 ID
+        user_id: 획득한 사용자 ID
+        item_name: 아이템 이름
+        delta: 증감량 (기록 시 1, 삭제 시 -1)
+    
+    Returns:
+        갱신된 재화 요구량 레코드
+    """
+    return apply_obtained_deltas(db, raid_group_id, {(user_id, item_name): delta})[user_id]
+
+def apply_obtained_deltas(
+    db: Session,
+    raid_group_id: int,
+    deltas: Dict[Tuple[int, str], int]
+) -> Dict[int, ResourceRequirement]:
+    """
+    여러 멤버/아이템의 획득 재화 증감을 한 번에 반영 (커밋은 호출자가 처리)
+    대상 멤버의 재화 요구량은 한 번의 쿼리로 잠그고 조회
+    필요 재화에 없는 아이템(탈것, 상자 등)은 반영하지 않음
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 공대 ID
+        deltas: (사용자 ID, 아이템 이름)별 증감량
+    
+    Returns:
+        사용자 ID별 갱신된 재화 요구량 레코드
+    """
+    user_ids = {user_id for user_id, _ in deltas}
+    requirements = {
+        requirement.user_id: requirement
+        for requirement in db.query(ResourceRequirement).filter(
+            ResourceRequirement.raid_group_id == raid_group_id,
+            ResourceRequirement.user_id.in_(user_ids)
+        ).with_for_update()
+    }
+    
+    # JSON 컬럼은 새 dict를 할당해야 변경이 감지됨
+    obtained = {}
+    for user_id in user_ids:
+        requirement = requirements.get(user_id)
+        if not requirement:
+            requirement = ResourceRequirement(
+                user_id=user_id,
+                raid_group_id=raid_group_id,
+                required_resources={}
+            )
+            db.add(requirement)
+            requirements[user_id] = requirement
+        obtained[user_id] = dict(requirement.obtained_resources or {})
+    
+    for (user_id, item_name), delta in deltas.items():
+        if item_name not in (requirements[user_id].required_resources or {}):
+            continue
+        count = max(0, obtained[user_id].get(item_name, 0) + delta)
+        if count:
+            obtained[user_id][item_name] = count
+        else:
+            obtained[user_id].pop(item_name, None)
+    
+    for user_id, obtained_resources in obtained.items():
+        requirement = requirements[user_id]
+        requirement.obtained_resources = obtained_resources
+        refresh_requirement_progress(requirement)
+    
+    return requirements
+
+def reconcile_obtained_resources(db: Session, raid_group_id: Optional[int] = None) -> int:
+    """
+    분배 이력에서 획득 재화를 다시 계산하고 남은 재화와 달성률도 함께 갱신
+    분배 이력으로 관리되는 아이템(낱장/보강 재료와 이력에 있는 아이템)만 덮어쓰고
+    석판처럼 직접 입력한 재화는 유지 (이력 아이템 중 필요 재화에 없는 아이템은 제외)
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 특정 공대만 계산할 경우 공대 ID
+    
+    Returns:
+        획득/남은 재화 또는 달성률이 달라져 갱신된 재화 요구량 수
+    """
+    history_query = db.query(
+        DistributionHistory.raid_group_id,
+        DistributionHistory.user_id,
+        DistributionHistory.item_name,
+        func.count(DistributionHistory.id)
+    )
+    requirement_query = db.query(ResourceRequirement)
+    if raid_group_id is not None:
+        history_query = history_query.filter(DistributionHistory.raid_group_id == raid_group_id)
+        requirement_query = requirement_query.filter(ResourceRequirement.raid_group_id == raid_group_id)
+    
+    # (공대 ID, 사용자 ID)별 아이템 획득 수
+    history_counts: Dict[tuple, Dict[str, int]] = {}
+    tracked_items: Dict[int, set] = {}
+    for group_id, user_id, item_name, count in history_query.group_by(
+        DistributionHistory.raid_group_id,
+        DistributionHistory.user_id,
+        DistributionHistory.item_name
+    ).all():
+        history_counts.setdefault((group_id, user_id), {})[item_name] = count
+        tracked_items.setdefault(group_id, set(PRIORITY_ITEMS)).add(item_name)
+    
+    requirements = {
+        (requirement.raid_group_id, requirement.user_id): requirement
+        for requirement in requirement_query.all()
+    }
+    
+    # 이력은 있지만 요구량 레코드가 없는 멤버
+    for key in history_counts.keys() - requirements.keys():
+        requirement = ResourceRequirement(
+            raid_group_id=key[0],
+            user_id=key[1],
+            required_resources={},
+            obtained_resources={}
+        )
+        db.add(requirement)
+        requirements[key] = requirement
+    
+    updated = 0
+    events: Dict[int, list] = {}
+    for key, requirement in requirements.items():
+        tracked = tracked_items.get(key[0], set(PRIORITY_ITEMS))
+        current = requirement.obtained_resources or {}
+        
+        obtained_resources = {
+            item_name: count for item_name, count in current.items()
+            if item_name not in tracked
+        }
+        required_resources = requirement.required_resources or {}
+        obtained_resources.update({
+            item_name: count for item_name, count in history_counts.get(key, {}).items()
+            if item_name in required_resources
+        })
+        
+        before = (current, requirement.remaining_resources, requirement.completion_percentage)
+        requirement.obtained_resources = obtained_resources
+        refresh_requirement_progress(requirement)
+        
+        if (obtained_resources, requirement.remaining_resources, requirement.completion_percentage) != before:
+            updated += 1
+        else:
+            # 변경이 없으면 UPDATE하지 않음
+            db.expire(requirement)
+        
+        # 분배 상태 이벤트 로그에도 복구한 획득 재화 기록
+        if obtained_resources != current:
+            events.setdefault(key[0], []).append((
+                OBTAINED_UPDATED,
+                None,
+                {"user_id": key[1], "obtained_resources": obtained_resources}
+            ))
+    
+    for group_id, group_events in events.items():
+        append_distribution_events(db, group_id, group_events)
+    
+    db.commit()
+    return updated
@@ -0,0 +1,111 @@
+from typing import Dict, Optional, Tuple
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.item_distribution import DistributionHistory, DistributionWeeklyRollup, ItemType
+
+def _model_item_type(item_type) -> ItemType:
+    # 요청 스키마의 ItemType도 같은 값의 모델 ItemType으로 변환
+    if isinstance(item_type, ItemType):
+        return item_type
+    return ItemType(getattr(item_type, "value", item_type))
+
+def apply_rollup_deltas(
+    db: Session,
+    raid_group_id: int,
+    deltas: Dict[Tuple[int, int, object], int]
+) -> None:
+    """
+    주차별 획득 집계에 증감 반영 (커밋은 호출자가 처리)
+    원자적 UPDATE로 증감하므로 동시에 기록해도 유실되지 않고
+    행이 없으면 추가하며 0이 된 행은 삭제
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 공대 ID
+        deltas: (주차, 사용자 ID, 아이템 타입)별 증감량
+    """
+    for (week_number, user_id, item_type), delta in deltas.items():
+        if not delta:
+            continue
+        
+        key = (
+            DistributionWeeklyRollup.raid_group_id == raid_group_id,
+            DistributionWeeklyRollup.week_number == week_number,
+            DistributionWeeklyRollup.user_id == user_id,
+            DistributionWeeklyRollup.item_type == _model_item_type(item_type)
+        )
+        
+        for attempt in range(2):
+            result = db.execute(
+                update(DistributionWeeklyRollup).where(*key).values(
+                    item_count=DistributionWeeklyRollup.item_count + delta
+                ).execution_options(synchronize_session=False)
+            )
+            if result.rowcount or delta < 0:
+                break
+            
+            try:
+                # 다른 요청이 같은 행을 먼저 추가하면 이 INSERT만 취소하고 다시 UPDATE
+                with db.begin_nested():
+                    db.execute(insert(DistributionWeeklyRollup).values(
+                        raid_group_id=raid_group_id,
+                        week_number=week_number,
+                        user_id=user_id,
+                        item_type=_model_item_type(item_type),
+                        item_count=delta
+                    ))
+                break
+            except IntegrityError:
+                if attempt:
+                    raise
+        
+        if delta < 0:
+            db.execute(
+                delete(DistributionWeeklyRollup).where(
+                    *key,
+                    DistributionWeeklyRollup.item_count <= 0
+                )
+            )
+
+def rebuild_loot_rollups(db: Session, raid_group_id: Optional[int] = None) -> int:
+    """
+    분배 이력에서 주차별 획득 집계를 다시 생성 (기존 데이터 백필/복구용)
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 특정 공대만 다시 생성할 경우 공대 ID
+    
+    Returns:
+        생성된 집계 행 수
+    """
+    delete_query = delete(DistributionWeeklyRollup)
+    history_query = select(
+        DistributionHistory.raid_group_id,
+        DistributionHistory.week_number,
+        DistributionHistory.user_id,
+        DistributionHistory.item_type,
+        func.count(DistributionHistory.id)
+    )
+    if raid_group_id is not None:
+        delete_query = delete_query.where(DistributionWeeklyRollup.raid_group_id == raid_group_id)
+        history_query = history_query.where(DistributionHistory.raid_group_id == raid_group_id)
+    
+    db.execute(delete_query)
+    
+    # 집계는 데이터베이스에서 한 번의 INSERT ... SELECT로 처리
+    result = db.execute(
+        insert(DistributionWeeklyRollup).from_select(
+            ["raid_group_id", "week_number", "user_id", "item_type", "item_count"],
+            history_query.group_by(
+                DistributionHistory.raid_group_id,
+                DistributionHistory.week_number,
+                DistributionHistory.user_id,
+                DistributionHistory.item_type
+            )
+        )
+    )
+    
+    db.commit()
+    return result.rowcount
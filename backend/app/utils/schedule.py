@@ -0,0 +1,484 @@
+import calendar
+from datetime import date, timedelta
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import select, insert, func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.raid import RaidMember
+from app.models.raid_schedule import RaidSchedule, RaidAttendance, RecurrenceType
+from app.schemas.raid_schedule import AttendanceStatus
+
+# 반복 일정 발생 횟수 (반복 횟수 미지정 시 기본값 / 최대값)
+DEFAULT_RECURRENCE_COUNT = 52
+MAX_RECURRENCE_COUNT = 100
+
+# 반복 일정에서 각 발생분으로 복사되는 필드
+OCCURRENCE_TEMPLATE_FIELDS = (
+    "raid_group_id", "created_by_id", "title", "description", "start_time", "end_time",
+    "target_floors", "minimum_members", "notes", "recurrence_type", "recurrence_end_date",
+    "recurrence_count", "recurrence_days"
+)
+
+# 참석 상태별 인원 수 컬럼
+ATTENDANCE_COUNT_COLUMNS = {
+    AttendanceStatus.CONFIRMED.value: RaidSchedule.confirmed_count,
+    AttendanceStatus.DECLINED.value: RaidSchedule.declined_count,
+    AttendanceStatus.TENTATIVE.value: RaidSchedule.tentative_count,
+    AttendanceStatus.PENDING.value: RaidSchedule.pending_count,
+}
+
+def _status_value(attendance_status) -> Optional[str]:
+    """참석 상태를 문자열 값으로 변환"""
+    if attendance_status is None:
+        return None
+    if isinstance(attendance_status, AttendanceStatus):
+        return attendance_status.value
+    return str(attendance_status)
+
+def apply_attendance_status_change(
+    db: Session,
+    schedule_id: int,
+    old_status,
+    new_status
+) -> None:
+    """
+    참석 상태 변경을 일정의 인원 수 컬럼에 반영
+    증감은 UPDATE 문 안에서 처리되므로 동시에 응답해도 값을 잃지 않음
+    
+    Args:
+        db: 데이터베이스 세션
+        schedule_id: 일정 ID
+        old_status: 이전 참석 상태
+        new_status: 새 참석 상태
+    """
+    old_value = _status_value(old_status)
+    new_value = _status_value(new_status)
+    if old_value == new_value:
+        return
+    
+    values = {}
+    old_column = ATTENDANCE_COUNT_COLUMNS.get(old_value)
+    new_column = ATTENDANCE_COUNT_COLUMNS.get(new_value)
+    if old_column is not None:
+        values[old_column] = old_column - 1
+    if new_column is not None:
+        values[new_column] = new_column + 1
+    
+    if values:
+        db.query(RaidSchedule).filter(
+            RaidSchedule.id == schedule_id
+        ).update(values, synchronize_session=False)
+
+def set_attendance_status(db: Session, attendance: RaidAttendance, new_status) -> bool:
+    """
+    참석 상태를 변경하고 일정의 인원 수를 같은 트랜잭션에서 갱신
+    이전 상태가 그대로일 때만 변경하므로(compare-and-set) 동시 요청에도 인원 수가 어긋나지 않음
+    
+    Args:
+        db: 데이터베이스 세션
+        attendance: 참석 레코드
+        new_status: 새 참석 상태
+    
+    Returns:
+        상태가 실제로 변경되었는지 여부
+    """
+    new_value = _status_value(new_status)
+    
+    for _ in range(3):
+        old_value = _status_value(attendance.status)
+        if old_value == new_value:
+            return False
+        
+        if old_value is None:
+            status_matches = RaidAttendance.status.is_(None)
+        else:
+            status_matches = RaidAttendance.status == old_value
+        
+        updated = db.query(RaidAttendance).filter(
+            RaidAttendance.id == attendance.id,
+            status_matches
+        ).update({RaidAttendance.status: new_value}, synchronize_session=False)
+        
+        if updated:
+            apply_attendance_status_change(db, attendance.schedule_id, old_value, new_value)
+            set_committed_value(attendance, "status", new_value)
+            return True
+        
+        # 다른 요청이 먼저 변경한 경우 최신 상태로 다시 시도
+        db.refresh(attendance)
+    
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Attendance was modified concurrently, please retry"
+    )
+
+def create_schedules_with_attendances(
+    db: Session,
+    schedule_rows: List[Dict],
+    member_ids: List[int]
+) -> List[int]:
+    """
+    일정과 공대원 참석 레코드(응답 대기)를 대량 INSERT로 생성 (커밋은 호출자가 처리)
+    일정은 다중 행 INSERT ... RETURNING 한 번, 참석 레코드는 executemany 한 번으로 저장
+    
+    Args:
+        db: 데이터베이스 세션
+        schedule_rows: 일정 컬럼 값 목록
+        member_ids: 참석 레코드를 만들 공대원 사용자 ID 목록
+    
+    Returns:
+        생성된 일정 ID 목록 (순서는 보장되지 않음)
+    """
+    if not schedule_rows:
+        return []
+    
+    # 모든 일정에 같은 참석 레코드를 만들므로 RETURNING 순서를 맞출 필요가 없음
+    # (순서 보장을 요구하면 SQLite에서는 행 단위 INSERT로 바뀜)
+    rows = [{"pending_count": len(member_ids), **row} for row in schedule_rows]
+    schedule_ids = list(db.scalars(insert(RaidSchedule).returning(RaidSchedule.id), rows))
+    
+    if member_ids:
+        db.execute(
+            insert(RaidAttendance),
+            [
+                {
+                    "schedule_id": schedule_id,
+                    "user_id": user_id,
+                    "status": AttendanceStatus.PENDING.value
+                }
+                for schedule_id in schedule_ids
+                for user_id in member_ids
+            ]
+        )
+    
+    return schedule_ids
+
+def _actual_count(attendance_status: str):
+    """참석 테이블 기준 상태별 인원 수 (상관 서브쿼리)"""
+    return select(
+        func.count(RaidAttendance.id)
+    ).where(
+        RaidAttendance.schedule_id == RaidSchedule.id,
+        RaidAttendance.status == attendance_status
+    ).correlate(RaidSchedule).scalar_subquery()
+
+def recalculate_attendance_counts(db: Session, raid_group_id: Optional[int] = None) -> int:
+    """
+    참석 테이블에서 일정별 인원 수를 다시 계산하여 저장
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 특정 공대만 계산할 경우 공대 ID
+    
+    Returns:
+        갱신된 일정 수
+    """
+    query = db.query(RaidSchedule)
+    if raid_group_id is not None:
+        query = query.filter(RaidSchedule.raid_group_id == raid_group_id)
+    
+    updated = query.update(
+        {
+            column: _actual_count(attendance_status)
+            for attendance_status, column in ATTENDANCE_COUNT_COLUMNS.items()
+        },
+        synchronize_session=False
+    )
+    db.commit()
+    return updated
+
+def find_attendance_count_mismatches(db: Session, raid_group_id: Optional[int] = None) -> List[Dict]:
+    """
+    저장된 인원 수와 참석 테이블이 일치하지 않는 일정 조회
+    
+    Args:
+        db: 데이터베이스 세션
+        raid_group_id: 특정 공대만 확인할 경우 공대 ID
+    
+    Returns:
+        불일치 일정 목록 (저장된 값과 실제 값 포함)
+    """
+    actual_columns = {
+        attendance_status: _actual_count(attendance_status).label(f"actual_{attendance_status}")
+        for attendance_status in ATTENDANCE_COUNT_COLUMNS
+    }
+    
+    query = db.query(
+        RaidSchedule.id,
+        RaidSchedule.raid_group_id,
+        *ATTENDANCE_COUNT_COLUMNS.values(),
+        *actual_columns.values()
+    ).filter(
+        or_(*[
+            column != _actual_count(attendance_status)
+            for attendance_status, column in ATTENDANCE_COUNT_COLUMNS.items()
+        ])
+    )
+    if raid_group_id is not None:
+        query = query.filter(RaidSchedule.raid_group_id == raid_group_id)
+    
+    mismatches = []
+    for row in query.all():
+        mismatches.append({
+            "schedule_id": row.id,
+            "raid_group_id": row.raid_group_id,
+            "stored": {
+                attendance_status: getattr(row, column.key)
+                for attendance_status, column in ATTENDANCE_COUNT_COLUMNS.items()
+            },
+            "actual": {
+                attendance_status: getattr(row, f"actual_{attendance_status}")
+                for attendance_status in ATTENDANCE_COUNT_COLUMNS
+            }
+        })
+    
+    return mismatches
+
+#SECTION - 반복 일정
+
+def _recurrence_value(recurrence_type) -> str:
+    """반복 유형을 문자열 값으로 변환"""
+    if recurrence_type is None:
+        return RecurrenceType.NONE.value
+    return getattr(recurrence_type, "value", recurrence_type)
+
+def is_recurring_series(schedule: RaidSchedule) -> bool:
+    """반복 규칙을 가진 원본 일정인지 확인"""
+    return (
+        schedule.parent_schedule_id is None
+        and _recurrence_value(schedule.recurrence_type) != RecurrenceType.NONE.value
+    )
+
+def _next_occurrence(current: date, recurrence: str, selected_days: List[int]) -> date:
+    """반복 유형에 따른 다음 발생일"""
+    if recurrence == RecurrenceType.DAILY.value:
+        return current + timedelta(days=1)
+    if recurrence == RecurrenceType.WEEKLY.value:
+        if selected_days:
+            # 선택된 요일 중 다음 날짜
+            for _ in range(7):
+                current += timedelta(days=1)
+                if current.weekday() in selected_days:
+                    return current
+        return current + timedelta(days=7)
+    if recurrence == RecurrenceType.BIWEEKLY.value:
+        return current + timedelta(days=14)
+    
+    # 매월 같은 날 (없는 날짜는 해당 월의 마지막 날)
+    next_month = current.month + 1
+    next_year = current.year
+    if next_month > 12:
+        next_month = 1
+        next_year += 1
+    last_day = calendar.monthrange(next_year, next_month)[1]
+    return current.replace(year=next_year, month=next_month, day=min(current.day, last_day))
+
+def iter_occurrence_dates(
+    series: RaidSchedule,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> Iterator[date]:
+    """
+    반복 일정의 발생일을 순서대로 생성 (원본 일정 날짜는 제외)
+    발생분을 미리 저장하지 않고 조회 범위에 해당하는 날짜만 계산
+    
+    Args:
+        series: 반복 규칙을 가진 원본 일정
+        from_date: 조회 시작일
+        to_date: 조회 종료일
+    
+    Returns:
+        발생일 이터레이터
+    """
+    recurrence = _recurrence_value(series.recurrence_type)
+    if recurrence == RecurrenceType.NONE.value:
+        return
+    
+    count = min(series.recurrence_count or DEFAULT_RECURRENCE_COUNT, MAX_RECURRENCE_COUNT)
+    
+    # 선택된 요일 파싱 (0=월요일)
+    selected_days = []
+    if recurrence == RecurrenceType.WEEKLY.value and series.recurrence_days:
+        selected_days = sorted({
+            int(day) for day in series.recurrence_days.split(",")
+            if day.strip().isdigit() and 0 <= int(day) <= 6
+        })
+    
+    current = series.scheduled_date
+    for _ in range(count):
+        current = _next_occurrence(current, recurrence, selected_days)
+        if series.recurrence_end_date and current > series.recurrence_end_date:
+            return
+        if to_date and current > to_date:
+            return
+        if from_date and current < from_date:
+            continue
+        yield current
+
+def is_occurrence_date(series: RaidSchedule, occurrence_date: date) -> bool:
+    """해당 날짜가 반복 일정의 발생일인지 확인"""
+    return any(True for _ in iter_occurrence_dates(series, occurrence_date, occurrence_date))
+
+def build_virtual_occurrence(series: RaidSchedule, occurrence_date: date, member_count: int) -> SimpleNamespace:
+    """
+    저장되지 않은 반복 일정 발생분을 응답용 객체로 생성
+    세션에 추가되지 않도록 ORM 객체가 아닌 단순 객체로 만듦
+    
+    Args:
+        series: 원본 일정
+        occurrence_date: 발생일
+        member_count: 공대원 수 (모두 응답 대기 상태)
+    
+    Returns:
+        RaidSchedule 응답 스키마와 같은 속성을 가진 객체
+    """
+    return SimpleNamespace(
+        **{field: getattr(series, field) for field in OCCURRENCE_TEMPLATE_FIELDS},
+        # 원본 일정 ID를 쓰면 참석 상태 등 ID 기준 조회가 원본 일정 것으로 잘못 연결되므로 비워 둠
+        id=None,
+        scheduled_date=occurrence_date,
+        occurrence_date=occurrence_date,
+        parent_schedule_id=series.id,
+        is_confirmed=False,
+        is_completed=False,
+        is_cancelled=False,
+        completion_notes=None,
+        created_at=series.created_at,
+        updated_at=series.updated_at,
+        completed_at=None,
+        cancelled_at=None,
+        created_by=series.created_by,
+        attendances=[],
+        confirmed_count=0,
+        declined_count=0,
+        tentative_count=0,
+        pending_count=member_count,
+        is_recurring=True,
+        is_virtual=True
+    )
+
+def get_virtual_occurrences(
+    db: Session,
+    group_ids: List[int],
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> List[SimpleNamespace]:
+    """
+    조회 범위 안의 저장되지 않은 반복 일정 발생분 목록
+    이미 개별 일정으로 저장된 발생분(수정/취소/참석 응답)은 제외
+    
+    Args:
+        db: 데이터베이스 세션
+        group_ids: 공대 ID 목록
+        from_date: 조회 시작일
+        to_date: 조회 종료일
+    
+    Returns:
+        가상 발생분 목록
+    """
+    query = db.query(RaidSchedule).filter(
+        RaidSchedule.raid_group_id.in_(group_ids),
+        RaidSchedule.parent_schedule_id.is_(None),
+        # != 대신 IN으로 걸러야 (공대, 반복 유형) 인덱스로 반복 일정만 찾음
+        RaidSchedule.recurrence_type.in_([
+            recurrence for recurrence in RecurrenceType if recurrence != RecurrenceType.NONE
+        ])
+    )
+    if to_date:
+        query = query.filter(RaidSchedule.scheduled_date < to_date)
+    if from_date:
+        query = query.filter(or_(
+            RaidSchedule.recurrence_end_date.is_(None),
+            RaidSchedule.recurrence_end_date >= from_date
+        ))
+    
+    series_list = query.options(selectinload(RaidSchedule.created_by)).all()
+    if not series_list:
+        return []
+    
+    # 이미 저장된 발생분
+    override_query = db.query(
+        RaidSchedule.parent_schedule_id,
+        RaidSchedule.occurrence_date
+    ).filter(
+        RaidSchedule.parent_schedule_id.in_([series.id for series in series_list])
+    )
+    if from_date:
+        override_query = override_query.filter(RaidSchedule.occurrence_date >= from_date)
+    if to_date:
+        override_query = override_query.filter(RaidSchedule.occurrence_date <= to_date)
+    overrides = set(override_query.all())
+    
+    # 공대별 인원 수
+    member_counts = dict(
+        db.query(RaidMember.raid_group_id, func.count(RaidMember.id)).filter(
+            RaidMember.raid_group_id.in_({series.raid_group_id for series in series_list})
+        ).group_by(RaidMember.raid_group_id).all()
+    )
+    
+    occurrences = []
+    for series in series_list:
+        for occurrence_date in iter_occurrence_dates(series, from_date, to_date):
+            if (series.id, occurrence_date) in overrides:
+                continue
+            occurrences.append(
+                build_virtual_occurrence(series, occurrence_date, member_counts.get(series.raid_group_id, 0))
+            )
+    
+    return occurrences
+
+def get_occurrence_override(db: Session, series: RaidSchedule, occurrence_date: date) -> Optional[RaidSchedule]:
+    """저장된 발생분 조회"""
+    return db.query(RaidSchedule).filter(
+        RaidSchedule.parent_schedule_id == series.id,
+        RaidSchedule.occurrence_date == occurrence_date
+    ).first()
+
+def materialize_occurrence(db: Session, series: RaidSchedule, occurrence_date: date) -> RaidSchedule:
+    """
+    반복 일정의 발생분을 개별 일정으로 저장
+    수정/취소/참석 응답처럼 발생분 단위의 데이터가 필요할 때만 호출
+    
+    Args:
+        db: 데이터베이스 세션
+        series: 원본 일정
+        occurrence_date: 발생일
+    
+    Returns:
+        저장된 발생분 일정
+    """
+    override = get_occurrence_override(db, series, occurrence_date)
+    if override:
+        return override
+    
+    member_ids = [
+        user_id for (user_id,) in db.query(RaidMember.user_id).filter(
+            RaidMember.raid_group_id == series.raid_group_id
+        ).all()
+    ]
+    
+    try:
+        override_id, = create_schedules_with_attendances(
+            db,
+            [{
+                **{field: getattr(series, field) for field in OCCURRENCE_TEMPLATE_FIELDS},
+                "scheduled_date": occurrence_date,
+                "occurrence_date": occurrence_date,
+                "parent_schedule_id": series.id
+            }],
+            member_ids
+        )
+        db.commit()
+    except IntegrityError:
+        # 다른 요청이 같은 발생분을 먼저 저장한 경우
+        db.rollback()
+        override = get_occurrence_override(db, series, occurrence_date)
+        if override is None:
+            raise
+        return override
+    
+    return db.get(RaidSchedule, override_id)
@@ -2,7 +2,8 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.principal_cache import principal_cache
+from app.core.password_service import password_service
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
     """
@@ -34,7 +35,7 @@ def create_user(db: Session, user_create: UserCreate) -> User:
         생성된 사용자 객체
     """
     # 비밀번호 해시화
-    hashed_password = get_password_hash(user_create.password)
+    hashed_password = password_service.hash(user_create.password)
     
     # 사용자 객체 생성
     db_user = User(
@@ -74,7 +75,7 @@ def update_user(
     
     # 비밀번호가 포함된 경우 해시화
     if "password" in update_data:
-        hashed_password = get_password_hash(update_data["password"])
+        hashed_password = password_service.hash(update_data["password"])
         del update_data["password"]
         update_data["hashed_password"] = hashed_password
     
@@ -86,6 +87,9 @@ def update_user(
     db.commit()
     db.refresh(user)
     
+    # 캐시된 인증 정보 무효화
+    principal_cache.invalidate_user(user.id)
+    
     return user
 
 def authenticate_user(
@@ -107,7 +111,11 @@ def authenticate_user(
     user = get_user_by_username(db, username)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    # bcrypt 검증을 기다리는 동안 DB 연결을 잡고 있지 않도록 조회 트랜잭션 종료
+    # (분리된 사용자 객체는 이미 읽은 값을 그대로 유지)
+    db.expunge(user)
+    db.commit()
+    if not password_service.verify(password, user.hashed_password):
         return None
     return user
 
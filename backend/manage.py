@@ -0,0 +1,135 @@
+import argparse
+from app.database import SessionLocal
+from app.utils import schedule as schedule_utils
+from app.utils import priority as priority_utils
+from app.utils import resources as resources_utils
+from app.utils import rollups as rollups_utils
+from app.utils import distribution_events as events_utils
+from app.utils import equipment as equipment_utils
+
+def repair_attendance_counts(args):
+    """
+    일정별 참석 인원 수를 참석 테이블 기준으로 다시 계산
+    """
+    db = SessionLocal()
+    try:
+        updated = schedule_utils.recalculate_attendance_counts(db, args.group_id)
+        print(f"{updated}개 일정의 참석 인원 수를 다시 계산했습니다.")
+    finally:
+        db.close()
+
+def recalculate_priorities(args):
+    """
+    공대별 분배 우선순위를 한 번에 다시 계산
+    """
+    db = SessionLocal()
+    try:
+        result = priority_utils.recalculate_priorities(db, args.group_id or None)
+        print(f"{len(result['priorities'])}개 공대의 분배 우선순위를 다시 계산했습니다.")
+        for group_id, item_names in result["missing_rules"].items():
+            print(f"  공대 {group_id}: 분배 규칙 없음 - {', '.join(item_names)}")
+    finally:
+        db.close()
+
+def reconcile_resources(args):
+    """
+    분배 이력에서 획득 재화를 다시 계산
+    """
+    db = SessionLocal()
+    try:
+        updated = resources_utils.reconcile_obtained_resources(db, args.group_id)
+        print(f"{updated}개 재화 요구량을 분배 이력 기준으로 다시 계산했습니다.")
+    finally:
+        db.close()
+
+def rebuild_loot_rollups(args):
+    """
+    분배 이력에서 주차별 획득 집계를 다시 생성
+    """
+    db = SessionLocal()
+    try:
+        created = rollups_utils.rebuild_loot_rollups(db, args.group_id)
+        print(f"{created}개 주차별 획득 집계를 분배 이력 기준으로 다시 생성했습니다.")
+    finally:
+        db.close()
+
+def snapshot_distribution_state(args):
+    """
+    현재 테이블 기준으로 공대별 분배 상태 기준 스냅샷 생성
+    """
+    db = SessionLocal()
+    try:
+        created = events_utils.create_baseline_snapshots(db, args.group_id)
+        print(f"{created}개 공대의 분배 상태 기준 스냅샷을 생성했습니다.")
+    finally:
+        db.close()
+
+def recalculate_set_item_levels(args):
+    """
+    세트 아이템과 장비 테이블 기준으로 장비 세트 아이템 레벨을 다시 계산
+    """
+    db = SessionLocal()
+    try:
+        updated = equipment_utils.recalculate_set_item_levels(db, args.set_id, args.equipment_id)
+        print(f"{updated}개 장비 세트의 아이템 레벨을 다시 계산했습니다.")
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="FF14 레이드 매니저 관리 명령어")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    # 참석 인원 수 복구
+    repair_parser = subparsers.add_parser(
+        "repair-attendance-counts",
+        help="일정별 참석 인원 수 재계산"
+    )
+    repair_parser.add_argument("--group-id", type=int, default=None, help="특정 공대만 재계산")
+    repair_parser.set_defaults(func=repair_attendance_counts)
+    
+    # 분배 우선순위 재계산
+    priority_parser = subparsers.add_parser(
+        "recalculate-priorities",
+        help="분배 우선순위 재계산 (기본값: 우선순위 분배 방식의 모든 공대)"
+    )
+    priority_parser.add_argument("--group-id", type=int, action="append", help="특정 공대만 재계산 (여러 번 지정 가능)")
+    priority_parser.set_defaults(func=recalculate_priorities)
+    
+    # 획득 재화 복구
+    reconcile_parser = subparsers.add_parser(
+        "reconcile-resources",
+        help="분배 이력 기준으로 획득 재화 재계산"
+    )
+    reconcile_parser.add_argument("--group-id", type=int, default=None, help="특정 공대만 재계산")
+    reconcile_parser.set_defaults(func=reconcile_resources)
+    
+    # 주차별 획득 집계 재생성
+    rollup_parser = subparsers.add_parser(
+        "rebuild-loot-rollups",
+        help="분배 이력 기준으로 주차별 획득 집계 재생성"
+    )
+    rollup_parser.add_argument("--group-id", type=int, default=None, help="특정 공대만 재생성")
+    rollup_parser.set_defaults(func=rebuild_loot_rollups)
+    
+    # 분배 상태 기준 스냅샷 생성
+    snapshot_parser = subparsers.add_parser(
+        "snapshot-distribution-state",
+        help="현재 테이블 기준으로 분배 상태 기준 스냅샷 생성 (이벤트 로그 도입 전 데이터 반영)"
+    )
+    snapshot_parser.add_argument("--group-id", type=int, action="append", help="특정 공대만 생성 (여러 번 지정 가능)")
+    snapshot_parser.set_defaults(func=snapshot_distribution_state)
+    
+    # 장비 세트 아이템 레벨 재계산
+    item_level_parser = subparsers.add_parser(
+        "recalculate-set-item-levels",
+        help="장비 아이템 레벨 기준으로 장비 세트 아이템 레벨 재계산 (장비 데이터 일괄 수정 후 실행)"
+    )
+    item_level_parser.add_argument("--set-id", type=int, default=None, help="특정 세트만 재계산")
+    item_level_parser.add_argument("--equipment-id", type=int, default=None, help="특정 장비를 포함한 세트만 재계산")
+    item_level_parser.set_defaults(func=recalculate_set_item_levels)
+    
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import os
+import tempfile
+
+# 앱 모듈을 가져오기 전에 테스트용 설정 적용
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="ff14_raid_manager_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DB_DIR}/test.db"
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+os.environ.setdefault("FORECAST_WORKERS", "0")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.core.security import create_access_token
+from app.core.principal_cache import principal_cache
+from app.core.equipment_catalog import equipment_catalog
+from app.models.user import User
+from app.models.raid import Raid, RaidGroup, RaidMember
+
+
+@pytest.fixture(autouse=True)
+def _reset_database():
+    """테스트마다 빈 데이터베이스와 빈 캐시로 시작"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    principal_cache.clear()
+    equipment_catalog.invalidate()
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def postgres_engine():
+    """TEST_POSTGRES_URL이 있을 때만 사용하는 PostgreSQL 엔진 (테이블은 테스트마다 새로 생성)"""
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    from sqlalchemy import create_engine
+    pg_engine = create_engine(url, pool_size=20, max_overflow=0)
+    Base.metadata.drop_all(bind=pg_engine)
+    Base.metadata.create_all(bind=pg_engine)
+    try:
+        yield pg_engine
+    finally:
+        Base.metadata.drop_all(bind=pg_engine)
+        pg_engine.dispose()
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def any_engine(request):
+    """SQLite 테스트 엔진과 (설정된 경우) PostgreSQL 엔진으로 각각 실행"""
+    if request.param == "sqlite":
+        return engine
+    return request.getfixturevalue("postgres_engine")
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def make_user(db):
+    """테스트 사용자 생성 (비밀번호 해시는 더미 값)"""
+    counter = {"n": 0}
+    
+    def _make_user(**fields) -> User:
+        counter["n"] += 1
+        n = counter["n"]
+        values = {
+            "username": f"user{n}",
+            "email": f"user{n}@example.com",
+            "hashed_password": "not-a-real-hash",
+            "character_name": f"Character {n}",
+            "server": "Tonberry",
+            "job": "전사",
+        }
+        values.update(fields)
+        user = User(**values)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+    
+    return _make_user
+
+
+@pytest.fixture
+def make_group(db):
+    """공대장과 멤버로 공대 생성 (공대장도 멤버로 등록)"""
+    def _make_group(leader: User, members=()) -> RaidGroup:
+        raid = Raid(name="테스트 레이드", tier="7.0 영웅")
+        db.add(raid)
+        db.flush()
+        group = RaidGroup(name="테스트 공대", raid_id=raid.id, leader_id=leader.id)
+        db.add(group)
+        db.flush()
+        for user in (leader, *members):
+            db.add(RaidMember(raid_group_id=group.id, user_id=user.id))
+        db.commit()
+        db.refresh(group)
+        return group
+    
+    return _make_group
+
+
+def auth_headers(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 기록"""
+    
+    def __init__(self):
+        self.statements = []
+        self.parameters = []
+    
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+        self.parameters.append(parameters)
+    
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+    
+    def selects(self) -> list:
+        return [s for s in self.statements if s.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.fixture
+def count_queries():
+    """with count_queries() as counter: 블록 안에서 실행된 SQL 문 수 측정"""
+    from contextlib import contextmanager
+    
+    @contextmanager
+    def _count(target_engine=engine):
+        counter = QueryCounter()
+        event.listen(target_engine, "before_cursor_execute", counter)
+        try:
+            yield counter
+        finally:
+            event.remove(target_engine, "before_cursor_execute", counter)
+    
+    return _count
+
+
+def query_plan(db, query) -> str:
+    """SQLite EXPLAIN QUERY PLAN 결과를 한 문자열로 반환 (ORM Query 또는 Core 문)"""
+    statement = getattr(query, "statement", query)
+    compiled = statement.compile(dialect=db.get_bind().dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+    return " | ".join(row[-1] for row in rows)
@@ -0,0 +1,32 @@
+from sqlalchemy import delete
+
+from app.core.principal_cache import principal_cache
+from app.models.user import User
+from tests.conftest import auth_headers
+
+
+def test_cached_principal_of_deleted_user_returns_401(client, db, make_user):
+    user = make_user()
+    headers = auth_headers(user)
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+    
+    # 다른 워커에서 삭제된 경우처럼 ORM 이벤트 없이 행만 삭제
+    db.execute(delete(User).where(User.id == user.id))
+    db.commit()
+    
+    response = client.get("/api/auth/me", headers=headers)
+    assert response.status_code == 401
+    assert principal_cache.stats()["size"] == 0
+
+
+def test_deleting_user_invalidates_principal_cache(client, db, make_user):
+    user = make_user()
+    headers = auth_headers(user)
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+    assert principal_cache.stats()["size"] == 1
+    
+    db.delete(user)
+    db.commit()
+    
+    assert principal_cache.stats()["size"] == 0
+    assert client.get("/api/auth/me", headers=headers).status_code == 401
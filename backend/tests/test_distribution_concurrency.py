@@ -0,0 +1,184 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core import deps
+from app.database import Base
+from app.main import app
+from app.models.item_distribution import ResourceRequirement
+from app.models.raid import Raid, RaidGroup, RaidMember
+from app.models.user import User
+from app.core.security import create_access_token
+
+WRITERS = 8
+UPDATES_PER_WRITER = 5
+MAX_ATTEMPTS = 200
+
+
+@pytest.fixture
+def sqlite_wal_engine(tmp_path):
+    """여러 연결이 동시에 쓰는 WAL 모드 SQLite 파일 엔진"""
+    wal_engine = create_engine(
+        f"sqlite:///{tmp_path}/concurrency.db",
+        connect_args={"check_same_thread": False, "timeout": 30}
+    )
+    
+    @event.listens_for(wal_engine, "connect")
+    def _enable_wal(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA journal_mode=WAL")
+    
+    Base.metadata.create_all(bind=wal_engine)
+    try:
+        yield wal_engine
+    finally:
+        wal_engine.dispose()
+
+
+@pytest.fixture(params=["sqlite_wal", "postgresql"])
+def stress_engine(request):
+    if request.param == "sqlite_wal":
+        return request.getfixturevalue("sqlite_wal_engine")
+    return request.getfixturevalue("postgres_engine")
+
+
+@pytest.fixture
+def stress_client(stress_engine, client):
+    """API가 stress_engine 데이터베이스를 사용하도록 get_db 교체"""
+    StressSession = sessionmaker(autocommit=False, autoflush=False, bind=stress_engine)
+    
+    def _get_db():
+        db = StressSession()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    app.dependency_overrides[deps.get_db] = _get_db
+    try:
+        yield client, StressSession
+    finally:
+        app.dependency_overrides.pop(deps.get_db, None)
+
+
+def _seed(Session):
+    with Session() as session:
+        leader = User(
+            username="leader", email="leader@example.com", hashed_password="not-a-real-hash",
+            character_name="Leader", server="Tonberry", job="전사"
+        )
+        session.add(leader)
+        session.flush()
+        raid = Raid(name="테스트 레이드", tier="7.0 영웅")
+        session.add(raid)
+        session.flush()
+        group = RaidGroup(name="테스트 공대", raid_id=raid.id, leader_id=leader.id)
+        session.add(group)
+        session.flush()
+        session.add(RaidMember(raid_group_id=group.id, user_id=leader.id))
+        session.add(ResourceRequirement(
+            user_id=leader.id, raid_group_id=group.id,
+            required_resources={"석판": 1000}, obtained_resources={"석판": 0}
+        ))
+        session.commit()
+        return leader.id, group.id
+
+
+def _run_writers(write_once):
+    """WRITERS개 스레드가 UPDATES_PER_WRITER번씩 쓰기 (409는 다시 읽고 재시도)"""
+    def _writer(writer_id):
+        conflicts = 0
+        for n in range(UPDATES_PER_WRITER):
+            for _ in range(MAX_ATTEMPTS):
+                status_code = write_once(writer_id, n)
+                if status_code == 200:
+                    break
+                assert status_code == 409
+                conflicts += 1
+            else:
+                pytest.fail(f"writer {writer_id} gave up after {MAX_ATTEMPTS} conflicts")
+        return conflicts
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WRITERS) as executor:
+        conflicts = sum(executor.map(_writer, range(WRITERS)))
+    return conflicts, time.perf_counter() - started
+
+
+def _report(engine_name, target, conflicts, elapsed):
+    updates = WRITERS * UPDATES_PER_WRITER
+    print(
+        f"\n{engine_name} {target}: {updates} updates by {WRITERS} writers, "
+        f"{conflicts} conflicts retried, {updates / elapsed:.1f} updates/s"
+    )
+
+
+@pytest.mark.benchmark
+def test_parallel_rule_updates_lose_nothing(stress_client, stress_engine):
+    client, Session = stress_client
+    leader_id, group_id = _seed(Session)
+    headers = {"Authorization": f"Bearer {create_access_token(leader_id)}"}
+    
+    response = client.post(
+        f"/api/distribution/groups/{group_id}/rules",
+        json={"item_name": "무기 상자", "item_type": "weapon_coffer", "floor_number": 4, "notes": ""},
+        headers=headers
+    )
+    assert response.status_code == 200
+    rule_id = response.json()["id"]
+    
+    def _append_note(writer_id, n):
+        rules = client.get(f"/api/distribution/groups/{group_id}/rules", headers=headers).json()
+        rule = next(r for r in rules if r["id"] == rule_id)
+        response = client.put(
+            f"/api/distribution/groups/{group_id}/rules/{rule_id}",
+            json={"notes": f"{rule['notes']}[{writer_id}-{n}]", "version": rule["version"]},
+            headers=headers
+        )
+        if response.status_code == 409:
+            assert response.json()["detail"]["current_version"] >= rule["version"]
+        return response.status_code
+    
+    conflicts, elapsed = _run_writers(_append_note)
+    _report(stress_engine.dialect.name, "rules", conflicts, elapsed)
+    
+    rules = client.get(f"/api/distribution/groups/{group_id}/rules", headers=headers).json()
+    rule = next(r for r in rules if r["id"] == rule_id)
+    # 성공한 쓰기마다 버전이 1씩 오르고 모든 쓰기의 메모가 남아 있어야 함
+    assert rule["version"] == 1 + WRITERS * UPDATES_PER_WRITER
+    for writer_id in range(WRITERS):
+        for n in range(UPDATES_PER_WRITER):
+            assert f"[{writer_id}-{n}]" in rule["notes"]
+
+
+@pytest.mark.benchmark
+def test_parallel_obtained_resource_updates_lose_nothing(stress_client, stress_engine):
+    client, Session = stress_client
+    leader_id, group_id = _seed(Session)
+    headers = {"Authorization": f"Bearer {create_access_token(leader_id)}"}
+    
+    def _increment(writer_id, n):
+        requirement = client.get(
+            f"/api/distribution/groups/{group_id}/resources/me", headers=headers
+        ).json()
+        obtained = dict(requirement["obtained_resources"])
+        obtained["석판"] += 1
+        response = client.put(
+            f"/api/distribution/groups/{group_id}/resources/update",
+            json={"obtained_resources": obtained, "version": requirement["version"]},
+            headers=headers
+        )
+        if response.status_code == 409:
+            assert response.json()["detail"]["current_version"] >= requirement["version"]
+        return response.status_code
+    
+    conflicts, elapsed = _run_writers(_increment)
+    _report(stress_engine.dialect.name, "resources", conflicts, elapsed)
+    
+    requirement = client.get(
+        f"/api/distribution/groups/{group_id}/resources/me", headers=headers
+    ).json()
+    assert requirement["obtained_resources"]["석판"] == WRITERS * UPDATES_PER_WRITER
+    assert requirement["version"] == 1 + WRITERS * UPDATES_PER_WRITER
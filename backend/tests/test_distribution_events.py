@@ -0,0 +1,75 @@
+from app.models.item_distribution import ResourceRequirement
+from app.utils.distribution_events import build_state_from_tables, load_state
+from tests.conftest import auth_headers
+
+
+def _record(client, headers, group_id, week_number, distributions):
+    response = client.post(
+        f"/api/distribution/groups/{group_id}/history/batch",
+        json={"week_number": week_number, "distributions": distributions},
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_replayed_state_matches_table_rebuild(client, db, make_user, make_group):
+    leader = make_user()
+    member = make_user()
+    group = make_group(leader, [member])
+    headers = auth_headers(leader)
+    
+    # 멤버는 귀걸이 낱장만 필요, 공대장은 필요 재화 없음
+    db.add(ResourceRequirement(
+        user_id=member.id,
+        raid_group_id=group.id,
+        required_resources={"귀걸이_낱장": 2}
+    ))
+    db.commit()
+    
+    _record(client, headers, group.id, 1, [
+        {"user_id": member.id, "item_name": "귀걸이_낱장", "item_type": "token"},
+        {"user_id": member.id, "item_name": "탈것", "item_type": "mount"},
+        {"user_id": leader.id, "item_name": "귀걸이_낱장", "item_type": "token"},
+    ])
+    histories = _record(client, headers, group.id, 2, [
+        {"user_id": member.id, "item_name": "귀걸이_낱장", "item_type": "token"},
+        {"user_id": member.id, "item_name": "탈것", "item_type": "mount"},
+    ])
+    
+    # 필요 재화에 없는 아이템 이력 삭제
+    response = client.delete(
+        f"/api/distribution/groups/{group.id}/history/{histories[1]['id']}",
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    
+    db.expire_all()
+    replayed = load_state(db, group.id)["state"]
+    rebuilt = build_state_from_tables(db, group.id)
+    
+    assert replayed["obtained"] == {str(member.id): {"귀걸이_낱장": 2}}
+    assert replayed["obtained"] == rebuilt["obtained"]
+    assert replayed["loot_counts"] == rebuilt["loot_counts"]
+    assert replayed["week_number"] == rebuilt["week_number"]
+
+
+def test_week_state_includes_back_dated_histories(client, db, make_user, make_group):
+    leader = make_user()
+    group = make_group(leader)
+    headers = auth_headers(leader)
+    
+    for week_number in (1, 3, 2):
+        _record(client, headers, group.id, week_number, [
+            {"user_id": leader.id, "item_name": f"{week_number}주차 상자", "item_type": "other"},
+        ])
+    
+    db.expire_all()
+    week_2 = load_state(db, group.id, 2)["state"]
+    assert week_2["loot_counts"] == {str(leader.id): 2}
+    assert week_2["week_number"] == 2
+    
+    week_1 = load_state(db, group.id, 1)["state"]
+    assert week_1["loot_counts"] == {str(leader.id): 1}
+    
+    assert load_state(db, group.id)["state"]["loot_counts"] == {str(leader.id): 3}
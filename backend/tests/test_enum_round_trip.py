@@ -0,0 +1,69 @@
+from sqlalchemy import text
+
+from tests.conftest import auth_headers
+
+
+def test_item_type_round_trip(client, db, make_user, make_group):
+    leader = make_user()
+    group = make_group(leader)
+    headers = auth_headers(leader)
+    base = f"/api/distribution/groups/{group.id}"
+    
+    rule = client.post(f"{base}/rules", json={
+        "item_name": "귀걸이_낱장", "item_type": "token", "floor_number": 1
+    }, headers=headers)
+    assert rule.status_code == 200, rule.text
+    assert rule.json()["item_type"] == "token"
+    
+    single = client.post(f"{base}/history", json={
+        "user_id": leader.id, "item_name": "귀걸이_낱장", "item_type": "token",
+        "week_number": 1, "distribution_id": rule.json()["id"]
+    }, headers=headers)
+    assert single.status_code == 200, single.text
+    
+    batch = client.post(f"{base}/history/batch", json={
+        "week_number": 2,
+        "distributions": [{"user_id": leader.id, "item_name": "탈것", "item_type": "mount"}]
+    }, headers=headers)
+    assert batch.status_code == 200, batch.text
+    assert batch.json()[0]["item_type"] == "mount"
+    
+    # 모델 Enum 컬럼에는 이름으로 저장
+    stored = {row[0] for row in db.execute(text("SELECT item_type FROM distribution_histories"))}
+    assert stored == {"TOKEN", "MOUNT"}
+    stored = {row[0] for row in db.execute(text("SELECT item_type FROM item_distributions"))}
+    assert stored == {"TOKEN"}
+    
+    rules = client.get(f"{base}/rules", params={"item_type": "token"}, headers=headers)
+    assert [r["id"] for r in rules.json()] == [rule.json()["id"]]
+    
+    histories = client.get(f"{base}/history", params={"item_type": "mount"}, headers=headers)
+    assert [h["item_type"] for h in histories.json()] == ["mount"]
+    
+    summary = client.get(f"{base}/summary", headers=headers).json()
+    assert summary["member_totals"][str(leader.id)] == {"token": 1, "mount": 1}
+
+
+def test_distribution_method_round_trip(client, db, make_user, make_group):
+    leader = make_user()
+    group = make_group(leader)
+    headers = auth_headers(leader)
+    
+    response = client.put(
+        f"/api/raids/groups/{group.id}",
+        json={"distribution_method": "first_come"},
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["distribution_method"] == "first_come"
+    
+    stored = db.execute(text("SELECT distribution_method FROM raid_groups")).scalar()
+    assert stored == "FIRST_COME"
+    
+    created = client.post(
+        f"/api/raids/{group.raid_id}/groups",
+        json={"name": "두 번째 공대", "distribution_method": "first_come"},
+        headers=headers
+    )
+    assert created.status_code == 200, created.text
+    assert created.json()["distribution_method"] == "first_come"
@@ -0,0 +1,68 @@
+from sqlalchemy import update
+
+from app.core.equipment_catalog import equipment_catalog
+from app.models.equipment import Equipment, EquipmentSet, EquipmentSlot, EquipmentType
+from app.utils.equipment import SET_SLOT_COUNT
+from tests.conftest import auth_headers
+
+
+def _equipment(db, slot, item_level):
+    equipment = Equipment(
+        name=f"{slot.value} {item_level}",
+        slot=slot,
+        equipment_type=EquipmentType.RAID_HERO,
+        item_level=item_level
+    )
+    db.add(equipment)
+    db.commit()
+    return equipment.id
+
+
+def _set_levels(db, set_id):
+    db.expire_all()
+    equipment_set = db.get(EquipmentSet, set_id)
+    return equipment_set.item_level_sum, equipment_set.total_item_level
+
+
+def test_item_level_sum_uses_equipment_table_not_stale_catalog(client, db, make_user, make_group):
+    user = make_user()
+    group = make_group(user)
+    headers = auth_headers(user)
+    
+    weapon = _equipment(db, EquipmentSlot.WEAPON, 730)
+    head = _equipment(db, EquipmentSlot.HEAD, 720)
+    other_head = _equipment(db, EquipmentSlot.HEAD, 710)
+    
+    response = client.post("/api/equipment/sets", json={"name": "BIS", "raid_group_id": group.id}, headers=headers)
+    assert response.status_code == 200, response.text
+    set_id = response.json()["id"]
+    
+    response = client.post(f"/api/equipment/sets/{set_id}/items", json={"equipment_id": weapon, "slot": "weapon"}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert _set_levels(db, set_id) == (1460, 1460 // SET_SLOT_COUNT)
+    
+    # 카탈로그를 채운 뒤 다른 워커가 장비 아이템 레벨을 바꾼 상황 (이 워커의 카탈로그는 오래됨)
+    equipment_catalog.get_many(db, [head, other_head])
+    db.execute(update(Equipment).where(Equipment.id.in_([head, other_head])).values(item_level=Equipment.item_level + 5))
+    db.commit()
+    
+    response = client.post(f"/api/equipment/sets/{set_id}/items", json={"equipment_id": head, "slot": "head"}, headers=headers)
+    assert response.status_code == 200, response.text
+    item_id = response.json()["id"]
+    assert _set_levels(db, set_id) == (1460 + 725, (1460 + 725) // SET_SLOT_COUNT)
+    
+    response = client.put(f"/api/equipment/sets/{set_id}/items/{item_id}", json={"equipment_id": other_head}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert _set_levels(db, set_id)[0] == 1460 + 715
+    
+    response = client.delete(f"/api/equipment/sets/{set_id}/items/{item_id}", headers=headers)
+    assert response.status_code == 200, response.text
+    assert _set_levels(db, set_id)[0] == 1460
+    
+    response = client.put(f"/api/equipment/sets/{set_id}/items", json={"items": [
+        {"equipment_id": weapon, "slot": "weapon"},
+        {"equipment_id": head, "slot": "head"},
+    ]}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["total_item_level"] == (1460 + 725) // SET_SLOT_COUNT
+    assert _set_levels(db, set_id)[0] == 1460 + 725
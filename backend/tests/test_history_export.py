@@ -0,0 +1,155 @@
+import csv
+import io
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.api.distribution import HISTORY_EXPORT_COLUMNS, _stream_history_export
+from app.config import settings
+from app.models.item_distribution import DistributionHistory, ItemType
+from app.models.user import User
+from tests.conftest import auth_headers
+
+
+def _seed_histories(db, group_id, user_ids, count):
+    start = datetime(2025, 1, 7, 21, 0)
+    db.execute(insert(DistributionHistory), [
+        {
+            "raid_group_id": group_id,
+            "user_id": user_ids[n % len(user_ids)],
+            "item_name": "=HYPERLINK(\"x\")" if n == 0 else f"귀걸이 낱장 {n}",
+            "item_type": ItemType.TOKEN if n % 2 else ItemType.WEAPON_COFFER,
+            "floor_number": n % 4 + 1,
+            "week_number": n // 8 + 1,
+            "distributed_at": start + timedelta(minutes=n),
+            "notes": "메모" if n == 1 else None
+        }
+        for n in range(count)
+    ])
+    db.commit()
+
+
+def _export_query(group_id):
+    return select(*HISTORY_EXPORT_COLUMNS).join(
+        User, User.id == DistributionHistory.user_id
+    ).where(
+        DistributionHistory.raid_group_id == group_id
+    ).order_by(DistributionHistory.distributed_at.asc(), DistributionHistory.id.asc())
+
+
+def test_ndjson_export_streams_every_row_in_order(db, client, make_user, make_group):
+    leader = make_user(character_name="공대장")
+    member = make_user(character_name="멤버")
+    group = make_group(leader, [member])
+    _seed_histories(db, group.id, [leader.id, member.id], 25)
+    
+    response = client.get(
+        f"/api/distribution/groups/{group.id}/history/export",
+        params={"format": "ndjson"},
+        headers=auth_headers(leader)
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert len(records) == 25
+    assert [record["id"] for record in records] == sorted(record["id"] for record in records)
+    assert set(records[0]) == {column.key for column in HISTORY_EXPORT_COLUMNS}
+    assert records[0]["item_type"] == "weapon_coffer"
+    assert records[1]["item_type"] == "token"
+    assert records[1]["character_name"] == "멤버"
+    assert records[1]["notes"] == "메모"
+    assert records[0]["distributed_at"] == "2025-01-07T21:00:00"
+    
+    # 필터는 목록 조회와 같은 방식으로 적용
+    filtered = client.get(
+        f"/api/distribution/groups/{group.id}/history/export",
+        params={"format": "ndjson", "item_type": "token", "user_id": member.id},
+        headers=auth_headers(leader)
+    )
+    records = [json.loads(line) for line in filtered.text.splitlines()]
+    assert len(records) == 12
+    assert all(r["item_type"] == "token" and r["user_id"] == member.id for r in records)
+
+
+def test_csv_export_has_header_and_escapes_formulas(db, client, make_user, make_group):
+    leader = make_user()
+    group = make_group(leader)
+    url = f"/api/distribution/groups/{group.id}/history/export"
+    
+    # 이력이 없으면 헤더만
+    empty = client.get(url, params={"format": "csv"}, headers=auth_headers(leader))
+    assert empty.status_code == 200
+    assert empty.text.lstrip("﻿").strip() == ",".join(column.key for column in HISTORY_EXPORT_COLUMNS)
+    
+    _seed_histories(db, group.id, [leader.id], 3)
+    response = client.get(url, params={"format": "csv"}, headers=auth_headers(leader))
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text.startswith("﻿")
+    
+    rows = list(csv.DictReader(io.StringIO(response.text.lstrip("﻿"))))
+    assert len(rows) == 3
+    assert rows[0]["item_name"] == "'=HYPERLINK(\"x\")"
+    assert rows[1]["item_name"] == "귀걸이 낱장 1"
+
+
+def test_export_selects_only_export_columns(db, client, make_user, make_group, count_queries):
+    leader = make_user()
+    group = make_group(leader)
+    _seed_histories(db, group.id, [leader.id], 3)
+    
+    with count_queries() as counter:
+        response = client.get(
+            f"/api/distribution/groups/{group.id}/history/export",
+            params={"format": "ndjson"},
+            headers=auth_headers(leader)
+        )
+    assert response.status_code == 200
+    
+    export_select = next(
+        statement for statement in counter.selects() if "FROM distribution_histories" in statement
+    )
+    selected = export_select.split("FROM", 1)[0]
+    expected = {f"{column.table.name}.{column.name}" for column in HISTORY_EXPORT_COLUMNS}
+    for table in (DistributionHistory.__table__, User.__table__):
+        for column in table.columns:
+            name = f"{table.name}.{column.name}"
+            assert (name in selected) == (name in expected), name
+
+
+def _peak_export_memory(group_id, export_format):
+    """내보내기 스트림을 끝까지 소비하는 동안의 최대 할당 바이트와 묶음 수"""
+    chunks = 0
+    tracemalloc.start()
+    try:
+        for _ in _stream_history_export(_export_query(group_id), export_format):
+            chunks += 1
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, chunks
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+def test_export_memory_stays_bounded(db, make_user, make_group, export_format):
+    leader = make_user()
+    group = make_group(leader)
+    small_group = make_group(leader)
+    chunk_size = settings.EXPORT_CHUNK_SIZE
+    _seed_histories(db, small_group.id, [leader.id], 10 * chunk_size)
+    _seed_histories(db, group.id, [leader.id], 50 * chunk_size)
+    
+    small_peak, small_chunks = _peak_export_memory(small_group.id, export_format)
+    large_peak, large_chunks = _peak_export_memory(group.id, export_format)
+    
+    print(
+        f"\n{export_format}: {10 * chunk_size} rows peak {small_peak / 1024:.0f}KiB, "
+        f"{50 * chunk_size} rows peak {large_peak / 1024:.0f}KiB"
+    )
+    # 다섯 배의 이력을 내보내도 메모리는 한 묶음 분량으로 일정
+    assert large_peak < small_peak * 1.5
+    assert large_chunks >= 50
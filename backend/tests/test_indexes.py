@@ -0,0 +1,83 @@
+import os
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, func, text
+
+from app.models.equipment import EquipmentSet
+from app.models.item_distribution import DistributionHistory
+from app.models.raid import RaidMember
+from app.models.raid_schedule import RaidAttendance, RaidSchedule
+from tests.conftest import query_plan
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _assert_uses_index(plan: str, index_name: str) -> None:
+    assert f"INDEX {index_name}" in plan, plan
+    assert "SCAN" not in plan.replace(f"SCAN {index_name}", ""), plan
+
+
+@pytest.mark.parametrize("build, index_name", [
+    (
+        lambda db: db.query(RaidMember).filter(RaidMember.raid_group_id == 1, RaidMember.user_id == 2),
+        "ix_raid_members_group_user"
+    ),
+    (
+        lambda db: db.query(RaidAttendance).filter(RaidAttendance.schedule_id == 1, RaidAttendance.user_id == 2),
+        "ix_raid_attendances_schedule_user"
+    ),
+    (
+        lambda db: db.query(func.count(RaidAttendance.id)).filter(
+            RaidAttendance.schedule_id == 1, RaidAttendance.status == "confirmed"
+        ),
+        "ix_raid_attendances_schedule_status"
+    ),
+    (
+        lambda db: db.query(EquipmentSet).filter(EquipmentSet.user_id == 1, EquipmentSet.raid_group_id == 2),
+        "ix_equipment_sets_user_group"
+    ),
+])
+def test_filter_paths_use_composite_indexes(db, build, index_name):
+    _assert_uses_index(query_plan(db, build(db)), index_name)
+
+
+def test_list_queries_use_index_order(db):
+    schedules = db.query(RaidSchedule).filter(RaidSchedule.raid_group_id == 1).order_by(
+        RaidSchedule.scheduled_date.asc(), RaidSchedule.start_time.asc(), RaidSchedule.id.asc()
+    ).limit(100)
+    plan = query_plan(db, schedules)
+    _assert_uses_index(plan, "ix_raid_schedules_group_date_time_id")
+    assert "TEMP B-TREE" not in plan, plan
+    
+    histories = db.query(DistributionHistory).filter(DistributionHistory.raid_group_id == 1).order_by(
+        DistributionHistory.distributed_at.desc(), DistributionHistory.id.desc()
+    ).limit(100)
+    plan = query_plan(db, histories)
+    _assert_uses_index(plan, "ix_distribution_histories_group_distributed_at_id")
+    assert "TEMP B-TREE" not in plan, plan
+
+
+def test_composite_index_migration_removes_duplicates(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path}/migration.db"
+    monkeypatch.setenv("DATABASE_URL", url)
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    
+    command.upgrade(config, "44479a729e0c")
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO raid_members (id, raid_group_id, user_id) VALUES (1, 1, 1), (2, 1, 1), (3, 1, 2)"
+        ))
+        conn.execute(text(
+            "INSERT INTO raid_attendances (id, schedule_id, user_id) VALUES (1, 1, 1), (2, 1, 1), (3, 2, 1)"
+        ))
+    
+    command.upgrade(config, "99b2d340cd77")
+    with engine.connect() as conn:
+        assert [row[0] for row in conn.execute(text("SELECT id FROM raid_members ORDER BY id"))] == [1, 3]
+        assert [row[0] for row in conn.execute(text("SELECT id FROM raid_attendances ORDER BY id"))] == [2, 3]
+    engine.dispose()
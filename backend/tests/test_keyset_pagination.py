@@ -0,0 +1,158 @@
+import statistics
+import time
+from datetime import date, datetime, time as time_of_day, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from app.models.item_distribution import DistributionHistory, ItemType
+from app.models.raid_schedule import RaidSchedule
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from tests.conftest import auth_headers
+
+PAGE_SIZE = 100
+DEEP_PAGE = 1000
+ROWS = PAGE_SIZE * DEEP_PAGE
+REPEAT = 7
+
+
+def _seed_histories(db, group_id, user_id, count):
+    start = datetime(2024, 1, 2, 21, 0)
+    db.execute(insert(DistributionHistory), [
+        {
+            "raid_group_id": group_id,
+            "user_id": user_id,
+            "item_name": "귀걸이 낱장",
+            "item_type": ItemType.TOKEN,
+            "floor_number": 1,
+            "week_number": n // 50 + 1,
+            # 같은 시각의 기록도 ID로 순서가 정해지도록 일부 시각을 겹침
+            "distributed_at": start + timedelta(minutes=n // 2)
+        }
+        for n in range(count)
+    ])
+    db.commit()
+
+
+def _seed_schedules(db, group_id, creator_id, count):
+    start = date(2024, 1, 2)
+    db.execute(insert(RaidSchedule), [
+        {
+            "raid_group_id": group_id,
+            "created_by_id": creator_id,
+            "title": "레이드",
+            "scheduled_date": start + timedelta(days=n // 4),
+            "start_time": time_of_day(20 + n % 2, 0)
+        }
+        for n in range(count)
+    ])
+    db.commit()
+
+
+def _history_key(db, group_id, position):
+    """최신순 position번째 이력의 커서 키"""
+    row = db.query(DistributionHistory.distributed_at, DistributionHistory.id).filter(
+        DistributionHistory.raid_group_id == group_id
+    ).order_by(
+        DistributionHistory.distributed_at.desc(), DistributionHistory.id.desc()
+    ).offset(position).first()
+    return list(row)
+
+
+def _schedule_key(db, group_id, position):
+    """날짜순 position번째 일정의 커서 키"""
+    row = db.query(RaidSchedule.scheduled_date, RaidSchedule.start_time, RaidSchedule.id).filter(
+        RaidSchedule.raid_group_id == group_id
+    ).order_by(
+        RaidSchedule.scheduled_date.asc(), RaidSchedule.start_time.asc(), RaidSchedule.id.asc()
+    ).offset(position).first()
+    return list(row)
+
+
+def _median_ms(client, url, params, headers):
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        response = client.get(url, params=params, headers=headers)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200
+        assert len(response.json()) == PAGE_SIZE
+    return statistics.median(timings)
+
+
+def _explain_list_queries(db, client, count_queries, url, params, headers, table):
+    """API가 실제로 실행한 table의 SELECT별 EXPLAIN QUERY PLAN (정렬 목록 조회 여부와 함께)"""
+    with count_queries() as counter:
+        assert client.get(url, params=params, headers=headers).status_code == 200
+    plans = []
+    for statement, parameters in zip(counter.statements, counter.parameters):
+        if not (statement.lstrip().upper().startswith("SELECT") and f"FROM {table}" in statement):
+            continue
+        rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        plans.append(("ORDER BY" in statement, " | ".join(row[-1] for row in rows)))
+    return plans
+
+
+@pytest.mark.parametrize("list_name, table, index_name", [
+    ("history", "distribution_histories", "ix_distribution_histories_group_distributed_at_id"),
+    ("schedules", "raid_schedules", "ix_raid_schedules_group_date_time_id"),
+])
+def test_cursor_queries_seek_the_composite_index(
+    db, client, make_user, make_group, count_queries, list_name, table, index_name
+):
+    leader = make_user()
+    group = make_group(leader)
+    if list_name == "history":
+        _seed_histories(db, group.id, leader.id, 3 * PAGE_SIZE)
+    else:
+        _seed_schedules(db, group.id, leader.id, 3 * PAGE_SIZE)
+    headers = auth_headers(leader)
+    url = f"/api/{'distribution' if list_name == 'history' else 'schedules'}/groups/{group.id}/{list_name}"
+    
+    first = client.get(url, params={"limit": PAGE_SIZE}, headers=headers)
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+    plans = _explain_list_queries(
+        db, client, count_queries, url, {"limit": PAGE_SIZE, "cursor": cursor}, headers, table
+    )
+    
+    # 커서 조건이 인덱스 범위 검색으로 들어가고 정렬은 인덱스 순서를 그대로 사용
+    page_plan = next(plan for ordered, plan in plans if ordered)
+    assert f"SEARCH {table} USING INDEX {index_name}" in page_plan, page_plan
+    assert ">" in page_plan or "<" in page_plan, page_plan
+    assert "TEMP B-TREE" not in page_plan, page_plan
+    # 반복 일정 원본 조회 등 같은 요청의 다른 조회는 동등 조건으로만 찾아 공대 전체를 훑지 않음
+    for ordered, plan in plans:
+        assert "SCAN" not in plan, plan
+        if not ordered:
+            assert "(raid_group_id=?)" not in plan and ">" not in plan and "<" not in plan, plan
+    
+    second = client.get(url, params={"limit": PAGE_SIZE, "cursor": cursor}, headers=headers).json()
+    following = client.get(url, params={"limit": PAGE_SIZE, "skip": PAGE_SIZE}, headers=headers).json()
+    assert [item["id"] for item in second] == [item["id"] for item in following]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("list_name", ["history", "schedules"])
+def test_deep_cursor_page_latency_stays_flat(db, client, make_user, make_group, list_name):
+    leader = make_user()
+    group = make_group(leader)
+    headers = auth_headers(leader)
+    if list_name == "history":
+        _seed_histories(db, group.id, leader.id, ROWS)
+        url = f"/api/distribution/groups/{group.id}/history"
+        deep_key = _history_key(db, group.id, (DEEP_PAGE - 1) * PAGE_SIZE - 1)
+    else:
+        _seed_schedules(db, group.id, leader.id, ROWS)
+        url = f"/api/schedules/groups/{group.id}/schedules"
+        deep_key = _schedule_key(db, group.id, (DEEP_PAGE - 1) * PAGE_SIZE - 1)
+    
+    first_page = _median_ms(client, url, {"limit": PAGE_SIZE}, headers)
+    deep_cursor = _median_ms(client, url, {"limit": PAGE_SIZE, "cursor": encode_cursor(deep_key)}, headers)
+    deep_offset = _median_ms(client, url, {"limit": PAGE_SIZE, "skip": (DEEP_PAGE - 1) * PAGE_SIZE}, headers)
+    
+    print(
+        f"\n{list_name} {ROWS} rows: page 1 {first_page:.1f}ms, "
+        f"page {DEEP_PAGE} cursor {deep_cursor:.1f}ms, page {DEEP_PAGE} skip {deep_offset:.1f}ms"
+    )
+    assert deep_cursor < first_page * 1.5 + 5
+    assert deep_cursor < deep_offset
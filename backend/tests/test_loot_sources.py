@@ -0,0 +1,35 @@
+from collections import Counter
+
+from app.api.distribution import (
+    _build_loot_sources,
+    _get_token_name,
+    _get_upgrade_material
+)
+from app.models.equipment import EquipmentSlot
+
+
+def test_loot_sources_only_drop_items_requirements_ask_for():
+    # 재화 요구량 계산이 만들 수 있는 이름 (낱장, 보강 재료, 석판)
+    requirement_items = {"석판"}
+    for slot in EquipmentSlot:
+        if _get_token_name(slot):
+            requirement_items.add(_get_token_name(slot))
+            requirement_items.add(_get_upgrade_material(slot))
+    
+    sources = _build_loot_sources()
+    dropped = {name for source in sources for name in source.item_names}
+    assert dropped <= requirement_items, dropped - requirement_items
+
+
+def test_upgrade_material_drops_follow_the_slot_mapping():
+    weekly = Counter()
+    for source in _build_loot_sources():
+        if len(source.item_names) == 1 and not source.personal:
+            weekly[source.item_names[0]] += source.units[0] * source.count
+    
+    # 2층 장신구 보강 재료 1개, 3층 방어구/무기 보강 재료 1개씩
+    expected = Counter(
+        _get_upgrade_material(slot)
+        for slot in (EquipmentSlot.RING, EquipmentSlot.BODY, EquipmentSlot.WEAPON)
+    )
+    assert {name: weekly[name] for name in expected} == dict(expected)
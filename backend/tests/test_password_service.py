@@ -0,0 +1,65 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core import security
+from app.core.password_service import THREADPOOL_SIZE, PasswordService, password_service
+from tests.conftest import auth_headers
+
+
+def _p99(samples):
+    ordered = sorted(samples)
+    return ordered[max(0, int(len(ordered) * 0.99) - 1)]
+
+
+def test_max_pending_is_capped_below_threadpool():
+    service = PasswordService(max_workers=0, max_pending=64)
+    assert service.max_pending <= THREADPOOL_SIZE // 4
+
+
+@pytest.mark.benchmark
+def test_login_burst_does_not_starve_sync_endpoints(client, make_user, monkeypatch):
+    """로그인 폭주 중에도 다른 동기 엔드포인트의 p99 지연이 유지되는지 측정"""
+    user = make_user(username="burst", hashed_password=security.get_password_hash("password"))
+    headers = auth_headers(user)
+    
+    monkeypatch.setattr(password_service, "max_workers", 2)
+    try:
+        def login():
+            return client.post(
+                "/api/auth/login",
+                data={"username": "burst", "password": "password"}
+            ).status_code
+        
+        def read_me():
+            started = time.perf_counter()
+            response = client.get("/api/auth/me", headers=headers)
+            assert response.status_code == 200
+            return time.perf_counter() - started
+        
+        # 프로세스 풀 기동 시간은 측정에서 제외
+        assert login() == 200
+        
+        # 같은 동시 요청을 로그인 폭주 없이 보낸 기준 지연
+        with ThreadPoolExecutor(max_workers=THREADPOOL_SIZE * 2) as pool:
+            baseline = list(pool.map(lambda _: read_me(), range(50)))
+        
+        with ThreadPoolExecutor(max_workers=THREADPOOL_SIZE * 2) as pool:
+            logins = [pool.submit(login) for _ in range(THREADPOOL_SIZE * 2)]
+            time.sleep(0.2)
+            latencies = [pool.submit(read_me) for _ in range(50)]
+            statuses = [f.result() for f in logins]
+            latencies = [f.result() for f in latencies]
+    finally:
+        password_service.shutdown()
+    
+    p99 = _p99(latencies)
+    baseline_p99 = _p99(baseline)
+    print(
+        f"\nlogin burst: {statuses.count(200)} ok, {statuses.count(503)} rejected; "
+        f"/me p99 {p99 * 1000:.1f}ms (without burst {baseline_p99 * 1000:.1f}ms)"
+    )
+    assert set(statuses) <= {200, 503}
+    assert statuses.count(200) >= 1
+    assert p99 < baseline_p99 + 1.0
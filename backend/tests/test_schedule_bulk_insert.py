@@ -0,0 +1,96 @@
+import time
+from datetime import date, time as time_of_day, timedelta
+
+import pytest
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from app.models.raid import Raid, RaidGroup
+from app.models.raid_schedule import RaidAttendance, RaidSchedule, RecurrenceType
+from app.models.user import User
+from app.schemas.raid_schedule import AttendanceStatus
+from app.utils import schedule as schedule_utils
+
+OCCURRENCES = 52
+MEMBERS = 8
+
+
+def _seed(session):
+    user_ids = list(session.scalars(insert(User).returning(User.id), [
+        {
+            "username": f"bulk{n}",
+            "email": f"bulk{n}@example.com",
+            "hashed_password": "not-a-real-hash",
+            "character_name": f"Bulk {n}",
+            "server": "Tonberry"
+        }
+        for n in range(MEMBERS)
+    ]))
+    raid = Raid(name="벤치마크 레이드", tier="7.0 영웅")
+    session.add(raid)
+    session.flush()
+    group = RaidGroup(name="벤치마크 공대", raid_id=raid.id, leader_id=user_ids[0])
+    session.add(group)
+    session.commit()
+    return group.id, user_ids
+
+
+def _rows(group_id, creator_id):
+    start = date(2026, 1, 6)
+    return [
+        {
+            "raid_group_id": group_id,
+            "created_by_id": creator_id,
+            "title": "주간 레이드",
+            "scheduled_date": start + timedelta(weeks=n),
+            "start_time": time_of_day(21, 0),
+            "recurrence_type": RecurrenceType.NONE
+        }
+        for n in range(OCCURRENCES)
+    ]
+
+
+def _create_one_by_one(session, rows, member_ids):
+    """이전 생성 경로: 일정마다 flush로 ID를 받고 참석 레코드를 하나씩 추가"""
+    for row in rows:
+        schedule = RaidSchedule(**row)
+        session.add(schedule)
+        session.flush()
+        for user_id in member_ids:
+            session.add(RaidAttendance(schedule_id=schedule.id, user_id=user_id, status=AttendanceStatus.PENDING.value))
+        session.flush()
+
+
+@pytest.mark.benchmark
+def test_bulk_schedule_creation_benchmark(any_engine, count_queries):
+    with Session(any_engine) as session:
+        group_id, member_ids = _seed(session)
+        rows = _rows(group_id, member_ids[0])
+        
+        with count_queries(any_engine) as baseline_counter:
+            started = time.perf_counter()
+            _create_one_by_one(session, rows, member_ids)
+            session.commit()
+            baseline_elapsed = time.perf_counter() - started
+        
+        with count_queries(any_engine) as bulk_counter:
+            started = time.perf_counter()
+            schedule_ids = schedule_utils.create_schedules_with_attendances(session, rows, member_ids)
+            session.commit()
+            bulk_elapsed = time.perf_counter() - started
+        
+        attendance_count = session.query(func.count(RaidAttendance.id)).filter(
+            RaidAttendance.schedule_id.in_(schedule_ids)
+        ).scalar()
+    
+    print(
+        f"\n{any_engine.dialect.name} {OCCURRENCES}x{MEMBERS}: "
+        f"one-by-one {baseline_counter.count} statements {baseline_elapsed * 1000:.1f}ms, "
+        f"bulk {bulk_counter.count} statements {bulk_elapsed * 1000:.1f}ms"
+    )
+    assert len(schedule_ids) == OCCURRENCES
+    assert attendance_count == OCCURRENCES * MEMBERS
+    # 일정 INSERT ... RETURNING 한 번과 참석 레코드 executemany 한 번
+    assert bulk_counter.count == 2
+    assert bulk_counter.count < baseline_counter.count
+    assert bulk_elapsed < baseline_elapsed
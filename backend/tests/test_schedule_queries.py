@@ -0,0 +1,103 @@
+import time
+from datetime import date, time as time_of_day, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.models.raid_schedule import RaidAttendance
+from app.utils import schedule as schedule_utils
+from tests.conftest import auth_headers
+
+
+def _seed_schedules(db, group, creator, member_ids, count, start=None):
+    """일정과 참석 레코드를 대량 생성하고 일부는 확정/거절로 응답"""
+    start = start or date.today()
+    schedule_ids = schedule_utils.create_schedules_with_attendances(db, [
+        {
+            "raid_group_id": group.id,
+            "created_by_id": creator.id,
+            "title": f"레이드 {n}",
+            "scheduled_date": start + timedelta(days=n % 60),
+            "start_time": time_of_day(21, 0)
+        }
+        for n in range(count)
+    ], member_ids)
+    db.execute(update(RaidAttendance).where(
+        RaidAttendance.schedule_id.in_(schedule_ids[::2]), RaidAttendance.user_id == member_ids[0]
+    ).values(status="confirmed"))
+    db.execute(update(RaidAttendance).where(
+        RaidAttendance.schedule_id.in_(schedule_ids[1::3]), RaidAttendance.user_id == member_ids[-1]
+    ).values(status="declined"))
+    db.commit()
+    schedule_utils.recalculate_attendance_counts(db, group.id)
+    return sorted(schedule_ids)
+
+
+def _statement_count(client, count_queries, method, url, headers, **kwargs):
+    # 인증 캐시를 채운 뒤 측정
+    client.get("/api/auth/me", headers=headers)
+    with count_queries() as counter:
+        response = client.request(method, url, headers=headers, **kwargs)
+    assert response.status_code == 200, response.text
+    return counter.count, response.json()
+
+
+def test_schedule_endpoints_use_constant_queries(client, db, make_user, make_group, count_queries):
+    leader = make_user()
+    members = [make_user() for _ in range(7)]
+    headers = auth_headers(leader)
+    member_ids = [leader.id] + [member.id for member in members]
+    
+    counts = {}
+    for schedule_count in (5, 60):
+        group = make_group(leader, members)
+        schedule_ids = _seed_schedules(db, group, leader, member_ids, schedule_count)
+        base = f"/api/schedules/groups/{group.id}/schedules"
+        
+        list_count, schedules = _statement_count(client, count_queries, "GET", base, headers, params={"limit": 100})
+        assert len(schedules) == schedule_count
+        assert {s["id"]: s["confirmed_count"] for s in schedules}[schedule_ids[0]] == 1
+        
+        detail_count, schedule = _statement_count(client, count_queries, "GET", f"{base}/{schedule_ids[0]}", headers)
+        assert len(schedule["attendances"]) == len(member_ids)
+        
+        update_count, _ = _statement_count(
+            client, count_queries, "PUT", f"{base}/{schedule_ids[0]}", headers, json={"notes": "8시 집합"}
+        )
+        counts[schedule_count] = (list_count, detail_count, update_count)
+    
+    print(f"\nlist/detail/update statements: {counts}")
+    # 일정 수와 관계없이 같은 문장 수 (참석자별 지연 로딩 없음)
+    assert counts[5] == counts[60]
+    assert all(count <= limit for count, limit in zip(counts[60], (6, 5, 8)))
+
+
+@pytest.mark.benchmark
+def test_dashboard_constant_queries_for_5_groups_x_90_schedules(client, db, make_user, make_group, count_queries):
+    user = make_user()
+    others = [make_user() for _ in range(7)]
+    headers = auth_headers(user)
+    
+    groups = [make_group(user, others) for _ in range(5)]
+    member_ids = [user.id] + [other.id for other in others]
+    
+    def measure():
+        client.get("/api/auth/me", headers=headers)
+        with count_queries() as counter:
+            started = time.perf_counter()
+            response = client.get("/api/schedules/dashboard", params={"days_ahead": 90, "days_behind": 90}, headers=headers)
+            elapsed = time.perf_counter() - started
+        assert response.status_code == 200, response.text
+        return counter.count, elapsed, response.json()
+    
+    _seed_schedules(db, groups[0], user, member_ids, 2, start=date.today() - timedelta(days=30))
+    small_count, _, _ = measure()
+    
+    for group in groups:
+        _seed_schedules(db, group, user, member_ids, 90, start=date.today() - timedelta(days=30))
+    large_count, elapsed, dashboard = measure()
+    
+    total = sum(len(dashboard[key]) for key in ("upcoming_schedules", "past_schedules"))
+    print(f"\ndashboard: {total} schedules, {large_count} statements, {elapsed * 1000:.1f}ms")
+    assert total > 90
+    assert large_count == small_count
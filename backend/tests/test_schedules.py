@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+from tests.conftest import auth_headers
+
+
+def _create(client, headers, group_id, **fields):
+    body = {"title": "레이드", "start_time": "21:00:00", **fields}
+    response = client.post(f"/api/schedules/groups/{group_id}/schedules", json=body, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _key(schedule):
+    return (schedule["scheduled_date"], schedule["start_time"], schedule["id"], schedule["occurrence_date"])
+
+
+def test_schedule_pages_merge_virtual_occurrences_in_window(client, make_user, make_group, count_queries):
+    leader = make_user()
+    group = make_group(leader)
+    headers = auth_headers(leader)
+    url = f"/api/schedules/groups/{group.id}/schedules"
+    start = date(2026, 1, 5)
+    
+    # 주간 반복 일정 1개(발생분은 저장되지 않음)와 단일 일정 여러 개
+    _create(client, headers, group.id, scheduled_date=start.isoformat(),
+            recurrence_type="weekly", recurrence_count=8)
+    for offset in range(0, 40, 2):
+        _create(client, headers, group.id, scheduled_date=(start + timedelta(days=offset)).isoformat())
+    
+    everything = client.get(url, params={"limit": 100}, headers=headers).json()
+    virtual = [s for s in everything if s["id"] is None]
+    assert len(virtual) >= 7
+    assert len(everything) == 21 + len(virtual)
+    assert [s["scheduled_date"] for s in everything] == sorted(s["scheduled_date"] for s in everything)
+    
+    # skip/limit 페이지를 이어 붙이면 전체 목록과 같음
+    paged = []
+    for skip in range(0, len(everything), 6):
+        paged += client.get(url, params={"skip": skip, "limit": 6}, headers=headers).json()
+    assert [_key(s) for s in paged] == [_key(s) for s in everything]
+    
+    # 커서 페이지도 같음
+    paged, cursor = [], None
+    while True:
+        params = {"limit": 6, **({"cursor": cursor} if cursor else {})}
+        response = client.get(url, params=params, headers=headers)
+        paged += response.json()
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert [_key(s) for s in paged] == [_key(s) for s in everything]
+    
+    # 저장된 일정은 페이지 창만큼만 전체 행으로 로드
+    with count_queries() as counter:
+        client.get(url, params={"skip": 20, "limit": 5}, headers=headers)
+    full_loads = [
+        s for s in counter.selects()
+        if "raid_schedules.title" in s and "raid_schedules.id IN" in s
+    ]
+    assert len(full_loads) == 1
+    assert not any(
+        "raid_schedules.title" in s and "LIMIT" in s and "raid_schedules.parent_schedule_id IS NULL" not in s
+        for s in counter.selects()
+    )
@@ -158,8 +158,9 @@ export const ScheduleCalendarPage: React.FC = () => {
   };
 
   const getMyAttendanceStatus = (schedule: RaidSchedule): AttendanceStatus | undefined => {
-    if (dashboard?.my_attendance_status) {
-      return dashboard.my_attendance_status[schedule.id];
+    // 저장되지 않은 반복 일정 발생분은 아직 응답 전
+    if (dashboard?.my_attendance_status && !schedule.is_virtual) {
+      return dashboard.my_attendance_status[schedule.id!];
     }
     return undefined;
   };
@@ -313,11 +314,11 @@ export const ScheduleCalendarPage: React.FC = () => {
                     const myStatus = getMyAttendanceStatus(schedule);
                     return (
                       <div
-                        key={schedule.id}
+                        key={scheduleService.getScheduleKey(schedule)}
                         className="text-xs p-1 bg-primary-800/30 rounded truncate flex items-center gap-1"
                         onClick={(e) => {
                           e.stopPropagation();
-                          navigate(`/schedule/${schedule.id}`);
+                          navigate(scheduleService.getScheduleDetailPath(schedule));
                         }}
                       >
                         {getAttendanceIcon(myStatus)}
@@ -388,9 +389,9 @@ export const ScheduleCalendarPage: React.FC = () => {
                   const myStatus = getMyAttendanceStatus(schedule);
                   return (
                     <div
-                      key={schedule.id}
+                      key={scheduleService.getScheduleKey(schedule)}
                       className="p-4 bg-gray-800/50 rounded-lg cursor-pointer hover:bg-gray-800/70 transition-colors"
-                      onClick={() => navigate(`/schedule/${schedule.id}`)}
+                      onClick={() => navigate(scheduleService.getScheduleDetailPath(schedule))}
                     >
                       <div className="flex items-start justify-between">
                         <div>
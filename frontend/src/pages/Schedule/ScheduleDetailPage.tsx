@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { useParams, useNavigate, Link } from 'react-router-dom';
+import { useParams, useNavigate, useSearchParams, Link } from 'react-router-dom';
 import { 
   Calendar, Clock, Users, Target, ArrowLeft, Edit, Trash2,
   CheckCircle, XCircle, AlertCircle, HelpCircle, Repeat,
@@ -13,6 +13,9 @@ import {
 
 export const ScheduleDetailPage: React.FC = () => {
   const { scheduleId } = useParams<{ scheduleId: string }>();
+  const [searchParams] = useSearchParams();
+  // 저장되지 않은 반복 일정 발생분은 원본 일정 ID + 발생일로 조회
+  const occurrenceDate = searchParams.get('occurrence_date') || undefined;
   const navigate = useNavigate();
   const [currentUser, setCurrentUser] = useState<UserType | null>(null);
   const [schedule, setSchedule] = useState<RaidSchedule | null>(null);
@@ -32,7 +35,7 @@ export const ScheduleDetailPage: React.FC = () => {
     if (scheduleId) {
       loadScheduleData();
     }
-  }, [scheduleId]);
+  }, [scheduleId, occurrenceDate]);
 
   const loadScheduleData = async () => {
     if (!scheduleId) return;
@@ -53,7 +56,7 @@ export const ScheduleDetailPage: React.FC = () => {
       const groupId = myGroups[0].id; // TODO: 실제 구현 시 수정 필요
 
       // 일정 정보
-      const scheduleData = await scheduleService.getRaidSchedule(groupId, parseInt(scheduleId));
+      const scheduleData = await scheduleService.getRaidSchedule(groupId, parseInt(scheduleId), occurrenceDate);
       setSchedule(scheduleData);
 
       // 공대 정보
@@ -68,7 +71,7 @@ export const ScheduleDetailPage: React.FC = () => {
       setCanManage(canManageSchedule);
 
       // 참석 현황
-      const attendanceList = await scheduleService.getScheduleAttendance(groupId, parseInt(scheduleId));
+      const attendanceList = await scheduleService.getScheduleAttendance(groupId, parseInt(scheduleId), occurrenceDate);
       setAttendances(attendanceList);
     } catch (error) {
       console.error('Failed to load schedule data:', error);
@@ -85,7 +88,8 @@ export const ScheduleDetailPage: React.FC = () => {
       await scheduleService.updateMyAttendance(
         schedule.raid_group_id,
         parseInt(scheduleId),
-        { status, reason: editReason }
+        { status, reason: editReason },
+        occurrenceDate
       );
       await loadScheduleData();
       setEditingAttendance(null);
@@ -103,7 +107,8 @@ export const ScheduleDetailPage: React.FC = () => {
         schedule.raid_group_id,
         parseInt(scheduleId),
         userId,
-        { status }
+        { status },
+        occurrenceDate
       );
       await loadScheduleData();
     } catch (error) {
@@ -118,7 +123,8 @@ export const ScheduleDetailPage: React.FC = () => {
       await scheduleService.deleteRaidSchedule(
         schedule.raid_group_id,
         parseInt(scheduleId),
-        schedule.recurrence_type !== RecurrenceType.NONE ? deleteOption : undefined
+        schedule.recurrence_type !== RecurrenceType.NONE ? deleteOption : undefined,
+        occurrenceDate
       );
       navigate(`/schedule?groupId=${schedule.raid_group_id}`);
     } catch (error) {
@@ -102,11 +102,16 @@ export const ScheduleListPage: React.FC = () => {
     }
   };
 
-  const handleAttendanceUpdate = async (scheduleId: number, status: AttendanceStatus) => {
+  const handleAttendanceUpdate = async (schedule: RaidSchedule, status: AttendanceStatus) => {
     if (!selectedGroupId) return;
     
     try {
-      await scheduleService.updateMyAttendance(selectedGroupId, scheduleId, { status });
+      await scheduleService.updateMyAttendance(
+        selectedGroupId,
+        scheduleService.getScheduleRouteId(schedule),
+        { status },
+        schedule.is_virtual ? schedule.scheduled_date : undefined
+      );
       // 일정 새로고침
       if (selectedGroupId) {
         loadSchedules();
@@ -132,8 +137,9 @@ export const ScheduleListPage: React.FC = () => {
   };
 
   const getMyAttendanceStatus = (schedule: RaidSchedule): AttendanceStatus | undefined => {
-    if (dashboard?.my_attendance_status) {
-      return dashboard.my_attendance_status[schedule.id];
+    // 저장되지 않은 반복 일정 발생분은 아직 응답 전
+    if (dashboard?.my_attendance_status && !schedule.is_virtual) {
+      return dashboard.my_attendance_status[schedule.id!];
     }
     return undefined;
   };
@@ -272,9 +278,9 @@ export const ScheduleListPage: React.FC = () => {
             
             return (
               <div
-                key={schedule.id}
+                key={scheduleService.getScheduleKey(schedule)}
                 className="card-game hover:border-primary-500/70 transition-all cursor-pointer"
-                onClick={() => navigate(`/schedule/${schedule.id}`)}
+                onClick={() => navigate(scheduleService.getScheduleDetailPath(schedule))}
               >
                 <div className="flex items-start justify-between">
                   <div className="flex-1">
@@ -336,7 +342,7 @@ export const ScheduleListPage: React.FC = () => {
                         <button
                           onClick={(e) => {
                             e.stopPropagation();
-                            handleAttendanceUpdate(schedule.id, AttendanceStatus.CONFIRMED);
+                            handleAttendanceUpdate(schedule, AttendanceStatus.CONFIRMED);
                           }}
                           className={`px-3 py-1 text-xs rounded ${
                             myStatus === AttendanceStatus.CONFIRMED
@@ -349,7 +355,7 @@ export const ScheduleListPage: React.FC = () => {
                         <button
                           onClick={(e) => {
                             e.stopPropagation();
-                            handleAttendanceUpdate(schedule.id, AttendanceStatus.DECLINED);
+                            handleAttendanceUpdate(schedule, AttendanceStatus.DECLINED);
                           }}
                           className={`px-3 py-1 text-xs rounded ${
                             myStatus === AttendanceStatus.DECLINED
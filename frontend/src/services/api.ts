@@ -1,5 +1,5 @@
 import axios, { AxiosInstance, AxiosError, InternalAxiosRequestConfig } from 'axios';
-import { Token, ApiError } from '../types';
+import { Token, ApiError, CursorPage } from '../types';
 
 // API 기본 URL 설정
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000/api';
@@ -130,6 +130,13 @@ export const apiClient = {
   get: <T>(url: string, params?: any) => 
     api.get<T>(url, { params }).then(res => res.data),
   
+  // GET 요청 (커서 페이지네이션 - 다음 페이지 커서를 함께 반환)
+  getPage: <T>(url: string, params?: any): Promise<CursorPage<T>> =>
+    api.get<T[]>(url, { params }).then(res => ({
+      items: res.data,
+      nextCursor: res.headers['x-next-cursor'] ?? null,
+    })),
+  
   // POST 요청 - config 옵션 추가
   post: <T>(url: string, data?: any, config?: any) => 
     api.post<T>(url, data, config).then(res => res.data),
@@ -142,6 +149,10 @@ export const apiClient = {
   delete: <T>(url: string, params?: any) => 
     api.delete<T>(url, { params }).then(res => res.data),
   
+  // 파일 다운로드 (스트리밍 내보내기 등, 크기가 클 수 있으므로 타임아웃 없음)
+  download: (url: string, params?: any) =>
+    api.get<Blob>(url, { params, responseType: 'blob', timeout: 0 }).then(res => res.data),
+  
   // 파일 업로드
   upload: <T>(url: string, formData: FormData) => 
     fileApi.post<T>(url, formData).then(res => res.data),
@@ -2,8 +2,10 @@ import { apiClient } from './api';
 import {
   ItemDistribution, DistributionHistory, ResourceRequirement,
   ItemDistributionCreate, ItemDistributionUpdate,
-  DistributionHistoryCreate, ResourceRequirementUpdate,
-  ItemType, ResourceCalculationResult
+  DistributionHistoryCreate, DistributionHistoryBatchCreate, ResourceRequirementUpdate,
+  ItemType, ResourceCalculationResult, GroupResourceCalculationResult,
+  BisForecastResult, WeekAssignmentRequest, WeekAssignmentSuggestion, CursorPage,
+  DistributionSummary, DistributionState
 } from '../types';
 
 class DistributionService {
@@ -53,6 +55,44 @@ class DistributionService {
     return apiClient.get<DistributionHistory[]>(`/distribution/groups/${groupId}/history`, params);
   }
 
+  // 분배 이력 페이지 조회 (최신순, nextCursor로 다음 페이지 조회)
+  async getDistributionHistoryPage(groupId: number, params?: {
+    week_number?: number;
+    user_id?: number;
+    item_type?: ItemType;
+    cursor?: string;
+    limit?: number;
+  }): Promise<CursorPage<DistributionHistory>> {
+    return apiClient.getPage<DistributionHistory>(`/distribution/groups/${groupId}/history`, params);
+  }
+
+  // 분배 이력 전체 내보내기 (NDJSON 또는 CSV 파일)
+  async exportDistributionHistory(groupId: number, params?: {
+    format?: 'ndjson' | 'csv';
+    week_number?: number;
+    user_id?: number;
+    item_type?: ItemType;
+  }): Promise<Blob> {
+    return apiClient.download(`/distribution/groups/${groupId}/history/export`, params);
+  }
+
+  // 주차/멤버/아이템 타입별 획득 수 조회 (공정성 통계)
+  async getDistributionSummary(groupId: number, params?: {
+    from_week?: number;
+    to_week?: number;
+    user_id?: number;
+  }): Promise<DistributionSummary> {
+    return apiClient.get<DistributionSummary>(`/distribution/groups/${groupId}/summary`, params);
+  }
+
+  // 주차 시점 분배 상태 조회 (주차를 생략하면 현재 상태)
+  async getDistributionState(groupId: number, weekNumber?: number): Promise<DistributionState> {
+    return apiClient.get<DistributionState>(
+      `/distribution/groups/${groupId}/state`,
+      weekNumber !== undefined ? { week_number: weekNumber } : undefined
+    );
+  }
+
   // 분배 기록
   async recordDistribution(
     groupId: number,
@@ -61,6 +101,14 @@ class DistributionService {
     return apiClient.post<DistributionHistory>(`/distribution/groups/${groupId}/history`, historyData);
   }
 
+  // 한 주 분배 일괄 기록 (공대장/분배 권한자)
+  async recordDistributionBatch(
+    groupId: number,
+    batchData: DistributionHistoryBatchCreate
+  ): Promise<DistributionHistory[]> {
+    return apiClient.post<DistributionHistory[]>(`/distribution/groups/${groupId}/history/batch`, batchData);
+  }
+
   // 분배 이력 삭제 (공대장)
   async deleteDistributionHistory(groupId: number, historyId: number): Promise<{ message: string }> {
     return apiClient.delete(`/distribution/groups/${groupId}/history/${historyId}`);
@@ -83,6 +131,11 @@ class DistributionService {
     return apiClient.post<ResourceCalculationResult>(`/distribution/groups/${groupId}/resources/calculate`);
   }
 
+  // 공대원 전체 재화 요구량 계산 (공대장/분배 권한자)
+  async calculateAllResourceRequirements(groupId: number): Promise<GroupResourceCalculationResult> {
+    return apiClient.post<GroupResourceCalculationResult>(`/distribution/groups/${groupId}/resources/calculate-all`);
+  }
+
   // 획득한 재화 업데이트
   async updateObtainedResources(
     groupId: number,
@@ -95,10 +148,30 @@ class DistributionService {
   async calculatePriority(groupId: number): Promise<{
     message: string;
     priorities: Record<string, number[]>;
+    missing_rules: string[];  // 분배 규칙이 없어 반영되지 않은 아이템
   }> {
     return apiClient.post(`/distribution/groups/${groupId}/calculate-priority`);
   }
 
+  // 한 주 드랍 전체 추천 분배 (공대장/분배 권한자)
+  async suggestWeekDistribution(
+    groupId: number,
+    requestData: WeekAssignmentRequest
+  ): Promise<WeekAssignmentSuggestion> {
+    return apiClient.post<WeekAssignmentSuggestion>(`/distribution/groups/${groupId}/suggest-week`, requestData);
+  }
+
+  // ===== BIS 도달 예측 =====
+  
+  // 멤버별/공대 전체 BIS 도달 주차 예측 (seed를 지정하면 같은 결과)
+  async getBisForecast(groupId: number, params?: {
+    simulations?: number;
+    max_weeks?: number;
+    seed?: number;
+  }): Promise<BisForecastResult> {
+    return apiClient.get<BisForecastResult>(`/distribution/groups/${groupId}/forecast`, params);
+  }
+
   // ===== 유틸리티 함수 =====
   
   // 아이템 타입 한글 이름 변환
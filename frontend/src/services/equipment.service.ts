@@ -3,7 +3,7 @@ import {
   Equipment, EquipmentSet, EquipmentSetItem,
   EquipmentCreate, EquipmentUpdate,
   EquipmentSetCreate, EquipmentSetUpdate,
-  EquipmentSetItemCreate, EquipmentSetItemUpdate,
+  EquipmentSetItemCreate, EquipmentSetItemsReplace, EquipmentSetItemUpdate,
   EquipmentSlot, EquipmentType
 } from '../types';
 
@@ -76,6 +76,11 @@ class EquipmentService {
     return apiClient.post<EquipmentSetItem>(`/equipment/sets/${setId}/items`, itemData);
   }
 
+  // 세트 아이템 전체 교체 (BIS 세트 구성 등, 요청에 없는 부위는 제거)
+  async replaceSetItems(setId: number, itemsData: EquipmentSetItemsReplace): Promise<EquipmentSet> {
+    return apiClient.put<EquipmentSet>(`/equipment/sets/${setId}/items`, itemsData);
+  }
+
   // 세트 아이템 수정 (획득 여부 등)
   async updateSetItem(
     setId: number, 
@@ -4,9 +4,13 @@ import {
   RaidScheduleCreate, RaidScheduleUpdate,
   RaidAttendanceUpdate, AttendanceStatus,
   RecurrenceType, RecurringScheduleDeleteOption,
-  AttendanceStatistics
+  AttendanceStatistics, CursorPage
 } from '../types';
 
+// 반복 일정 발생분 지정 쿼리
+const occurrenceQuery = (occurrenceDate?: string) =>
+  occurrenceDate ? `?occurrence_date=${occurrenceDate}` : '';
+
 class ScheduleService {
   // ===== 레이드 일정 관리 =====
   
@@ -23,9 +27,24 @@ class ScheduleService {
     return apiClient.get<RaidSchedule[]>(`/schedules/groups/${groupId}/schedules`, params);
   }
 
+  // 일정 페이지 조회 (날짜순, nextCursor로 다음 페이지 조회)
+  async getRaidSchedulesPage(groupId: number, params?: {
+    from_date?: string;
+    to_date?: string;
+    is_confirmed?: boolean;
+    is_completed?: boolean;
+    is_cancelled?: boolean;
+    cursor?: string;
+    limit?: number;
+  }): Promise<CursorPage<RaidSchedule>> {
+    return apiClient.getPage<RaidSchedule>(`/schedules/groups/${groupId}/schedules`, params);
+  }
+
   // 특정 일정 조회
-  async getRaidSchedule(groupId: number, scheduleId: number): Promise<RaidSchedule> {
-    return apiClient.get<RaidSchedule>(`/schedules/groups/${groupId}/schedules/${scheduleId}`);
+  async getRaidSchedule(groupId: number, scheduleId: number, occurrenceDate?: string): Promise<RaidSchedule> {
+    return apiClient.get<RaidSchedule>(
+      `/schedules/groups/${groupId}/schedules/${scheduleId}${occurrenceQuery(occurrenceDate)}`
+    );
   }
 
   // 일정 생성 (반복 설정 포함)
@@ -40,10 +59,11 @@ class ScheduleService {
   async updateRaidSchedule(
     groupId: number,
     scheduleId: number,
-    scheduleData: RaidScheduleUpdate
+    scheduleData: RaidScheduleUpdate,
+    occurrenceDate?: string
   ): Promise<RaidSchedule> {
     return apiClient.put<RaidSchedule>(
-      `/schedules/groups/${groupId}/schedules/${scheduleId}`,
+      `/schedules/groups/${groupId}/schedules/${scheduleId}${occurrenceQuery(occurrenceDate)}`,
       scheduleData
     );
   }
@@ -52,9 +72,13 @@ class ScheduleService {
   async deleteRaidSchedule(
     groupId: number,
     scheduleId: number,
-    deleteOption?: RecurringScheduleDeleteOption
+    deleteOption?: RecurringScheduleDeleteOption,
+    occurrenceDate?: string
   ): Promise<{ message: string }> {
-    const params = deleteOption ? { delete_option: deleteOption } : undefined;
+    const params = {
+      ...(deleteOption ? { delete_option: deleteOption } : {}),
+      ...(occurrenceDate ? { occurrence_date: occurrenceDate } : {})
+    };
     return apiClient.delete(`/schedules/groups/${groupId}/schedules/${scheduleId}`, params);
   }
 
@@ -63,10 +87,11 @@ class ScheduleService {
   // 일정 참석 현황 조회
   async getScheduleAttendance(
     groupId: number,
-    scheduleId: number
+    scheduleId: number,
+    occurrenceDate?: string
   ): Promise<RaidAttendance[]> {
     return apiClient.get<RaidAttendance[]>(
-      `/schedules/groups/${groupId}/schedules/${scheduleId}/attendance`
+      `/schedules/groups/${groupId}/schedules/${scheduleId}/attendance${occurrenceQuery(occurrenceDate)}`
     );
   }
 
@@ -74,10 +99,11 @@ class ScheduleService {
   async updateMyAttendance(
     groupId: number,
     scheduleId: number,
-    attendanceData: RaidAttendanceUpdate
+    attendanceData: RaidAttendanceUpdate,
+    occurrenceDate?: string
   ): Promise<RaidAttendance> {
     return apiClient.put<RaidAttendance>(
-      `/schedules/groups/${groupId}/schedules/${scheduleId}/attendance/me`,
+      `/schedules/groups/${groupId}/schedules/${scheduleId}/attendance/me${occurrenceQuery(occurrenceDate)}`,
       attendanceData
     );
   }
@@ -87,10 +113,11 @@ class ScheduleService {
     groupId: number,
     scheduleId: number,
     userId: number,
-    attendanceData: RaidAttendanceUpdate
+    attendanceData: RaidAttendanceUpdate,
+    occurrenceDate?: string
   ): Promise<RaidAttendance> {
     return apiClient.put<RaidAttendance>(
-      `/schedules/groups/${groupId}/schedules/${scheduleId}/attendance/${userId}`,
+      `/schedules/groups/${groupId}/schedules/${scheduleId}/attendance/${userId}${occurrenceQuery(occurrenceDate)}`,
       attendanceData
     );
   }
@@ -116,6 +143,26 @@ class ScheduleService {
 
   // ===== 유틸리티 함수 =====
   
+  // API 경로에 쓰는 일정 ID (저장되지 않은 반복 일정 발생분은 원본 일정 ID)
+  getScheduleRouteId(schedule: RaidSchedule): number {
+    return schedule.is_virtual ? schedule.parent_schedule_id! : schedule.id!;
+  }
+
+  // 일정 상세 경로 (저장되지 않은 반복 일정 발생분은 발생일 포함)
+  getScheduleDetailPath(schedule: RaidSchedule): string {
+    const scheduleId = this.getScheduleRouteId(schedule);
+    return schedule.is_virtual
+      ? `/schedule/${scheduleId}?occurrence_date=${schedule.scheduled_date}`
+      : `/schedule/${scheduleId}`;
+  }
+
+  // 목록 key (가상 발생분은 ID가 없으므로 원본 일정 ID와 날짜로 구분)
+  getScheduleKey(schedule: RaidSchedule): string {
+    return schedule.is_virtual
+      ? `${schedule.parent_schedule_id}-${schedule.scheduled_date}`
+      : `${schedule.id}`;
+  }
+
   // 참석 상태 한글 이름 변환
   getAttendanceStatusName(status: AttendanceStatus): string {
     const statusNames: Record<AttendanceStatus, string> = {
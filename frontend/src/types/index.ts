@@ -250,6 +250,11 @@ export interface EquipmentSetItemCreate {
   slot: EquipmentSlot;
 }
 
+// 세트 아이템 전체 교체 (없는 부위는 제거)
+export interface EquipmentSetItemsReplace {
+  items: EquipmentSetItemCreate[];
+}
+
 export interface EquipmentSetItemUpdate {
   equipment_id?: number;
   is_obtained?: boolean;
@@ -277,6 +282,7 @@ export interface ItemDistribution {
   completed_users: number[];
   notes?: string;
   is_active: boolean;
+  version: number;
   created_at: string;
   updated_at: string;
 }
@@ -304,6 +310,7 @@ export interface ResourceRequirement {
   remaining_resources: Record<string, number>;
   completion_percentage: number;
   last_calculated_at: string;
+  version: number;
 }
 
 // 재화 계산 결과 타입
@@ -326,6 +333,94 @@ export interface ResourceCalculationResult {
   priority_rankings?: Record<string, number>;
 }
 
+// 공대 전체 재화 계산 결과 타입
+export interface GroupResourceCalculationResult {
+  raid_group_id: number;
+  results: ResourceCalculationResult[];
+  skipped_user_ids: number[];  // 출발 세트 또는 BIS 세트가 없는 멤버
+  elapsed_ms: number;
+}
+
+// BIS 도달 주차 분포 요약 타입
+export interface BisForecastSummary {
+  mean_weeks: number | null;
+  median_weeks: number | null;  // 최대 주차 안에 도달하지 못하면 null
+  p90_weeks: number | null;
+  completion_rate: number;  // 최대 주차 안에 BIS에 도달한 비율
+  weeks_distribution: number[];  // 주차별 도달 확률 (인덱스 = 주차)
+}
+
+// 공대 BIS 도달 예측 결과 타입
+export interface BisForecastResult {
+  raid_group_id: number;
+  distribution_method: DistributionMethod;
+  simulations: number;
+  max_weeks: number;
+  seed: number | null;
+  members: Array<BisForecastSummary & { user_id: number }>;
+  group: BisForecastSummary;  // 가장 늦은 멤버 기준
+  ignored_items: string[];  // 드랍 테이블로 얻을 수 없어 제외한 재화
+  elapsed_ms: number;
+}
+
+// 주간 드랍 아이템 타입
+export interface WeekDrop {
+  item_name: string;
+  item_type: ItemType;
+  floor_number: number;
+}
+
+// 주간 분배 추천 요청 타입
+export interface WeekAssignmentRequest {
+  week_number: number;
+  drops: WeekDrop[];
+}
+
+// 주간 분배 추천 결과 타입
+export interface WeekAssignmentSuggestion {
+  raid_group_id: number;
+  week_number: number;
+  assignments: Array<WeekDrop & {
+    user_id: number | null;  // 필요한 멤버가 없으면 null
+    distribution_id: number | null;  // 같은 이름의 활성 분배 규칙
+  }>;
+  estimated_weeks_before: Record<number, number>;  // 멤버별 예상 BIS 도달 주차
+  estimated_weeks_after: Record<number, number>;
+  locked_out_user_ids: Record<number, number[]>;  // 층별로 이번 주에 이미 아이템을 받은 멤버
+  elapsed_ms: number;
+}
+
+// 주차/멤버/아이템 타입별 획득 수 집계 타입
+export interface DistributionSummary {
+  raid_group_id: number;
+  weeks: Array<{
+    week_number: number;
+    user_id: number;
+    item_type: ItemType;
+    count: number;
+  }>;
+  member_totals: Record<number, Partial<Record<ItemType, number>>>;  // 멤버별 아이템 타입별 합계
+}
+
+// 이벤트 로그로 재구성한 분배 상태 타입
+export interface DistributionState {
+  raid_group_id: number;
+  week_number: number | null;  // 조회한 주차 (없으면 현재 상태)
+  latest_week_number: number;  // 반영된 분배 이력의 최대 주차
+  last_event_id: number;
+  snapshot_event_id: number;  // 재구성을 시작한 스냅샷의 마지막 이벤트 ID
+  replayed_events: number;
+  obtained: Record<number, Record<string, number>>;  // 멤버별 획득 재화
+  loot_counts: Record<number, number>;  // 멤버별 획득 아이템 수
+  rules: Array<{
+    distribution_id: number;
+    item_name: string;
+    priority_order: number[];
+    completed_users: number[];
+  }>;
+  elapsed_ms: number;
+}
+
 // ===== 아이템 분배 관련 Create/Update 타입들 =====
 export interface ItemDistributionCreate {
   item_name: string;
@@ -341,6 +436,7 @@ export interface ItemDistributionUpdate {
   completed_users?: number[];
   notes?: string;
   is_active?: boolean;
+  version?: number;  // 마지막으로 조회한 버전 (다르면 409)
 }
 
 export interface DistributionHistoryCreate {
@@ -353,8 +449,15 @@ export interface DistributionHistoryCreate {
   notes?: string;
 }
 
+// 주간 일괄 분배 기록 (전체가 한 번에 저장되거나 하나도 저장되지 않음)
+export interface DistributionHistoryBatchCreate {
+  week_number: number;
+  distributions: Array<Omit<DistributionHistoryCreate, 'week_number'>>;
+}
+
 export interface ResourceRequirementUpdate {
   obtained_resources?: Record<string, number>;
+  version?: number;  // 마지막으로 조회한 버전 (다르면 409)
 }
 
 // 레이드 일정 관련 타입
@@ -374,7 +477,7 @@ export enum RecurrenceType {
 }
 
 export interface RaidSchedule {
-  id: number;
+  id: number | null;  // 가상 발생분은 null (parent_schedule_id + occurrence_date로 식별)
   raid_group_id: number;
   created_by_id: number;
   title: string;
@@ -391,6 +494,7 @@ export interface RaidSchedule {
   recurrence_count?: number;
   recurrence_days?: string;
   parent_schedule_id?: number;
+  occurrence_date?: string;  // 반복 일정 발생일
   is_confirmed: boolean;
   is_completed: boolean;
   is_cancelled: boolean;
@@ -404,6 +508,7 @@ export interface RaidSchedule {
   confirmed_count?: number;
   declined_count?: number;
   is_recurring?: boolean;
+  is_virtual?: boolean;  // 저장되지 않은 반복 일정 발생분 (id 없음)
 }
 
 // 일정 생성/수정을 위한 타입 추가
@@ -510,6 +615,13 @@ export interface PaginatedResponse<T> {
 export interface PaginationParams {
   skip?: number;
   limit?: number;
+  cursor?: string;  // 이전 페이지의 nextCursor (skip 대신 사용)
+}
+
+// 커서 페이지네이션 응답 (다음 페이지가 없으면 nextCursor는 null)
+export interface CursorPage<T> {
+  items: T[];
+  nextCursor: string | null;
 }
 
 // 일정 대시보드용 타입